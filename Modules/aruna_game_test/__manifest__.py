@@ -13,7 +13,7 @@
     'website': "http://www.hrsynd.site",
     'category': 'Uncategorized',
     'application': True,
-    'version': '0.1',
+    'version': '0.2',
 
     # any module necessary for this one to work correctly
     'depends': ['base'],
@@ -21,9 +21,18 @@
     # always loaded
     'data': [
         'security/ir.model.access.csv',
+        'data/board_data.xml',
+        'data/job_data.xml',
         'wizard/input_command_wizard_view.xml',
+        'wizard/line_state_wizard_view.xml',
         'views/views.xml'
     ],
+    'assets': {
+        'web.assets_backend': [
+            'aruna_game_test/static/src/js/board_widget.js',
+            'aruna_game_test/static/src/scss/board_widget.scss',
+        ],
+    },
     # only loaded in demonstration mode
     'demo': [
     ],
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import json
+from odoo import http, tools, api
+from odoo.http import request, Response
+from ..utils.simulation import GameState
+from ..utils.script_source import read_json_scripts
+from ..utils.parallel import iter_simulation_results
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+# Request body types accepted by the endpoint, a HTML form could not send them
+# to another site without a CORS preflight, so the CSRF token is not needed
+JSON_MIMETYPES = ('application/json', NDJSON_MIMETYPE)
+
+
+class ArunaGameTestController(http.Controller):
+
+    @http.route('/aruna_game_test/simulate', type='http', auth='user',
+                methods=['POST'], csrf=False)
+    def simulate(self, **kwargs):
+        """Simulate one or many scripts from a JSON or NDJSON body, results are
+        streamed back as NDJSON, one line per script in the same order, each
+        line is sent as soon as the script is simulated (and persisted).
+        The body should be sent as application/json or application/x-ndjson.
+
+        Options, in the query string or the JSON object:
+        persist: create a game record per succeeded script (default true).
+        board_id: table of the simulation, default to the 5x5 table.
+        """
+        httprequest = request.httprequest
+        if httprequest.mimetype not in JSON_MIMETYPES:
+            return self._error_response(
+                'Content-Type should be one of {}.'.format(
+                    ', '.join(JSON_MIMETYPES)), 415)
+        try:
+            scripts, options = read_json_scripts(
+                httprequest.get_data(),
+                httprequest.mimetype == NDJSON_MIMETYPE)
+        except (ValueError, KeyError, UnicodeDecodeError) as err:
+            return self._error_response(str(err))
+        options.update(kwargs)
+
+        try:
+            board_id = int(options.get('board_id') or 0)
+        except (TypeError, ValueError):
+            return self._error_response('board_id should be an integer.')
+        board_model = request.env['aruna_game_test.board']
+        if board_id and not board_model.browse(board_id).exists():
+            return self._error_response(
+                'Table {} does not exist.'.format(board_id))
+        board_id = board_id or \
+            request.env['aruna_game_test.aruna_game_test']._default_board().id
+        board = board_model._get_board(board_id)
+
+        persist = options.get('persist', True)
+        if isinstance(persist, str):
+            try:
+                persist = tools.str2bool(persist)
+            except ValueError:
+                return self._error_response('persist should be a boolean.')
+
+        module_version = request.env['aruna_game_test.result_cache']\
+            ._get_module_version()
+        if persist:
+            # The request is gone when the response is sent, give the
+            # generator what it needs to open its own environment
+            results = self._iter_simulate_and_persist(
+                scripts, board, board_id, module_version, request.env.registry,
+                request.env.uid, dict(request.env.context))
+        else:
+            results = (
+                self._build_result(index, name, state_vals, error_data)
+                for index, ((name, script), (state_vals, error_data, report_vals))
+                in enumerate(zip(scripts, iter_simulation_results(
+                    (script for name, script in scripts), board,
+                    module_version))))
+        return Response((json.dumps(result) + '\n' for result in results),
+                        mimetype=NDJSON_MIMETYPE, direct_passthrough=True)
+
+    def _error_response(self, message: str, status: int = 400) -> Response:
+        return Response(json.dumps({'error': message}), status=status,
+                        mimetype='application/json')
+
+    def _iter_simulate_and_persist(self, scripts: list, board, board_id: int,
+                                   module_version: str, registry, uid: int,
+                                   context: dict):
+        """Simulate scripts one by one, the game record of each succeeded
+        script is created and committed before its result is yielded.
+        The response is sent after the request cursor is closed, so records
+        are written with a new cursor, and the request is not used at all.
+        """
+        with api.Environment.manage(), registry.cursor() as cr:
+            env = api.Environment(cr, uid, context)
+            cache_model = env['aruna_game_test.result_cache']
+            game_model = env['aruna_game_test.aruna_game_test']
+            for index, ((name, script), (state_vals, error_data, report_vals)) in \
+                    enumerate(zip(scripts, iter_simulation_results(
+                        (script for name, script in scripts), board,
+                        module_version))):
+                result = self._build_result(index, name, state_vals, error_data)
+                if state_vals:
+                    cache_model.store(
+                        [(script, dict(state_vals, **report_vals))], board)
+                    result['game_id'] = game_model.create(dict(
+                        state_vals, input_cmd=script, board_id=board_id,
+                        **report_vals)).id
+                    cr.commit()
+                yield result
+
+    def _build_result(self, index: int, name: str, state_vals: dict,
+                      error_data: dict) -> dict:
+        if error_data:
+            return {'index': index, 'name': name, 'ok': False,
+                    'error': error_data}
+        return {'index': index, 'name': name, 'ok': True, 'state': state_vals,
+                'report': GameState(**state_vals).report()}
@@ -1,3 +1,10 @@
 # -*- coding: utf-8 -*-
 
+from . import board
+from . import obstacle
 from . import models
+from . import session
+from . import result_cache
+from . import checkpoint
+from . import journal
+from . import job
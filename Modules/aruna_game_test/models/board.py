@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import base64
+from odoo import models, fields, api, tools
+from odoo.exceptions import ValidationError
+from ..utils.constants import DEFAULT_BOARD_SIZE
+from ..utils.board import Board, DEFAULT_BOARD
+from ..utils.obstacle import ObstacleIndex, parse_obstacle_ranges,\
+    normalize_range
+
+
+class aruna_game_test_board(models.Model):
+    _name = 'aruna_game_test.board'
+    _description = 'Aruna Game Table'
+
+    name = fields.Char(string='Name', required=True)
+    width = fields.Integer(string='Width', required=True,
+                           default=DEFAULT_BOARD_SIZE)
+    height = fields.Integer(string='Height', required=True,
+                            default=DEFAULT_BOARD_SIZE)
+    obstacle_ids = fields.One2many(
+        'aruna_game_test.obstacle', 'board_id', string='Obstacles')
+    obstacle_file = fields.Binary(
+        string='Obstacle File',
+        help='CSV file with a blocked cell "X,Y" or a blocked area '
+             '"X_FROM,Y_FROM,X_TO,Y_TO" per row.')
+    obstacle_filename = fields.Char(string='Obstacle Filename')
+
+    _sql_constraints = [
+        ('board_size_positive', 'CHECK(width > 0 AND height > 0)',
+         'Table width and height should be positive.')
+    ]
+
+    @api.model
+    @tools.ormcache('board_id')
+    def _get_board(self, board_id: int) -> Board:
+        """Get in memory table configuration, cached per board so the
+        simulation only compare against preloaded limits.
+
+        Args:
+            board_id (int): board record id, the 5x5 table is used when empty.
+        """
+        board_data = self.sudo().browse(board_id).exists() if board_id \
+            else self.browse()
+        if not board_data:
+            return DEFAULT_BOARD
+        # Read obstacle area only, the index is built once for every command
+        obstacle_data = self.env['aruna_game_test.obstacle'].sudo().search_read(
+            [('board_id', '=', board_data.id)],
+            ['x_from', 'y_from', 'x_to', 'y_to'])
+        obstacles = ObstacleIndex(
+            (data['x_from'], data['y_from'], data['x_to'], data['y_to'])
+            for data in obstacle_data)
+        return Board(board_data.width, board_data.height, obstacles)
+
+    ########################################################################
+    # Obstacle Loading
+    ########################################################################
+
+    def add_obstacle_ranges(self, ranges: list):
+        """Block many cells at once, with a single create.
+
+        Args:
+            ranges (list): (x_from, y_from, x_to, y_to) of blocked area, limits
+            are included.
+        """
+        self.ensure_one()
+        return self.env['aruna_game_test.obstacle'].create([{
+            'board_id': self.id,
+            'x_from': x_from,
+            'y_from': y_from,
+            'x_to': x_to,
+            'y_to': y_to
+        } for x_from, y_from, x_to, y_to in (
+            normalize_range(*cell_range) for cell_range in ranges)])
+
+    def action_load_obstacle_file(self):
+        """ Add every obstacle of the uploaded CSV file."""
+        self.ensure_one()
+        if not self.obstacle_file:
+            raise ValidationError('Upload an obstacle file first.')
+        self.add_obstacle_ranges(
+            parse_obstacle_ranges(base64.b64decode(self.obstacle_file)))
+        self.write({
+            'obstacle_file': False,
+            'obstacle_filename': False
+        })
+
+    def write(self, vals):
+        res = super(aruna_game_test_board, self).write(vals)
+        if 'width' in vals or 'height' in vals:
+            self.clear_caches()
+        return res
+
+    def unlink(self):
+        self.clear_caches()
+        return super(aruna_game_test_board, self).unlink()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+import json
+from odoo import models, fields, api
+from ..utils.constants import eObjectFacing
+from ..utils.checkpoint import DEFAULT_CHECKPOINT_INTERVAL, Checkpoint,\
+    iter_prefix_hashes
+from ..utils.exceptions import CommandLineError
+from ..utils.simulation import GameState, CommandSimulator
+from ..utils.board import Board, DEFAULT_BOARD
+
+FACING_SELECTION = [
+    (eObjectFacing.north.name, 'NORTH'),
+    (eObjectFacing.east.name, 'EAST'),
+    (eObjectFacing.south.name, 'SOUTH'),
+    (eObjectFacing.west.name, 'WEST')
+]
+
+
+class aruna_game_test_checkpoint(models.Model):
+    _name = 'aruna_game_test.checkpoint'
+    _description = 'Aruna Game Simulation Checkpoint'
+    _order = 'game_id, line'
+
+    game_id = fields.Many2one(
+        'aruna_game_test.aruna_game_test', string='Game', required=True,
+        ondelete='cascade', index=True)
+    line = fields.Integer(string='Line', required=True)
+    prefix_hash = fields.Char(string='Prefix Hash', required=True, index=True)
+    x_pos = fields.Integer(string='X Coordinate')
+    y_pos = fields.Integer(string='Y Coordinate')
+    facing = fields.Selection(
+        selection=FACING_SELECTION, string="Object Facing / Direction")
+    is_placed = fields.Boolean(string='Is robot placed?')
+    is_properly_placed = fields.Boolean(string='Is properly placed (On Table)?')
+    is_reported = fields.Boolean(string='Is report requested')
+    before_x_pos = fields.Integer(string='X Coordinate before Error')
+    before_y_pos = fields.Integer(string='Y Coordinate before Error')
+    before_facing = fields.Selection(
+        selection=FACING_SELECTION, string="Facing before Error")
+    report_data = fields.Text(
+        string='Report Data',
+        help='REPORT output of the lines after the previous checkpoint, JSON '
+             'list of [line number, report].')
+
+    @api.model
+    def _get_checkpoint_interval(self) -> int:
+        return max(int(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.checkpoint_interval',
+            DEFAULT_CHECKPOINT_INTERVAL)), 1)
+
+    @api.model
+    def _get_prefix_seed(self, board: Board = None) -> str:
+        """ Checkpoint is only reused with the same module version and board."""
+        module_version = self.env['aruna_game_test.result_cache']\
+            ._get_module_version()
+        return '{}|{}'.format(module_version, (board or DEFAULT_BOARD).key)
+
+    @api.model
+    def _find_resume_checkpoint(self, prefix_hashes: dict):
+        """Find the latest checkpoint matching any prefix of the script, with a
+        single query.
+
+        Args:
+            prefix_hashes (dict): prefix hash keyed by number of lines.
+
+        Returns:
+            Checkpoint: or None when no prefix was executed before.
+        """
+        if not prefix_hashes:
+            return None
+        record = self.sudo().search(
+            [('prefix_hash', 'in', list(prefix_hashes.values()))],
+            order='line desc', limit=1)
+        # Guard against the same hash on another line
+        if not record or prefix_hashes.get(record.line) != record.prefix_hash:
+            return None
+        return record._to_checkpoint()
+
+    @api.model
+    def _get_state_at_line(self, command_list: list, line: int,
+                           board: Board = None, game_id: int = None) -> dict:
+        """Get the robot state after executing the first lines of the script.
+        Execution is resumed from the latest checkpoint before the line, the
+        game checkpoints first, then checkpoints of any script starting with
+        the same lines (example a cached or failed run), so at most one
+        checkpoint interval is replayed.
+
+        Args:
+            command_list (list): command text, one command per item.
+            line (int): number of executed line.
+            board (Board, optional): table of the simulation. Defaults to the
+            5x5 table.
+            game_id (int, optional): game record owning the checkpoints.
+
+        Returns:
+            dict: state values, and error data when a command failed before the
+            line, otherwise False.
+        """
+        line = min(max(line, 0), len(command_list))
+        resume_checkpoint = None
+        if game_id:
+            record = self.sudo().search([
+                ('game_id', '=', game_id),
+                ('line', '<=', line)
+            ], order='line desc', limit=1)
+            if record:
+                resume_checkpoint = record._to_checkpoint()
+        interval = self._get_checkpoint_interval()
+        # Prefix is only hashed when a checkpoint could match it
+        if resume_checkpoint is None and line >= interval and \
+                self.sudo().search([('line', '<=', line)], limit=1):
+            resume_checkpoint = self._find_resume_checkpoint(dict(
+                iter_prefix_hashes(command_list[:line], interval,
+                                   self._get_prefix_seed(board))))
+
+        simulator = CommandSimulator(board=board)
+        start_line = 0
+        if resume_checkpoint:
+            start_line = resume_checkpoint.line
+            simulator = CommandSimulator(resume_checkpoint.state,
+                                         resume_checkpoint.state_before_error,
+                                         board)
+
+        error_data = False
+        try:
+            simulator.run(command_list[start_line:line], start_line + 1)
+        except CommandLineError as err:
+            error_data = err.error_data
+        return {
+            'state': simulator.state.to_vals(),
+            'error': error_data
+        }
+
+    def _to_checkpoint(self) -> Checkpoint:
+        self.ensure_one()
+        state = GameState(self.x_pos, self.y_pos, self.facing, self.is_placed,
+                          self.is_properly_placed, self.is_reported)
+        state_before_error = state.copy()
+        state_before_error.x_pos = self.before_x_pos
+        state_before_error.y_pos = self.before_y_pos
+        state_before_error.facing = self.before_facing or state.facing
+        reports = [tuple(report)
+                   for report in json.loads(self.report_data or '[]')]
+        return Checkpoint(self.line, self.prefix_hash, state, state_before_error,
+                          reports)
+
+    @api.model
+    def _prepare_checkpoint_vals(self, game_id: int, checkpoint: Checkpoint) -> dict:
+        before_state = checkpoint.state_before_error
+        return dict(
+            checkpoint.state.to_vals(),
+            game_id=game_id,
+            line=checkpoint.line,
+            prefix_hash=checkpoint.prefix_hash,
+            before_x_pos=before_state.x_pos,
+            before_y_pos=before_state.y_pos,
+            before_facing=before_state.facing,
+            report_data=json.dumps(checkpoint.reports))
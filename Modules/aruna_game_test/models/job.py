@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+import time
+from itertools import islice
+from odoo import models, fields, api
+from ..utils.exceptions import CommandLineError
+from ..utils.simulation import GameState, CommandSimulator, format_report_log
+from ..utils.script_source import iter_script_lines
+from .checkpoint import FACING_SELECTION
+
+_logger = logging.getLogger(__name__)
+
+# Default number of line executed between two commits
+DEFAULT_JOB_CHUNK_SIZE = 100000
+# Default number of seconds a cron run keep processing jobs
+DEFAULT_JOB_TIME_LIMIT = 60
+# Default number of unexpected error before the job is failed
+DEFAULT_JOB_MAX_ATTEMPTS = 3
+
+
+class aruna_game_test_job(models.Model):
+    _name = 'aruna_game_test.job'
+    _description = 'Aruna Game Background Job'
+    _order = 'id desc'
+
+    name = fields.Char(string='Name', required=True, default='Script Job')
+    state = fields.Selection(
+        selection=[
+            ('queued', 'Queued'),
+            ('running', 'Running'),
+            ('done', 'Done'),
+            ('failed', 'Failed')
+        ],
+        string='Status', default='queued', required=True, index=True)
+    input_cmd = fields.Text(string="Input Command")
+    input_file = fields.Binary(string='Input File', attachment=True)
+    input_filename = fields.Char(string='Input Filename')
+    board_id = fields.Many2one(
+        'aruna_game_test.board', string='Table', ondelete='restrict')
+    game_id = fields.Many2one(
+        'aruna_game_test.aruna_game_test', string='Result', readonly=True)
+    line_count = fields.Integer(string='Lines', readonly=True)
+    line_done = fields.Integer(string='Executed Lines', readonly=True)
+    processing_time = fields.Float(
+        string='Processing Time (s)', readonly=True)
+    lines_per_second = fields.Float(
+        string='Lines per Second', compute='_compute_progress')
+    progress = fields.Float(string='Progress', compute='_compute_progress')
+    date_start = fields.Datetime(string='Started At', readonly=True)
+    date_end = fields.Datetime(string='Finished At', readonly=True)
+    error_message = fields.Text(string='Error', readonly=True)
+    attempt_count = fields.Integer(
+        string='Failed Attempts', readonly=True, default=0,
+        help='Number of chunk rolled back by an unexpected error.')
+    # Robot state after the executed lines, the next chunk resume from it
+    x_pos = fields.Integer(string='X Coordinate', readonly=True)
+    y_pos = fields.Integer(string='Y Coordinate', readonly=True)
+    facing = fields.Selection(
+        selection=FACING_SELECTION, string="Object Facing / Direction",
+        default=FACING_SELECTION[0][0], readonly=True)
+    is_placed = fields.Boolean(string='Is robot placed?', readonly=True)
+    is_properly_placed = fields.Boolean(
+        string='Is properly placed (On Table)?', readonly=True)
+    is_reported = fields.Boolean(string='Is report requested', readonly=True)
+    # REPORT output of the executed lines, appended after each chunk
+    report_log = fields.Text(string='Report Log', readonly=True, prefetch=False)
+    report_count = fields.Integer(string='Reports', readonly=True, default=0)
+    before_x_pos = fields.Integer(string='X Coordinate before Error')
+    before_y_pos = fields.Integer(string='Y Coordinate before Error')
+    before_facing = fields.Selection(
+        selection=FACING_SELECTION, string="Facing before Error")
+
+    @api.depends('line_count', 'line_done', 'processing_time')
+    def _compute_progress(self):
+        for record in self:
+            record.lines_per_second = record.line_done / record.processing_time \
+                if record.processing_time else 0.0
+            record.progress = 100.0 * record.line_done / record.line_count \
+                if record.line_count else 100.0 * (record.state == 'done')
+
+    ########################################################################
+    # Job Processing
+    ########################################################################
+
+    @api.model
+    def _get_chunk_size(self) -> int:
+        return max(int(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.job_chunk_size', DEFAULT_JOB_CHUNK_SIZE)), 1)
+
+    @api.model
+    def _get_time_limit(self) -> int:
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.job_time_limit', DEFAULT_JOB_TIME_LIMIT))
+
+    @api.model
+    def _get_max_attempts(self) -> int:
+        return max(int(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.job_max_attempts', DEFAULT_JOB_MAX_ATTEMPTS)), 1)
+
+    def _iter_lines(self):
+        """ Iterate script lines, the uploaded file is read line by line."""
+        self.ensure_one()
+        if not self.input_file:
+            yield from (self.input_cmd or '').strip().splitlines()
+            return
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'input_file'),
+            ('res_id', '=', self.id)
+        ], limit=1)
+        with self.env['input.command.wizard']._open_attachment(
+                attachment) as file_obj:
+            yield from iter_script_lines(file_obj)
+
+    @api.model
+    def _acquire_job(self):
+        """Lock the oldest pending job, job locked by another worker is
+        skipped. The lock is released by the next commit.
+        """
+        self.env.cr.execute("""
+            SELECT id FROM aruna_game_test_job
+            WHERE state IN ('queued', 'running')
+            ORDER BY id
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        """)
+        row = self.env.cr.fetchone()
+        if not row:
+            return self.browse()
+        job = self.browse(row[0])
+        # Job could be updated by another worker since it was read
+        job.invalidate_cache()
+        return job
+
+    @api.model
+    def _cron_process_jobs(self):
+        """Process pending jobs chunk by chunk until there is no job left or
+        the time limit is reached. Each chunk is committed with the job state,
+        so a killed worker lose at most one chunk, and the job is resumed by
+        the next worker that lock it.
+        Chunk raising an unexpected error is rolled back, the job is failed
+        after a few attempts so it does not block the next jobs.
+        """
+        auto_commit = not getattr(threading.current_thread(), 'testing', False)
+        chunk_size = self._get_chunk_size()
+        deadline = time.time() + self._get_time_limit()
+        # Line iterator of the last processed job, so the script is not read
+        # again from the start when the same worker continue the job
+        line_iterators = dict()
+        while time.time() < deadline:
+            job = self._acquire_job()
+            if not job:
+                break
+            position, lines = line_iterators.pop(job.id, (None, None))
+            try:
+                with self.env.cr.savepoint():
+                    if position != job.line_done:
+                        lines = islice(job._iter_lines(), job.line_done, None)
+                    job._run_chunk(lines, chunk_size)
+            except Exception as err:
+                _logger.exception('Background job %s failed.', job.id)
+                job.invalidate_cache()
+                job._register_failed_attempt(str(err))
+            else:
+                if job.state == 'running':
+                    line_iterators = {job.id: (job.line_done, lines)}
+            if auto_commit:
+                self.env.cr.commit()
+
+    def _register_failed_attempt(self, message: str):
+        """ Count a chunk rolled back by an unexpected error, the job is failed
+        once the maximum number of attempts is reached."""
+        self.ensure_one()
+        vals = {
+            'attempt_count': self.attempt_count + 1,
+            'error_message': 'Unexpected error: {}'.format(message)
+        }
+        if vals['attempt_count'] >= self._get_max_attempts():
+            vals.update(state='failed', date_end=fields.Datetime.now())
+        self.write(vals)
+
+    def _count_lines(self):
+        """ Count script lines for the progress, the script is read once."""
+        self.ensure_one()
+        line_count = 0
+        for dummy in self._iter_lines():
+            line_count += 1
+        self.line_count = line_count
+
+    def _get_job_state(self) -> tuple:
+        """ Robot state and state before error after the executed lines."""
+        self.ensure_one()
+        state = GameState(self.x_pos, self.y_pos, self.facing, self.is_placed,
+                          self.is_properly_placed, self.is_reported)
+        state_before_error = state.copy()
+        if self.line_done:
+            state_before_error.x_pos = self.before_x_pos
+            state_before_error.y_pos = self.before_y_pos
+            state_before_error.facing = self.before_facing or state.facing
+        return state, state_before_error
+
+    def _run_chunk(self, lines, chunk_size: int):
+        """Execute the next chunk of lines from the stored robot state, then
+        store the new state and the progress. Lines are counted on the first
+        chunk, the result game is created when every line is executed.
+
+        Args:
+            lines (iterator): script lines after the executed lines.
+            chunk_size (int): number of line to execute.
+        """
+        self.ensure_one()
+        start_time = time.time()
+        if self.state == 'queued':
+            # Script is only read by the cron, not in the queuing request
+            self._count_lines()
+        board = self.env['aruna_game_test.board']._get_board(self.board_id.id)
+        reports = []
+        simulator = CommandSimulator(*self._get_job_state(), board=board,
+                                     reports=reports)
+        command_list = list(islice(lines, chunk_size))
+
+        vals = {'state': 'running'}
+        if not self.date_start:
+            vals['date_start'] = fields.Datetime.now()
+        try:
+            simulator.run(command_list, self.line_done + 1)
+        except CommandLineError as err:
+            vals.update({
+                'state': 'failed',
+                'error_message': self.env['input.command.wizard']
+                ._format_command_error(err.error_data)
+            })
+
+        if reports:
+            self._append_report_log(reports)
+        state_before_error = simulator.state_before_error
+        vals.update(simulator.state.to_vals(),
+                    line_done=self.line_done + len(command_list),
+                    processing_time=self.processing_time +
+                    time.time() - start_time,
+                    before_x_pos=state_before_error.x_pos,
+                    before_y_pos=state_before_error.y_pos,
+                    before_facing=state_before_error.facing)
+        if vals['state'] == 'running' and vals['line_done'] >= self.line_count:
+            game_data = self.env['aruna_game_test.aruna_game_test'].create(dict(
+                simulator.state.to_vals(), input_cmd=self.input_cmd,
+                board_id=self.board_id.id))
+            self._copy_report_log(game_data)
+            vals.update(state='done', game_id=game_data.id)
+        if vals['state'] != 'running':
+            vals['date_end'] = fields.Datetime.now()
+        self.write(vals)
+
+    def _append_report_log(self, reports: list):
+        """ Append REPORT output of a chunk, the stored log is never read."""
+        self.ensure_one()
+        self.flush(['report_log', 'report_count'])
+        self.env.cr.execute("""
+            UPDATE aruna_game_test_job
+            SET report_log = concat_ws(E'\\n', report_log, %s),
+                report_count = COALESCE(report_count, 0) + %s
+            WHERE id = %s
+        """, (format_report_log(reports), len(reports), self.id))
+        self.invalidate_cache(['report_log', 'report_count'], self.ids)
+
+    def _copy_report_log(self, game_data):
+        """ Copy the report log to the result game inside the database."""
+        self.ensure_one()
+        game_data.flush(['report_log', 'report_count'])
+        self.env.cr.execute("""
+            UPDATE aruna_game_test_aruna_game_test game
+            SET report_log = job.report_log,
+                report_count = COALESCE(job.report_count, 0)
+            FROM aruna_game_test_job job
+            WHERE game.id = %s AND job.id = %s
+        """, (game_data.id, self.id))
+        game_data.invalidate_cache(['report_log', 'report_count'],
+                                   game_data.ids)
+
+    def action_show_game(self):
+        """ Open the game record created by the job."""
+        self.ensure_one()
+        return self.env['input.command.wizard']._get_game_action(self.game_id)
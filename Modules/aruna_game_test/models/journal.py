@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+from itertools import islice
+from odoo import models, fields, api
+from ..utils.constants import OBJECT_TURNING_POS, OP_PLACE, OP_MOVE, OP_LEFT,\
+    OP_RIGHT, OP_REPORT
+from ..utils.trajectory import DEFAULT_JOURNAL_CHUNK_SIZE
+from .checkpoint import FACING_SELECTION
+
+# Selection value of each executed opcode
+JOURNAL_OPCODE = {
+    OP_PLACE: 'place',
+    OP_MOVE: 'move',
+    OP_LEFT: 'left',
+    OP_RIGHT: 'right',
+    OP_REPORT: 'report'
+}
+
+
+class aruna_game_test_journal(models.Model):
+    _name = 'aruna_game_test.journal'
+    _description = 'Aruna Game Move Journal'
+    _order = 'game_id, step'
+    # Steps are written in bulk by SQL, access fields would only slow it down
+    _log_access = False
+
+    game_id = fields.Many2one(
+        'aruna_game_test.aruna_game_test', string='Game', required=True,
+        ondelete='cascade', index=True)
+    step = fields.Integer(string='Step', required=True)
+    line = fields.Integer(string='Line', required=True)
+    opcode = fields.Selection(
+        selection=[
+            ('place', 'PLACE'),
+            ('move', 'MOVE'),
+            ('left', 'LEFT'),
+            ('right', 'RIGHT'),
+            ('report', 'REPORT')
+        ],
+        string='Command', required=True)
+    x_pos = fields.Integer(string='X Coordinate')
+    y_pos = fields.Integer(string='Y Coordinate')
+    facing = fields.Selection(
+        selection=FACING_SELECTION, string="Object Facing / Direction")
+
+    @api.model
+    def _get_chunk_size(self) -> int:
+        return max(int(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.journal_chunk_size',
+            DEFAULT_JOURNAL_CHUNK_SIZE)), 1)
+
+    @api.model
+    def _record_steps(self, game_id: int, steps) -> int:
+        """Insert a journal row per executed command, steps are recorded by
+        the simulation of the script (see StepRecorder). Rows are written
+        chunk by chunk, each chunk with a single multi-row INSERT.
+
+        Args:
+            game_id (int): game record of the script.
+            steps (iterable): (line number, opcode, x_pos, y_pos, facing index)
+
+        Returns:
+            int: number of inserted steps.
+        """
+        chunk_size = self._get_chunk_size()
+        rows = (
+            (game_id, step, line, JOURNAL_OPCODE[opcode], x_pos, y_pos,
+             OBJECT_TURNING_POS[facing])
+            for step, (line, opcode, x_pos, y_pos, facing)
+            in enumerate(steps, 1))
+
+        step_count = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            self.env.cr.execute("""
+                INSERT INTO {} (game_id, step, line, opcode, x_pos, y_pos, facing)
+                VALUES {}
+            """.format(self._table, ', '.join(
+                ['(%s, %s, %s, %s, %s, %s, %s)'] * len(chunk))),
+                [value for row in chunk for value in row])
+            step_count += len(chunk)
+        return step_count
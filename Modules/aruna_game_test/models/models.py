@@ -1,17 +1,36 @@
 # -*- coding: utf-8 -*-
-from odoo import models, fields, api
+import base64
+import json
+from odoo import models, fields, api, tools
 from odoo.exceptions import ValidationError
 from ..utils.constants import eObjectFacing, OBJECT_TURNING_POS, eMoveModifier,\
-    eObjectTurnDirection, MOVE_MODIFIER, DIRECTION_ARROW
+    eObjectTurnDirection, MOVE_MODIFIER, DEFAULT_BOARD_SIZE
 from ..utils.common_utils import check_table_pos
+from ..utils.compiler import compile_script
+from ..utils.simulation import GameState, CommandSimulator, OBSTACLE_REASON,\
+    DEFAULT_REPORT_PAGE_SIZE
+from ..utils.board import Board
+from ..utils.trajectory import Trajectory
+from ..utils.board_view import DEFAULT_VIEWPORT_SIZE, build_board_payload,\
+    get_board_html
+from ..utils.batch_simulator import simulate_batch
+from ..utils.transition_table import fits_transition_table, simulate_from_table
+from ..utils.exceptions import CommandLineError
+
+
+# Append the current position to the report log, in the report field format
+REPORT_LOG_APPEND_SQL = """
+    report_log = concat_ws(E'\\n', report_log,
+                           x_pos || ',' || y_pos || ',' || upper(facing)),
+    report_count = COALESCE(report_count, 0) + 1"""
 
 
 class aruna_game_test(models.Model):
     _name = 'aruna_game_test.aruna_game_test'
     _description = 'Aruna Odoo Interview Test'
 
-    x_pos = fields.Integer(string='X Coordinate', default=0)
-    y_pos = fields.Integer(string='Y Coordinate', default=0)
+    x_pos = fields.Integer(string='X Coordinate', default=0, index=True)
+    y_pos = fields.Integer(string='Y Coordinate', default=0, index=True)
     facing = fields.Selection(
         selection=[
             (eObjectFacing.north.name, 'NORTH'),
@@ -20,19 +39,69 @@ class aruna_game_test(models.Model):
             (eObjectFacing.west.name, 'WEST')
         ],
         string="Object Facing / Direction",
-        default=eObjectFacing.north.name
+        default=eObjectFacing.north.name,
+        index=True
     )
-    report = fields.Text(string='Position Report', compute='_compute_report')
+    report = fields.Char(string='Position Report', compute='_compute_report',
+                         store=True, index=True)
     is_placed = fields.Boolean(string='Is robot placed?', default=False)
     is_properly_placed = fields.Boolean(
-        string='Is properly placed (On Table)?', default=False)
+        string='Is properly placed (On Table)?', default=False, index=True)
     is_reported = fields.Boolean(string='Is report requested', default=False)
     input_cmd = fields.Text(string="Input Command")
+    board_id = fields.Many2one(
+        'aruna_game_test.board', string='Table', ondelete='restrict',
+        default=lambda self: self._default_board())
+    session_id = fields.Many2one(
+        'aruna_game_test.session', string='Table Session', ondelete='cascade',
+        index=True)
+    robot_number = fields.Integer(string='Robot Number')
     html_data = fields.Html(
         string="Position View",
         compute="_compute_html_data")
+    board_data = fields.Text(
+        string="Position View", compute="_compute_board_data",
+        help='Board data in JSON, rendered by the board widget.')
+    checkpoint_ids = fields.One2many(
+        'aruna_game_test.checkpoint', 'game_id', string='Checkpoints')
+    journal_count = fields.Integer(
+        string='Journal Steps', compute='_compute_journal_count')
+    trajectory_data = fields.Binary(
+        string='Trajectory', attachment=True,
+        help='Compressed position after every executed line, see utils/trajectory.py.')
+    # Not prefetched, a log could hold hundred of thousand reports, the form
+    # only read the current page, see _compute_report_log_page
+    report_log = fields.Text(
+        string='Report Log', readonly=True, prefetch=False,
+        help='Output of every REPORT command, one "x,y,FACING" per line.')
+    report_count = fields.Integer(string='Reports', readonly=True, default=0)
+    report_log_page = fields.Text(
+        string='Report Log Page', compute='_compute_report_log_page')
+    report_log_page_info = fields.Char(
+        string='Report Log Page Info', compute='_compute_report_log_page')
+    report_log_has_previous = fields.Boolean(
+        compute='_compute_report_log_page')
+    report_log_has_next = fields.Boolean(compute='_compute_report_log_page')
+
+    _sql_constraints = [
+        ('session_robot_unique', 'UNIQUE(session_id, robot_number)',
+         'Robot number should be unique in a table session.')
+    ]
+
+    @api.model
+    def _default_board(self):
+        return self.env.ref('aruna_game_test.board_default',
+                            raise_if_not_found=False) or \
+            self.env['aruna_game_test.board']
+
+    def init(self):
+        # Final position lookup, example all robots ending at 4,4 facing EAST
+        tools.create_index(
+            self.env.cr, 'aruna_game_test_aruna_game_test_position_index',
+            self._table, ['x_pos', 'y_pos', 'facing'])
 
-    @api.depends('x_pos', 'y_pos', 'facing')
+    @api.depends('x_pos', 'y_pos', 'facing', 'is_placed', 'is_properly_placed',
+                 'is_reported')
     def _compute_report(self):
         for record in self:
             report_value = ""
@@ -91,7 +160,12 @@ class aruna_game_test(models.Model):
         Example :
             Facing is to the North, current pos is 0, 0. If we move north 1 pos
             the coordinate point that needs to be modified is the y_point (add 1 point),
+
+        On many records, every robot is moved with a single SQL update, see
+        _move_robots.
         """
+        if len(self) != 1:
+            return self._move_robots()
         self.ensure_one()
         # Get position modifer data, which position that needs to be modified
         # when moving
@@ -106,11 +180,11 @@ class aruna_game_test(models.Model):
     @check_table_pos
     def turn_robot(self):
         """Turn the robot according to the given turn command, to the left or to the right.
+        On many records, every robot is turned with a single SQL update.
 
         Raises:
             ValidationError: _description_
         """
-        self.ensure_one()
         # Validate direction
         direction = self.env.context.get('turn_direction', False)
 
@@ -118,6 +192,9 @@ class aruna_game_test(models.Model):
                 eObjectTurnDirection.left.name,
                 eObjectTurnDirection.right.name]:
             raise ValidationError('Unknown turning direction.')
+        if len(self) != 1:
+            return self._turn_robots(direction)
+        self.ensure_one()
 
         # Get turn value to get correct heading when robot is turning,
         # example when current heading is to West, if we move right the heading should be the North.
@@ -141,90 +218,474 @@ class aruna_game_test(models.Model):
     @check_table_pos
     def report_location(self):
         """Set report flag to true, this will trigger position and facing data report to be computed.
+        On many records, every robot is updated with a single SQL update.
         """
+        if len(self) != 1:
+            return self._report_robots()
         self.ensure_one()
         self.write({
             'is_reported': True
         })
+        self._append_report_log()
+
+    ########################################################################
+    # Recordset Command
+    ########################################################################
+
+    def _move_robots(self):
+        """Move every robot properly placed on the table with a single UPDATE.
+        Robots that would fall or hit an obstacle are not moved, they are
+        returned instead of raising on the first one.
+
+        Returns:
+            recordset: robots that could not move.
+        """
+        if not self:
+            return self
+        self.flush()
+        x_modifier = ' '.join("WHEN '{}' THEN {}".format(facing, modifier.x_pos)
+                              for facing, modifier in MOVE_MODIFIER.items())
+        y_modifier = ' '.join("WHEN '{}' THEN {}".format(facing, modifier.y_pos)
+                              for facing, modifier in MOVE_MODIFIER.items())
+        self.env.cr.execute("""
+            WITH target AS (
+                SELECT game.id,
+                       game.x_pos + CASE game.facing {x_modifier} ELSE 0 END AS new_x_pos,
+                       game.y_pos + CASE game.facing {y_modifier} ELSE 0 END AS new_y_pos,
+                       COALESCE(board.width, %(default_size)s) AS width,
+                       COALESCE(board.height, %(default_size)s) AS height,
+                       game.board_id
+                FROM {table} game
+                LEFT JOIN aruna_game_test_board board ON board.id = game.board_id
+                WHERE game.id IN %(ids)s AND game.is_properly_placed
+            ), allowed AS (
+                SELECT target.* FROM target
+                WHERE target.new_x_pos BETWEEN 0 AND target.width - 1
+                AND target.new_y_pos BETWEEN 0 AND target.height - 1
+                AND NOT EXISTS (
+                    SELECT 1 FROM aruna_game_test_obstacle obstacle
+                    WHERE obstacle.board_id = target.board_id
+                    AND target.new_x_pos BETWEEN obstacle.x_from AND obstacle.x_to
+                    AND target.new_y_pos BETWEEN obstacle.y_from AND obstacle.y_to
+                )
+            ), updated AS (
+                UPDATE {table} game
+                SET x_pos = allowed.new_x_pos, y_pos = allowed.new_y_pos,
+                    write_uid = %(uid)s, write_date = (now() at time zone 'UTC')
+                FROM allowed WHERE game.id = allowed.id
+                RETURNING game.id
+            )
+            SELECT target.id, updated.id IS NOT NULL
+            FROM target LEFT JOIN updated ON updated.id = target.id
+        """.format(table=self._table, x_modifier=x_modifier,
+                   y_modifier=y_modifier), {
+            'ids': tuple(self.ids),
+            'default_size': DEFAULT_BOARD_SIZE,
+            'uid': self.env.uid
+        })
+        result = self.env.cr.fetchall()
+        moved_ids = [game_id for game_id, is_moved in result if is_moved]
+        self.browse(moved_ids)._refresh_after_sql_update(['x_pos', 'y_pos'])
+        return self.browse([game_id for game_id, is_moved in result
+                            if not is_moved])
+
+    def _turn_robots(self, direction: str):
+        """ Turn every robot properly placed on the table with a single UPDATE."""
+        if not self:
+            return self
+        self.flush()
+        turn_value = 1 if direction == eObjectTurnDirection.right.name else -1
+        new_facing = ' '.join(
+            "WHEN '{}' THEN '{}'".format(
+                facing, OBJECT_TURNING_POS[(index + turn_value) % len(OBJECT_TURNING_POS)])
+            for index, facing in enumerate(OBJECT_TURNING_POS))
+        self.env.cr.execute("""
+            UPDATE {table}
+            SET facing = CASE facing {new_facing} ELSE facing END,
+                write_uid = %(uid)s, write_date = (now() at time zone 'UTC')
+            WHERE id IN %(ids)s AND is_properly_placed
+            RETURNING id
+        """.format(table=self._table, new_facing=new_facing), {
+            'ids': tuple(self.ids),
+            'uid': self.env.uid
+        })
+        self.browse([row[0] for row in self.env.cr.fetchall()])\
+            ._refresh_after_sql_update(['facing'])
+        return self.browse()
+
+    def _report_robots(self):
+        """Set report flag of every robot properly placed on the table, and
+        append its position to its report log."""
+        if not self:
+            return self
+        self.flush()
+        self.env.cr.execute("""
+            UPDATE {table}
+            SET is_reported = TRUE, {append_report},
+                write_uid = %(uid)s, write_date = (now() at time zone 'UTC')
+            WHERE id IN %(ids)s AND is_properly_placed
+            RETURNING id
+        """.format(table=self._table, append_report=REPORT_LOG_APPEND_SQL), {
+            'ids': tuple(self.ids),
+            'uid': self.env.uid
+        })
+        self.browse([row[0] for row in self.env.cr.fetchall()])\
+            ._refresh_after_sql_update(
+                ['is_reported', 'report_log', 'report_count'])
+        return self.browse()
+
+    def _append_report_log(self):
+        """Append the position of every robot properly placed on the table to
+        its report log. Done in SQL, so the stored log is never read."""
+        if not self:
+            return
+        self.flush()
+        self.env.cr.execute("""
+            UPDATE {table} SET {append_report}
+            WHERE id IN %(ids)s AND is_properly_placed
+            RETURNING id
+        """.format(table=self._table, append_report=REPORT_LOG_APPEND_SQL), {
+            'ids': tuple(self.ids)
+        })
+        self.browse([row[0] for row in self.env.cr.fetchall()])\
+            ._refresh_after_sql_update(['report_log', 'report_count'])
+
+    def _refresh_after_sql_update(self, fnames: list):
+        """ Drop cached values written by SQL, then recompute dependent fields
+        like report."""
+        if not self:
+            return
+        self.invalidate_cache(fnames + ['write_uid', 'write_date'], self.ids)
+        self.modified(fnames)
+        self.recompute()
+
+    def simulate_batch(self, input_cmd_list: list,
+                       start_state_list: list = None, board_id: int = None) -> list:
+        """Simulate command script for many robots at once.
+        Each command is applied to every robot in one vectorized step, no game
+        record is written.
+
+        Args:
+            input_cmd_list (list): command script text. A single script is run by
+            every robot, otherwise robot i run script i.
+            start_state_list (list, optional): start state values of each robot
+            (see GameState). Defaults to the state of the records, or a not
+            placed robot per script when called on an empty recordset.
+            board_id (int, optional): table of every robot. Defaults to the table
+            of the records, or the default table on an empty recordset.
+
+        Returns:
+            list: per robot final state values, error line and error reason.
+        """
+        if start_state_list is not None:
+            states = [GameState(**state_vals)
+                      for state_vals in start_state_list]
+        elif self:
+            states = [record._get_game_state() for record in self]
+        else:
+            states = [GameState() for dummy in input_cmd_list]
+
+        is_shared_script = len(input_cmd_list) == 1
+        if is_shared_script:
+            input_cmd_list = input_cmd_list * len(states)
+        if len(input_cmd_list) != len(states):
+            raise ValidationError(
+                'Give a single script, or a script for each robot.')
+
+        # Command before PLACE is only discarded for not placed robot
+        compiled_list = [compile_script(input_cmd, state.is_placed)
+                         for input_cmd, state in zip(input_cmd_list, states)]
+
+        # Robots on the same table are simulated together
+        if board_id is None and len(self) == len(states):
+            robot_board_ids = [record.board_id.id for record in self]
+        else:
+            board_id = board_id or self._default_board().id
+            robot_board_ids = [board_id] * len(states)
+        board_index = dict()
+        for index, robot_board_id in enumerate(robot_board_ids):
+            board_index.setdefault(robot_board_id, []).append(index)
+
+        results = [None] * len(states)
+        board_model = self.env['aruna_game_test.board']
+        for robot_board_id, index_list in board_index.items():
+            board = board_model._get_board(robot_board_id)
+            if is_shared_script and len(index_list) > 1 and \
+                    fits_transition_table(board):
+                board_results = self._simulate_shared_script(
+                    input_cmd_list[0], [states[index] for index in index_list],
+                    board)
+            else:
+                board_results = simulate_batch(
+                    [compiled_list[index] for index in index_list],
+                    [states[index] for index in index_list],
+                    board=board).results()
+            for index, result in zip(index_list, board_results):
+                results[index] = result
+        return results
+
+    @api.model
+    def _simulate_shared_script(self, input_cmd: str, states: list,
+                                board: Board) -> list:
+        """Many robots running the same script on a small table, final states
+        come from the script transition table which is built once. Robots
+        failing a command are simulated again to get the error data.
+
+        Returns:
+            list: per robot final state values, error line and error reason.
+        """
+        final_states = simulate_from_table(
+            compile_script(input_cmd, True), states, board)
+        results = [{
+            'state': final_state.to_vals(),
+            'error_line': False,
+            'error_reason': False
+        } if final_state else None for final_state in final_states]
+
+        failed_index = [index for index, result in enumerate(results)
+                        if result is None]
+        if failed_index:
+            failed_results = simulate_batch(
+                [compile_script(input_cmd, states[index].is_placed)
+                 for index in failed_index],
+                [states[index] for index in failed_index], board=board).results()
+            for index, result in zip(failed_index, failed_results):
+                results[index] = result
+        return results
+
+    @api.model
+    def dry_run(self, input_cmd: str, board_id: int = False) -> dict:
+        """Simulate a script in memory only, nothing is written to the
+        database, example to validate a script or to see its REPORT output.
+
+        Args:
+            input_cmd (str): command script text.
+            board_id (int, optional): table of the simulation. Defaults to the
+            5x5 table.
+
+        Returns:
+            dict: final state values (state at the error when a command
+            failed), REPORT output as (line, report) list, and error data or
+            False.
+        """
+        board = self.env['aruna_game_test.board']._get_board(board_id)
+        reports = []
+        simulator = CommandSimulator(board=board, reports=reports)
+        error_data = False
+        try:
+            simulator.execute(compile_script(input_cmd or ''))
+        except CommandLineError as err:
+            error_data = err.error_data
+        return {
+            'state': simulator.state.to_vals(),
+            'reports': reports,
+            'error': error_data
+        }
+
+    def _get_trajectory(self):
+        """ Decode the packed trajectory, None when it is not stored."""
+        self.ensure_one()
+        trajectory_data = self.with_context(bin_size=False).trajectory_data
+        if not trajectory_data:
+            return None
+        return Trajectory.from_bytes(base64.b64decode(trajectory_data))
+
+    def iter_trajectory_states(self, line_from: int = None, line_to: int = None):
+        """Yield the robot state after each line between line_from and line_to
+        (included), decoded lazily from the stored trajectory.
+
+        Yields:
+            dict: line, x_pos, y_pos and facing
+        """
+        trajectory = self._get_trajectory()
+        if trajectory is None:
+            return
+        for line, x_pos, y_pos, facing in trajectory.iter_states(
+                line_from, line_to):
+            yield {
+                'line': line,
+                'x_pos': x_pos,
+                'y_pos': y_pos,
+                'facing': facing
+            }
+
+    def get_state_at_line(self, line: int) -> dict:
+        """Get the robot state after executing the first lines of input_cmd.
+        The state is decoded from the stored trajectory, otherwise execution is
+        resumed from the latest checkpoint before the line, so at most one
+        checkpoint interval is replayed.
+
+        Args:
+            line (int): number of executed line.
+
+        Returns:
+            dict: state values, and error data when a command failed before the
+            line, otherwise False.
+        """
+        self.ensure_one()
+        trajectory = self._get_trajectory()
+        if trajectory is not None and trajectory.report_line is not None:
+            return {
+                'state': trajectory.game_state_at(
+                    max(line, 0), self._get_board()).to_vals(),
+                'error': False
+            }
+        return self.env['aruna_game_test.checkpoint']._get_state_at_line(
+            (self.input_cmd or '').strip().splitlines(), line, self._get_board(),
+            self.id)
+
+    def action_open_line_state(self):
+        """ Open the wizard showing the robot state at a given line."""
+        self.ensure_one()
+        return self.env['line.state.wizard']._get_wizard_action({
+            'default_game_id': self.id
+        })
 
     ########################################################################
     # Utils
     ########################################################################
 
+    def _get_game_state(self) -> GameState:
+        """ Get in memory state of the game record."""
+        self.ensure_one()
+        return GameState(self.x_pos, self.y_pos, self.facing, self.is_placed,
+                         self.is_properly_placed, self.is_reported)
+
+    def _get_board(self) -> Board:
+        """ Get cached table configuration of the game record."""
+        self.ensure_one()
+        return self.env['aruna_game_test.board']._get_board(self.board_id.id)
+
     def _check_out_of_bound(self):
         """"
-        Avoid robot to move to out of bound area.
-        Since the board is 5x5 and coordinate start from 0, so the limit is 4.
+        Avoid robot to move to out of bound area or into an obstacle.
+        Coordinate start from 0, so the limit is the table width or height - 1.
         """
         self.ensure_one()
         if self.is_placed and self.is_properly_placed:
-            if self.x_pos > 4 or self.x_pos < 0:
+            board = self._get_board()
+            if self.x_pos > board.max_x or self.x_pos < 0:
                 raise ValidationError(
                     'X Coordinate is out of bound, object would fall.')
-            if self.y_pos > 4 or self.y_pos < 0:
+            if self.y_pos > board.max_y or self.y_pos < 0:
                 raise ValidationError(
                     'Y Coordinate is out of bound, object would fall.')
+            if board.is_blocked(self.x_pos, self.y_pos):
+                raise ValidationError(OBSTACLE_REASON)
 
     def check_is_properly_placed(self):
         """ Check if object is properly placed in the table."""
         self.ensure_one()
         if self.is_placed:
-            if self.x_pos > 4 or self.x_pos < 0:
-                return False
-            elif self.y_pos > 4 or self.y_pos < 0:
-                return False
-            else:
-                return True
+            # Robot placed on an obstacle is handled like outside the table
+            board = self._get_board()
+            return board.contains(self.x_pos, self.y_pos) and \
+                not board.is_blocked(self.x_pos, self.y_pos)
         return False
 
+    def _compute_journal_count(self):
+        journal_data = self.env['aruna_game_test.journal'].read_group(
+            [('game_id', 'in', self.ids)], ['game_id'], ['game_id'])
+        journal_count = {data['game_id'][0]: data['game_id_count']
+                         for data in journal_data}
+        for record in self:
+            record.journal_count = journal_count.get(record.id, 0)
+
+    def action_show_journal(self):
+        """ Open every journal step of the game."""
+        self.ensure_one()
+        return {
+            'name': ('Move Journal'),
+            'type': 'ir.actions.act_window',
+            'res_model': 'aruna_game_test.journal',
+            'view_mode': 'tree',
+            'domain': [('game_id', '=', self.id)]
+        }
+
+    @api.depends('report_count')
+    @api.depends_context('report_log_page')
+    def _compute_report_log_page(self):
+        """Show a single page of the report log, the page number could be given
+        in the context (report_log_page, starting from 1). Only the lines of
+        the page are sent back by the database, the whole log is not read.
+        """
+        page_size = DEFAULT_REPORT_PAGE_SIZE
+        page = max(self.env.context.get('report_log_page', 1), 1)
+        start = (page - 1) * page_size
+        page_lines = dict()
+        stored_ids = tuple(record_id for record_id in self.ids
+                           if isinstance(record_id, int))
+        if stored_ids:
+            self.flush(['report_log'])
+            self.env.cr.execute("""
+                SELECT id, array_to_string(
+                    (string_to_array(report_log, E'\\n'))[%s:%s], E'\\n')
+                FROM {table}
+                WHERE id IN %s AND report_log IS NOT NULL
+            """.format(table=self._table), (start + 1, start + page_size,
+                                             stored_ids))
+            page_lines = dict(self.env.cr.fetchall())
+        for record in self:
+            report_count = record.report_count
+            lines = (page_lines.get(record.id) or '').splitlines()
+            record.report_log_page = '\n'.join(
+                '{}. {}'.format(start + index, line)
+                for index, line in enumerate(lines, 1)) or False
+            record.report_log_page_info = \
+                'Report {} - {} of {}'.format(
+                    start + 1, start + len(lines), report_count) \
+                if lines else '{} Report'.format(report_count)
+            record.report_log_has_previous = page > 1 and report_count > 0
+            record.report_log_has_next = start + page_size < report_count
+
+    def action_next_report_page(self):
+        return self._get_report_page_action(
+            self.env.context.get('report_log_page', 1) + 1)
+
+    def action_previous_report_page(self):
+        return self._get_report_page_action(
+            self.env.context.get('report_log_page', 1) - 1)
+
+    def _get_report_page_action(self, page: int) -> dict:
+        """ Open the game form on the given page of the report log."""
+        self.ensure_one()
+        page_count = max(-(-self.report_count // DEFAULT_REPORT_PAGE_SIZE), 1)
+        return {
+            'name': ('Aruna Odoo Test'),
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'current',
+            'context': dict(self.env.context,
+                            report_log_page=min(max(page, 1), page_count))
+        }
+
     ########################################################################
     # Additional compute to draw robot position in the table
     ########################################################################
 
+    @api.depends('x_pos', 'y_pos', 'facing', 'is_placed', 'is_properly_placed',
+                 'board_id')
+    def _compute_board_data(self):
+        """ Build compact JSON data to show robot position in the board widget."""
+        for record in self:
+            record.board_data = json.dumps(build_board_payload(
+                record._get_board(), record._get_game_state()))
+
+    @api.depends('x_pos', 'y_pos', 'facing', 'board_id')
+    @api.depends_context('board_viewport_size', 'board_pan_x', 'board_pan_y')
     def _compute_html_data(self):
-        """ Build HTML data to show robot position in the table."""
+        """Build HTML data to show robot position in the table.
+        Only the viewport around the robot is rendered, its size and offset
+        could be given in the context (board_viewport_size, board_pan_x and
+        board_pan_y). Rendered viewports are cached by board, viewport and
+        robot position, so reading an unchanged record does not render again.
+        """
+        size = self.env.context.get('board_viewport_size', DEFAULT_VIEWPORT_SIZE)
+        pan_x = self.env.context.get('board_pan_x', 0)
+        pan_y = self.env.context.get('board_pan_y', 0)
         for record in self:
-            # Initialize current position
-            x_pos = record.x_pos
-            y_pos = record.y_pos
-
-            tr_data = """"""
-            # Loop y axis
-            for y_loop in range(4, -1, -1):
-
-                td_data = """"""
-                # Loop x axis
-                for x_loop in range(0, 5):
-                    # Get arrow data
-                    arrow_data = ""
-                    if x_pos == x_loop and y_pos == y_loop:
-                        arrow_data = DIRECTION_ARROW.get(record.facing)
-                    additional_style = """"""
-
-                    # Add aditional style
-                    if y_loop == 0 and x_loop == 0:
-                        additional_style = """background-color:#F5F5DC;"""
-
-                    # Create and append <td> data
-                    base_td = """
-                    <td class="text-center" style="height: 5vh; width: 5vh; {}">
-                    {}
-                    </td>""".format(additional_style, arrow_data)
-                    td_data += base_td
-
-                # Append <td> data to <tr>
-                base_tr = """
-                    <tr>{}</tr>
-                """.format(td_data)
-                tr_data += base_tr
-
-            # Append table data
-            record.html_data = """
-                <div style="height: 200px; width: 200px;">
-                    <table class="table table-bordered">
-                        <tbody>
-                            {}
-                        </tbody>
-                    </table>
-                </div>
-            """.format(tr_data)
+            record.html_data = get_board_html(
+                record._get_board(), record.x_pos, record.y_pos, record.facing,
+                size, pan_x, pan_y)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+from odoo.exceptions import ValidationError
+from ..utils.obstacle import MAX_OBSTACLE_INTERVALS, count_index_intervals
+
+
+class aruna_game_test_obstacle(models.Model):
+    _name = 'aruna_game_test.obstacle'
+    _description = 'Aruna Game Table Obstacle'
+    _order = 'board_id, y_from, x_from'
+
+    board_id = fields.Many2one(
+        'aruna_game_test.board', string='Table', required=True,
+        ondelete='cascade', index=True)
+    x_from = fields.Integer(string='X From', required=True)
+    y_from = fields.Integer(string='Y From', required=True)
+    x_to = fields.Integer(string='X To', required=True)
+    y_to = fields.Integer(string='Y To', required=True)
+
+    _sql_constraints = [
+        ('obstacle_range_ordered', 'CHECK(x_from <= x_to AND y_from <= y_to)',
+         'Obstacle start coordinate should not be after the end coordinate.')
+    ]
+
+    @api.constrains('board_id', 'x_from', 'y_from', 'x_to', 'y_to')
+    def _check_on_table(self):
+        for record in self:
+            board = record.board_id
+            if record.x_from < 0 or record.y_from < 0 or \
+                    record.x_to >= board.width or record.y_to >= board.height:
+                raise ValidationError(
+                    'Obstacle {},{} - {},{} is outside the table.'.format(
+                        record.x_from, record.y_from, record.x_to, record.y_to))
+
+    @api.constrains('board_id', 'x_from', 'y_from', 'x_to', 'y_to')
+    def _check_index_size(self):
+        """ Obstacle index of the table is kept in memory, see ObstacleIndex."""
+        for board in self.mapped('board_id'):
+            obstacle_data = self.sudo().search_read(
+                [('board_id', '=', board.id)],
+                ['x_from', 'y_from', 'x_to', 'y_to'])
+            interval_count = count_index_intervals(
+                (data['x_from'], data['y_from'], data['x_to'], data['y_to'])
+                for data in obstacle_data)
+            if interval_count > MAX_OBSTACLE_INTERVALS:
+                raise ValidationError(
+                    'Too many blocked rows and columns on table {}, the limit '
+                    'is {}.'.format(board.name, MAX_OBSTACLE_INTERVALS))
+
+    # Board configuration is cached, see aruna_game_test.board._get_board
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super(aruna_game_test_obstacle, self).create(vals_list)
+        self.clear_caches()
+        return records
+
+    def write(self, vals):
+        res = super(aruna_game_test_obstacle, self).write(vals)
+        self.clear_caches()
+        return res
+
+    def unlink(self):
+        self.clear_caches()
+        return super(aruna_game_test_obstacle, self).unlink()
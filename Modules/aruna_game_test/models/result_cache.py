@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+import psycopg2
+from odoo import models, fields, api, tools
+from odoo.modules.module import load_information_from_description_file,\
+    adapt_version
+from ..utils.constants import eObjectFacing
+from ..utils.result_cache import RESULT_CACHE, script_hash
+from ..utils.board import Board, DEFAULT_BOARD
+from ..utils.simulation import REPORT_FIELDS
+
+# Game model fields stored in the cache, REPORT output is replayed on a hit
+RESULT_FIELDS = ['x_pos', 'y_pos', 'facing', 'is_placed',
+                 'is_properly_placed', 'is_reported'] + list(REPORT_FIELDS)
+
+
+class aruna_game_test_result_cache(models.Model):
+    _name = 'aruna_game_test.result_cache'
+    _description = 'Aruna Game Simulation Result Cache'
+
+    script_hash = fields.Char(string='Script Hash', required=True, index=True)
+    module_version = fields.Char(string='Module Version', required=True)
+    board_key = fields.Char(string='Board Key', required=True)
+    x_pos = fields.Integer(string='X Coordinate')
+    y_pos = fields.Integer(string='Y Coordinate')
+    facing = fields.Selection(
+        selection=[
+            (eObjectFacing.north.name, 'NORTH'),
+            (eObjectFacing.east.name, 'EAST'),
+            (eObjectFacing.south.name, 'SOUTH'),
+            (eObjectFacing.west.name, 'WEST')
+        ],
+        string="Object Facing / Direction")
+    is_placed = fields.Boolean(string='Is robot placed?')
+    is_properly_placed = fields.Boolean(string='Is properly placed (On Table)?')
+    is_reported = fields.Boolean(string='Is report requested')
+    report_log = fields.Text(string='Report Log')
+    report_count = fields.Integer(string='Reports')
+
+    _sql_constraints = [
+        ('result_cache_key_unique',
+         'UNIQUE(script_hash, module_version, board_key)',
+         'Simulation result is already cached.')
+    ]
+
+    def init(self):
+        # Result of the older module version is never used again
+        self.env.cr.execute("""
+            DELETE FROM aruna_game_test_result_cache
+            WHERE module_version != %s
+        """, (self._get_module_version(),))
+
+    ########################################################################
+    # Cache API
+    ########################################################################
+
+    @api.model
+    @tools.ormcache()
+    def _get_module_version(self) -> str:
+        """ Version of the running module code, from the manifest."""
+        manifest = load_information_from_description_file('aruna_game_test')
+        return adapt_version(manifest.get('version', '0.1'))
+
+    @api.model
+    def _is_persistent(self) -> bool:
+        return tools.str2bool(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.persistent_result_cache', 'False'))
+
+    @api.model
+    def _get_cache_key(self, input_cmd: str, board: Board = None) -> tuple:
+        return (script_hash(input_cmd), self._get_module_version(),
+                (board or DEFAULT_BOARD).key)
+
+    @api.model
+    def lookup(self, input_cmd_list: list, board: Board = None) -> list:
+        """Get cached simulation result of each script.
+        The in memory cache is checked first, then the persistent table in a
+        single query if enabled.
+
+        Args:
+            input_cmd_list (list): script text.
+            board (Board, optional): table of the simulation. Defaults to the
+            5x5 table.
+
+        Returns:
+            list: final state and report log values of each script, None when
+            not cached.
+        """
+        keys = [self._get_cache_key(input_cmd, board)
+                for input_cmd in input_cmd_list]
+        results = [RESULT_CACHE.get(key) for key in keys]
+
+        missing_keys = [key for key, result in zip(keys, results)
+                        if result is None]
+        if missing_keys and self._is_persistent():
+            module_version, current_board_key = missing_keys[0][1:]
+            cache_records = self.sudo().search([
+                ('script_hash', 'in', [key[0] for key in missing_keys]),
+                ('module_version', '=', module_version),
+                ('board_key', '=', current_board_key)
+            ])
+            for record in cache_records:
+                state_vals = {field_name: record[field_name]
+                              for field_name in RESULT_FIELDS}
+                RESULT_CACHE.set((record.script_hash, module_version,
+                                  current_board_key), state_vals)
+            results = [RESULT_CACHE.get(key) for key in keys]
+
+        return [dict(result) if result is not None else None
+                for result in results]
+
+    @api.model
+    def store(self, results: list, board: Board = None):
+        """Cache simulation results.
+
+        Args:
+            results (list): (script text, final state and report log values)
+            board (Board, optional): table of the simulation. Defaults to the
+            5x5 table.
+        """
+        new_vals = dict()
+        for input_cmd, state_vals in results:
+            key = self._get_cache_key(input_cmd, board)
+            state_vals = {field_name: state_vals[field_name]
+                          for field_name in RESULT_FIELDS}
+            RESULT_CACHE.set(key, state_vals)
+            new_vals[key] = state_vals
+
+        if not new_vals or not self._is_persistent():
+            return
+        # Skip result already in the persistent table
+        existing_hashes = set(self.sudo().search([
+            ('script_hash', 'in', [key[0] for key in new_vals]),
+            ('module_version', '=', self._get_module_version()),
+            ('board_key', '=', (board or DEFAULT_BOARD).key)
+        ]).mapped('script_hash'))
+        try:
+            with self.env.cr.savepoint():
+                self.sudo().create([
+                    dict(state_vals, script_hash=key[0], module_version=key[1],
+                         board_key=key[2])
+                    for key, state_vals in new_vals.items()
+                    if key[0] not in existing_hashes])
+        except psycopg2.IntegrityError:
+            # Already stored by a concurrent transaction
+            pass
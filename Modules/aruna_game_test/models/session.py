@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+from ..utils.exceptions import CommandLineError
+from ..utils.session import simulate_session
+
+
+class aruna_game_test_session(models.Model):
+    _name = 'aruna_game_test.session'
+    _description = 'Aruna Game Table Session'
+
+    name = fields.Char(string='Name', required=True)
+    board_id = fields.Many2one(
+        'aruna_game_test.board', string='Table', required=True,
+        ondelete='restrict',
+        default=lambda self: self.env['aruna_game_test.aruna_game_test']
+        ._default_board())
+    input_cmd = fields.Text(
+        string='Input Command',
+        help='One "ROBOT N COMMAND" per line, example "ROBOT 1 MOVE".')
+    robot_ids = fields.One2many(
+        'aruna_game_test.aruna_game_test', 'session_id', string='Robots')
+    robot_count = fields.Integer(
+        string='Robot Count', compute='_compute_robot_count')
+
+    @api.depends('robot_ids')
+    def _compute_robot_count(self):
+        for record in self:
+            record.robot_count = len(record.robot_ids)
+
+    def execute_session_input(self):
+        """ Execute the session text input."""
+        self.ensure_one()
+        self.execute_commands(self.input_cmd)
+
+    def execute_commands(self, input_cmd: str):
+        """Execute commands addressed to the robots of the session.
+        Every robot state is loaded once, the commands are simulated in memory
+        with an occupancy grid, then only changed robots are written and new
+        robots are created at once.
+
+        Args:
+            input_cmd (str): "ROBOT N COMMAND" text, one per line.
+
+        Raises:
+            ValidationError: when any command failed, nothing is written.
+        """
+        self.ensure_one()
+        robots = self.robot_ids
+        robot_by_number = {robot.robot_number: robot for robot in robots}
+        start_states = {robot_number: robot._get_game_state()
+                        for robot_number, robot in robot_by_number.items()}
+        board = self.env['aruna_game_test.board']._get_board(self.board_id.id)
+
+        try:
+            final_states = simulate_session(input_cmd, board, {
+                robot_number: state.copy()
+                for robot_number, state in start_states.items()})
+        except CommandLineError as err:
+            self.env['input.command.wizard']._raise_command_error(
+                err.error_data)
+
+        new_vals = []
+        for robot_number, state in final_states.items():
+            state_vals = state.to_vals()
+            if robot_number not in robot_by_number:
+                new_vals.append(dict(
+                    state_vals, session_id=self.id, robot_number=robot_number,
+                    board_id=self.board_id.id))
+            elif start_states[robot_number].to_vals() != state_vals:
+                robot_by_number[robot_number].write(state_vals)
+        return robots.create(new_vals)
@@ -0,0 +1,120 @@
+odoo.define('aruna_game_test.board_widget', function (require) {
+"use strict";
+
+var AbstractField = require('web.AbstractField');
+var fieldRegistry = require('web.field_registry');
+
+// Arrow symbol mapping, same as DIRECTION_ARROW in utils/constants.py
+var DIRECTION_ARROW = {
+    north: '↑',
+    east: '→',
+    south: '↓',
+    west: '←',
+};
+
+// Number of rendered board kept between form reloads
+var GRID_CACHE_SIZE = 20;
+// Rendered board keyed by record, the form is rendered again after every
+// button click, the grid is reused and only changed cells are updated.
+var gridCache = new Map();
+
+/**
+ * Render the robot position from the compact JSON payload built by
+ * utils/board_view.py, only the viewport around the robot is rendered.
+ */
+var BoardWidget = AbstractField.extend({
+    className: 'o_aruna_board',
+    supportedFieldTypes: ['text', 'char'],
+
+    //--------------------------------------------------------------------------
+    // Private
+    //--------------------------------------------------------------------------
+
+    /**
+     * @override
+     */
+    _render: function () {
+        var payload = this.value ? JSON.parse(this.value) : null;
+        if (!payload) {
+            this.$el.empty();
+            return;
+        }
+        var cacheKey = this.model + ',' + this.res_id + ',' + this.name;
+        var grid = gridCache.get(cacheKey);
+        if (grid && grid.layoutKey === payload.layout_key) {
+            this._updateGrid(grid, payload);
+            gridCache.delete(cacheKey);
+        } else {
+            grid = this._buildGrid(payload);
+        }
+        gridCache.set(cacheKey, grid);
+        if (gridCache.size > GRID_CACHE_SIZE) {
+            gridCache.delete(gridCache.keys().next().value);
+        }
+        this.$el.empty().append(grid.table);
+    },
+    /**
+     * Build the viewport table, cells are indexed by "x,y".
+     *
+     * @private
+     * @param {Object} payload
+     * @returns {Object} grid
+     */
+    _buildGrid: function (payload) {
+        var viewport = payload.viewport;
+        var table = document.createElement('table');
+        table.className = 'table table-bordered o_aruna_board_table';
+        var tbody = document.createElement('tbody');
+        var cells = {};
+        for (var y = viewport[3]; y >= viewport[1]; y--) {
+            var row = document.createElement('tr');
+            for (var x = viewport[0]; x <= viewport[2]; x++) {
+                var cell = document.createElement('td');
+                cell.className = 'text-center o_aruna_board_cell';
+                if (x === 0 && y === 0) {
+                    cell.classList.add('o_aruna_board_origin');
+                }
+                cells[x + ',' + y] = cell;
+                row.appendChild(cell);
+            }
+            tbody.appendChild(row);
+        }
+        table.appendChild(tbody);
+        payload.obstacles.forEach(function (obstacle) {
+            cells[obstacle[0] + ',' + obstacle[1]].classList.add('o_aruna_board_obstacle');
+        });
+
+        var grid = {
+            layoutKey: payload.layout_key,
+            table: table,
+            cells: cells,
+            robotKey: null,
+        };
+        this._updateGrid(grid, payload);
+        return grid;
+    },
+    /**
+     * Move the robot arrow, other cells are not touched.
+     *
+     * @private
+     * @param {Object} grid
+     * @param {Object} payload
+     */
+    _updateGrid: function (grid, payload) {
+        var robot = payload.robot;
+        var robotKey = robot ? robot.x + ',' + robot.y : null;
+        if (grid.robotKey && grid.robotKey !== robotKey) {
+            grid.cells[grid.robotKey].textContent = '';
+        }
+        if (robotKey && grid.cells[robotKey]) {
+            grid.cells[robotKey].textContent = DIRECTION_ARROW[robot.facing] || '';
+        }
+        grid.robotKey = robotKey && grid.cells[robotKey] ? robotKey : null;
+    },
+});
+
+fieldRegistry.add('aruna_board', BoardWidget);
+
+return BoardWidget;
+
+});
@@ -1,3 +1,19 @@
 from . import test_positioning
 from . import test_command_line_input
 from . import test_negative_command_line_input
+from . import test_simulation_engine
+from . import test_batch_simulation
+from . import test_batch_input
+from . import test_result_cache
+from . import test_checkpoint
+from . import test_board
+from . import test_obstacle
+from . import test_session
+from . import test_stored_report
+from . import test_recordset_command
+from . import test_journal
+from . import test_trajectory
+from . import test_job
+from . import test_http_simulation
+from . import test_dry_run
+from . import test_report_log
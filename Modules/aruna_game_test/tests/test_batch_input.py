@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+from odoo.tests.common import TransactionCase, tagged
+from ..models.models import aruna_game_test
+from ..utils import parallel
+from ..utils.result_cache import RESULT_CACHE
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_batch_input', '-at_install', 'post_install')
+class TestBatchInput(TransactionCase):
+    def setUp(self):
+        super(TestBatchInput, self).setUp()
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+        self.game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+
+    def test_1_batch_with_delimiter(self):
+        # Scripts separated by the delimiter, every script creates a game record
+        input_cmd = """
+        PLACE 0,0,NORTH
+        MOVE
+        REPORT
+        ---
+        PLACE 1,2,EAST
+        MOVE
+        MOVE
+        LEFT
+        MOVE
+        REPORT
+        """
+        wizard = self.wizard_model.create({
+            'input_cmd': input_cmd,
+            'is_batch': True
+        })
+        result = wizard.execute_batch_input()
+
+        # All scripts succeeded, list of game records is returned
+        self.assertEqual(result.get('res_model'),
+                         'aruna_game_test.aruna_game_test')
+        game_records = self.game_model.search(result.get('domain'))
+        self.assertEqual(sorted(game_records.mapped('report')),
+                         ['0,1,NORTH', '3,3,NORTH'])
+
+    def test_2_batch_with_error(self):
+        # Failed script does not abort the batch, it is reported in the summary
+        input_cmd = """
+        PLACE 0,0,NORTH
+        MOVE
+        ---
+        PLACE 1,2,NORTH
+        GHJ
+        """
+        wizard = self.wizard_model.create({
+            'input_cmd': input_cmd,
+            'is_batch': True
+        })
+        result = wizard.execute_batch_input()
+
+        self.assertEqual(result.get('res_model'), 'input.command.wizard')
+        self.assertEqual(len(wizard.batch_game_ids), 1)
+        self.assertIn('1 succeeded, 1 failed', wizard.batch_summary)
+        self.assertIn('Script 2', wizard.batch_summary)
+        self.assertIn('Error on Command at Line 2', wizard.batch_summary)
+
+    def test_3_batch_with_csv_file(self):
+        # Every CSV row is a script
+        csv_data = 'script\n"PLACE 0,0,NORTH\nMOVE"\n"PLACE 4,4,WEST\nMOVE"\n'
+        wizard = self.wizard_model.create({
+            'is_batch': True,
+            'batch_file': base64.b64encode(csv_data.encode()),
+            'batch_filename': 'scripts.csv'
+        })
+        wizard.execute_batch_input()
+
+        self.assertEqual(
+            sorted(wizard.batch_game_ids.mapped('x_pos')), [0, 3])
+
+    def test_4_batch_with_process_pool(self):
+        # Process pool result should be the same as the sequential execution
+        input_cmd = '\n---\n'.join([
+            'PLACE {},{},EAST\nMOVE\nLEFT\nMOVE\nREPORT'.format(
+                index % 4, index % 3)
+            for index in range(20)])
+
+        results = []
+        for use_process_pool in [False, True]:
+            wizard = self.wizard_model.create({
+                'input_cmd': input_cmd,
+                'is_batch': True,
+                'use_process_pool': use_process_pool,
+                'pool_size': 2,
+                'pool_chunk_size': 3
+            })
+            # Scripts are simulated again, not read from the result cache.
+            # Test server could run HTTP threads, fork as a prefork worker.
+            RESULT_CACHE.clear()
+            with patch.object(parallel, 'can_fork', return_value=True), \
+                    patch.object(parallel, 'ProcessPoolExecutor',
+                                 wraps=ProcessPoolExecutor) as executor:
+                wizard.execute_batch_input()
+            self.assertEqual(executor.called, use_process_pool)
+            results.append(wizard.batch_game_ids.sorted('id').mapped('report'))
+
+        self.assertEqual(len(results[0]), 20)
+        self.assertEqual(results[0], results[1])
+
+    def test_5_no_fork_with_threads(self):
+        # Threaded server is not forked, scripts are simulated in process
+        event = threading.Event()
+        thread = threading.Thread(target=event.wait)
+        thread.start()
+        try:
+            with patch.object(parallel, 'ProcessPoolExecutor',
+                              side_effect=AssertionError('Process forked')):
+                results = parallel.simulate_scripts(
+                    ['PLACE 0,0,NORTH\nMOVE'] * 4, pool_size=2)
+        finally:
+            event.set()
+            thread.join()
+        self.assertEqual([state_vals['y_pos'] for state_vals, error_data,
+                          reports in results], [1] * 4)
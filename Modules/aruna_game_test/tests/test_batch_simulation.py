@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+from unittest import skipIf
+from odoo.tests.common import TransactionCase, tagged
+from ..models.models import aruna_game_test
+from ..utils.batch_simulator import np
+from ..utils.constants import eObjectFacing
+
+
+@tagged('aruna', 'test_batch_simulation', '-at_install', 'post_install')
+@skipIf(np is None, 'numpy is not installed')
+class TestBatchSimulation(TransactionCase):
+    def setUp(self):
+        super(TestBatchSimulation, self).setUp()
+        self.game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+
+    def test_1_same_script_many_robots(self):
+        # Run the same script from different placed robot, the robot at 0,4
+        # would fall on the second MOVE (line 3).
+        input_cmd = """
+        MOVE
+        RIGHT
+        MOVE
+        REPORT
+        """
+        start_state_list = [
+            {'x_pos': 0, 'y_pos': 0, 'is_placed': True,
+             'is_properly_placed': True},
+            {'x_pos': 4, 'y_pos': 3, 'is_placed': True,
+             'is_properly_placed': True},
+            {'x_pos': -5, 'y_pos': -5, 'is_placed': True,
+             'is_properly_placed': False},
+        ]
+        results = self.game_model.simulate_batch(
+            [input_cmd], start_state_list)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['state']['x_pos'], 1)
+        self.assertEqual(results[0]['state']['y_pos'], 1)
+        self.assertEqual(results[0]['state']['facing'],
+                         eObjectFacing.east.name)
+        self.assertTrue(results[0]['state']['is_reported'])
+        self.assertFalse(results[0]['error_line'])
+
+        self.assertEqual(results[1]['error_line'], 3)
+        self.assertEqual(results[1]['state']['x_pos'], 5)
+
+        self.assertEqual(results[2]['state']['x_pos'], -5)
+        self.assertFalse(results[2]['error_line'])
+
+    def test_2_script_per_robot(self):
+        # Each robot run its own script from the game record state.
+        games = self.game_model.create([{}, {}])
+        results = games.simulate_batch([
+            'PLACE 0,0,NORTH\nMOVE\nREPORT',
+            'PLACE 1,2,EAST\nMOVE\nGHJ'
+        ])
+
+        self.assertEqual(results[0]['state']['y_pos'], 1)
+        self.assertEqual(results[1]['error_line'], 3)
+        self.assertEqual(results[1]['error_reason'], 'Invalid command "GHJ"')
+
+    def test_3_shared_script_table(self):
+        # A single script is run through its transition table, results are
+        # the same as simulating the script for each robot
+        input_cmd = 'MOVE\nPLACE 1,1,NORTH\nMOVE\nLEFT\nMOVE\nMOVE\nREPORT'
+        start_state_list = [
+            {},
+            {'x_pos': 2, 'y_pos': 2, 'facing': 'west', 'is_placed': True,
+             'is_properly_placed': True},
+            {'x_pos': 0, 'y_pos': 4, 'facing': 'north', 'is_placed': True,
+             'is_properly_placed': True},
+        ]
+        self.assertEqual(
+            self.game_model.simulate_batch([input_cmd], start_state_list),
+            self.game_model.simulate_batch(
+                [input_cmd] * len(start_state_list), start_state_list))
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import json
+from unittest import skipIf
+from odoo.exceptions import ValidationError
+from odoo.tests.common import TransactionCase, tagged
+from ..models.models import aruna_game_test
+from ..utils.batch_simulator import np
+from ..utils.board_view import HTML_CACHE, get_viewport
+from ..utils.constants import eObjectFacing
+from ..utils.exceptions import TestingException
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_board', '-at_install', 'post_install')
+class TestBoard(TransactionCase):
+    def setUp(self):
+        super(TestBoard, self).setUp()
+        self.board_model = self.env['aruna_game_test.board']
+        self.game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+        # 10 cells on the x axis, 3 cells on the y axis
+        self.wide_board = self.board_model.create({
+            'name': '10x3 Table',
+            'width': 10,
+            'height': 3
+        })
+
+    def test_1_default_board(self):
+        # New game use the default 5x5 table
+        game_data = self.game_model.create({})
+        self.assertEqual(game_data.board_id,
+                         self.env.ref('aruna_game_test.board_default'))
+        board = game_data._get_board()
+        self.assertEqual((board.max_x, board.max_y), (4, 4))
+
+    def test_2_form_command_on_board(self):
+        # Robot could move beyond the 5x5 limit on the x axis, but not on the
+        # y axis.
+        game_data = self.game_model.create({
+            'x_pos': 8,
+            'y_pos': 2,
+            'facing': eObjectFacing.east.name,
+            'board_id': self.wide_board.id
+        })
+        game_data.place_robot()
+        self.assertTrue(game_data.is_properly_placed)
+        game_data.move_robot()
+        self.assertEqual(game_data.x_pos, 9)
+        with self.assertRaises(ValidationError):
+            game_data.move_robot()
+
+    def test_3_wizard_command_on_board(self):
+        action = self.wizard_model.create({
+            'board_id': self.wide_board.id,
+            'input_cmd': 'PLACE 0,0,EAST\nMOVE\nMOVE\nMOVE\nMOVE\nMOVE\nMOVE'
+        }).execute_input()
+        game_data = self.game_model.browse(action['res_id'])
+        self.assertEqual(game_data.x_pos, 6)
+        self.assertEqual(game_data.board_id, self.wide_board)
+
+        with self.assertRaises(TestingException) as error:
+            self.wizard_model.with_context(is_testing=True).create({
+                'board_id': self.wide_board.id,
+                'input_cmd': 'PLACE 0,0,NORTH\nMOVE\nMOVE\nMOVE'
+            }).execute_input()
+        self.assertEqual(error.exception.error_data['line'], 4)
+
+    def test_4_cached_bounds(self):
+        # Bounds are cached per board and refreshed when the size change
+        self.assertEqual(self.board_model._get_board(self.wide_board.id).max_x, 9)
+        self.wide_board.write({'width': 20})
+        self.assertEqual(self.board_model._get_board(self.wide_board.id).max_x, 19)
+
+    @skipIf(np is None, 'numpy is not installed')
+    def test_5_batch_on_many_boards(self):
+        # Robots on different tables are simulated with their own limits
+        games = self.game_model.create([
+            {'board_id': self.wide_board.id},
+            {}
+        ])
+        results = games.simulate_batch(['PLACE 3,0,EAST\nMOVE\nMOVE'])
+        self.assertEqual(results[0]['state']['x_pos'], 5)
+        self.assertFalse(results[0]['error_line'])
+        self.assertEqual(results[1]['error_line'], 3)
+
+    def test_6_board_widget_data(self):
+        # Widget data only contain the viewport around the robot, its size
+        # does not depend on the table size.
+        large_board = self.board_model.create({
+            'name': '1000x1000 Table',
+            'width': 1000,
+            'height': 1000
+        })
+        large_board.add_obstacle_ranges([(601, 600, 601, 600), (10, 10, 10, 10)])
+        game_data = self.game_model.create({
+            'x_pos': 600,
+            'y_pos': 600,
+            'facing': eObjectFacing.east.name,
+            'board_id': large_board.id
+        })
+        game_data.place_robot()
+        payload = json.loads(game_data.board_data)
+        x_from, y_from, x_to, y_to = payload['viewport']
+        self.assertEqual((x_to - x_from + 1, y_to - y_from + 1), (25, 25))
+        self.assertTrue(x_from <= 600 <= x_to and y_from <= 600 <= y_to)
+        self.assertEqual(payload['obstacles'], [[601, 600]])
+        self.assertEqual(payload['robot'],
+                         {'x': 600, 'y': 600, 'facing': eObjectFacing.east.name})
+
+        # Layout is kept while the robot stay in the viewport
+        game_data.with_context(turn_direction='left').turn_robot()
+        game_data.move_robot()
+        self.assertEqual(json.loads(game_data.board_data)['layout_key'],
+                         payload['layout_key'])
+
+    def test_7_viewport_html(self):
+        # Server rendered board is limited to the viewport and cached
+        large_board = self.board_model.create({
+            'name': '1000x1000 Table',
+            'width': 1000,
+            'height': 1000
+        })
+        game_data = self.game_model.create({
+            'x_pos': 500,
+            'y_pos': 500,
+            'board_id': large_board.id
+        })
+        html_data = game_data.html_data
+        self.assertEqual(html_data.count('<tr>'), 25)
+        self.assertEqual(html_data.count('<td'), 625)
+
+        zoomed_html = game_data.with_context(
+            board_viewport_size=10, board_pan_x=-5).html_data
+        self.assertEqual(zoomed_html.count('<td'), 100)
+
+        key = (large_board._get_board(large_board.id).key,
+               get_viewport(large_board._get_board(large_board.id), 500, 500),
+               500, 500, eObjectFacing.north.name)
+        self.assertTrue(HTML_CACHE.get(key))
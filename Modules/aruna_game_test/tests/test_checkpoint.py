@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase, tagged
+from ..utils.checkpoint import iter_prefix_hashes, simulate_with_checkpoints
+from ..utils.result_cache import RESULT_CACHE
+from ..utils.simulation import simulate_script
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_checkpoint', '-at_install', 'post_install')
+class TestCheckpoint(TransactionCase):
+    def setUp(self):
+        super(TestCheckpoint, self).setUp()
+        RESULT_CACHE.clear()
+        self.env['ir.config_parameter'].sudo().set_param(
+            'aruna_game_test.checkpoint_interval', 4)
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+        self.checkpoint_model = self.env['aruna_game_test.checkpoint']
+        self.command_list = ['PLACE 0,0,NORTH', 'MOVE', 'RIGHT', 'MOVE',
+                             'MOVE', 'LEFT', 'MOVE', 'REPORT', 'RIGHT', 'MOVE']
+
+    def _execute(self, command_list):
+        action = self.wizard_model.create({
+            'input_cmd': '\n'.join(command_list)
+        }).execute_input()
+        return self.env['aruna_game_test.aruna_game_test'].browse(
+            action['res_id'])
+
+    def test_1_prefix_hash(self):
+        # Same prefix give the same hash, case and whitespace are ignored
+        hashes = dict(iter_prefix_hashes(self.command_list, 4))
+        self.assertEqual(list(hashes), [4, 8])
+        edited_hashes = dict(iter_prefix_hashes(
+            [' place 0,0,north'] + self.command_list[1:5] + ['RIGHT'], 4))
+        self.assertEqual(hashes[4], edited_hashes[4])
+
+    def test_2_resume_from_checkpoint(self):
+        # Resumed execution end in the same state as a full execution
+        hashes = dict(iter_prefix_hashes(self.command_list, 4))
+        state, checkpoints = simulate_with_checkpoints(
+            self.command_list, hashes, 4)
+        self.assertEqual([checkpoint.line for checkpoint in checkpoints], [4, 8])
+        # Checkpoint keep the REPORT output of its own lines
+        self.assertEqual([checkpoint.reports for checkpoint in checkpoints],
+                         [[], [(8, '2,2,NORTH')]])
+
+        edited_list = self.command_list[:8] + ['LEFT', 'LEFT', 'MOVE']
+        edited_hashes = dict(iter_prefix_hashes(edited_list, 4))
+        resumed_state, dummy = simulate_with_checkpoints(
+            edited_list, edited_hashes, 4, resume_checkpoint=checkpoints[1])
+        self.assertEqual(resumed_state.to_vals(),
+                         simulate_script('\n'.join(edited_list)).to_vals())
+
+    def test_3_wizard_reuse_checkpoint(self):
+        # Edited script reuse the checkpoints of the first run
+        game_data = self._execute(self.command_list)
+        self.assertEqual(game_data.checkpoint_ids.mapped('line'), [4, 8])
+
+        edited_list = self.command_list[:9] + ['LEFT', 'MOVE']
+        edited_game = self._execute(edited_list)
+        self.assertEqual(edited_game.checkpoint_ids.mapped('line'), [4, 8])
+        self.assertEqual(edited_game.checkpoint_ids.mapped('prefix_hash'),
+                         game_data.checkpoint_ids.mapped('prefix_hash'))
+        expected_vals = simulate_script('\n'.join(edited_list)).to_vals()
+        self.assertEqual(edited_game.x_pos, expected_vals['x_pos'])
+        self.assertEqual(edited_game.y_pos, expected_vals['y_pos'])
+        self.assertEqual(edited_game.facing, expected_vals['facing'])
+        # REPORT output of the reused lines is replayed from the checkpoints
+        self.assertEqual(edited_game.report_log, '2,2,NORTH')
+        self.assertEqual(edited_game.report_count, 1)
+
+    def test_4_state_at_line(self):
+        game_data = self._execute(self.command_list)
+        for line in range(len(self.command_list) + 1):
+            expected_vals = simulate_script(
+                '\n'.join(self.command_list[:line])).to_vals()
+            result = game_data.get_state_at_line(line)
+            self.assertEqual(result['state'], expected_vals)
+            self.assertFalse(result['error'])
+
+    def test_5_state_at_line_without_own_checkpoint(self):
+        # Second run of the same script is cached, it has no checkpoint but
+        # still resume from the checkpoints of the first run
+        self._execute(self.command_list)
+        cached_game = self._execute(self.command_list)
+        self.assertFalse(cached_game.checkpoint_ids)
+        expected_vals = simulate_script(
+            '\n'.join(self.command_list[:9])).to_vals()
+        self.assertEqual(cached_game.get_state_at_line(9)['state'],
+                         expected_vals)
+
+    def test_6_line_state_wizard_on_failed_script(self):
+        # Failed script has no game record, the wizard replay the text input
+        command_list = self.command_list[:8] + ['MOVE', 'MOVE', 'MOVE', 'MOVE']
+        wizard = self.env['line.state.wizard'].create({
+            'input_cmd': '\n'.join(command_list),
+            'line': 8
+        })
+        wizard.action_compute_state()
+        self.assertEqual((wizard.x_pos, wizard.y_pos, wizard.facing),
+                         (2, 2, 'north'))
+        self.assertFalse(wizard.error_message)
+
+        wizard.write({'line': 12})
+        wizard.action_compute_state()
+        self.assertIn('Line 11', wizard.error_message)
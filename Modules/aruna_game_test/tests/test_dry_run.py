@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+from unittest.mock import patch
+from odoo.tests.common import TransactionCase, tagged
+from ..models.models import aruna_game_test
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_dry_run', '-at_install', 'post_install')
+class TestDryRun(TransactionCase):
+    def setUp(self):
+        super(TestDryRun, self).setUp()
+        self.game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+
+    def test_1_dry_run_without_write(self):
+        input_cmd = 'PLACE 0,0,NORTH\nREPORT\nMOVE\nRIGHT\nREPORT\nMOVE'
+        self.env['base'].flush()
+        queries = []
+        execute = self.env.cr.execute
+
+        def spy_execute(query, params=None, log_exceptions=True):
+            queries.append(str(query).strip().upper())
+            return execute(query, params, log_exceptions)
+
+        with patch.object(self.env.cr, 'execute', spy_execute):
+            result = self.game_model.dry_run(input_cmd)
+        self.assertFalse([query for query in queries
+                          if query.startswith(('INSERT', 'UPDATE', 'DELETE'))])
+
+        self.assertEqual(result['reports'], [(2, '0,0,NORTH'), (5, '0,1,EAST')])
+        self.assertEqual((result['state']['x_pos'], result['state']['y_pos']),
+                         (1, 1))
+        self.assertFalse(result['error'])
+
+    def test_2_dry_run_error(self):
+        result = self.game_model.dry_run(
+            'PLACE 0,0,SOUTH\nREPORT\nMOVE\nREPORT')
+        self.assertEqual(result['reports'], [(2, '0,0,SOUTH')])
+        self.assertEqual(result['error']['line'], 3)
+
+    def test_3_wizard_dry_run(self):
+        # Only the wizard itself is saved, no simulation record is written
+        model_names = ['aruna_game_test.aruna_game_test',
+                       'aruna_game_test.journal', 'aruna_game_test.result_cache',
+                       'aruna_game_test.checkpoint']
+        record_counts = [self.env[model_name].sudo().search_count([])
+                         for model_name in model_names]
+        wizard = self.wizard_model.create({
+            'input_cmd': 'PLACE 1,1,EAST\nMOVE\nREPORT',
+            'is_journal_enabled': True
+        })
+        action = wizard.action_dry_run()
+        self.assertEqual([self.env[model_name].sudo().search_count([])
+                          for model_name in model_names], record_counts)
+        self.assertEqual(action['context']['default_dry_run_result'],
+                         'Final Position: 2,1,EAST\nLine 3: 2,1,EAST')
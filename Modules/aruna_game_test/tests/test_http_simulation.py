@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+import json
+from odoo.tests.common import TransactionCase, HttpCase, tagged
+from ..utils.parallel import iter_simulation_results
+from ..utils.result_cache import RESULT_CACHE
+from ..utils.script_source import read_json_scripts
+
+
+@tagged('aruna', 'test_http_simulation', '-at_install', 'post_install')
+class TestJsonScripts(TransactionCase):
+    def test_1_read_json_scripts(self):
+        scripts, options = read_json_scripts(json.dumps({
+            'scripts': ['PLACE 0,0,NORTH', {'name': 'B', 'script': 'MOVE'}],
+            'persist': False
+        }).encode())
+        self.assertEqual(scripts, [('Script 1', 'PLACE 0,0,NORTH'), ('B', 'MOVE')])
+        self.assertEqual(options, {'persist': False})
+
+        scripts, options = read_json_scripts(
+            b'"PLACE 0,0,NORTH"\n\n{"script": "MOVE"}\n', is_ndjson=True)
+        self.assertEqual(scripts, [('Script 1', 'PLACE 0,0,NORTH'),
+                                   ('Script 2', 'MOVE')])
+        with self.assertRaises(ValueError):
+            read_json_scripts(b'[1]')
+
+    def test_2_iter_simulation_results(self):
+        RESULT_CACHE.clear()
+        results = list(iter_simulation_results(
+            ['PLACE 0,0,NORTH\nMOVE', 'PLACE 0,0,SOUTH\nMOVE']))
+        self.assertEqual(results[0][0]['y_pos'], 1)
+        self.assertIsNone(results[0][1])
+        self.assertIsNone(results[1][0])
+        self.assertEqual(results[1][1]['line'], 2)
+
+
+@tagged('aruna', 'test_http_simulation', '-at_install', 'post_install')
+class TestHttpSimulation(HttpCase):
+    def _post(self, body: str, url: str, content_type: str):
+        self.authenticate('admin', 'admin')
+        response = self.url_open(url, data=body.encode(),
+                                 headers={'Content-Type': content_type})
+        self.assertEqual(response.status_code, 200)
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_1_stream_without_persist(self):
+        game_count = self.env['aruna_game_test.aruna_game_test'].search_count([])
+        results = self._post(
+            '"PLACE 0,0,NORTH\\nMOVE\\nREPORT"\n"PLACE 0,0,SOUTH\\nMOVE"\n',
+            '/aruna_game_test/simulate?persist=0', 'application/x-ndjson')
+        self.assertEqual(len(results), 2)
+        self.assertTrue(results[0]['ok'])
+        self.assertEqual(results[0]['report'], '0,1,NORTH')
+        self.assertFalse(results[1]['ok'])
+        self.assertEqual(results[1]['error']['line'], 2)
+        self.assertEqual(
+            self.env['aruna_game_test.aruna_game_test'].search_count([]),
+            game_count)
+
+    def test_2_persist(self):
+        results = self._post(json.dumps({
+            'scripts': ['PLACE 1,1,EAST\nMOVE\nREPORT', 'PLACE 0,0,WEST\nMOVE']
+        }), '/aruna_game_test/simulate', 'application/json')
+        self.assertTrue(results[0]['game_id'])
+        self.assertNotIn('game_id', results[1])
+        game_data = self.env['aruna_game_test.aruna_game_test'].browse(
+            results[0]['game_id'])
+        self.assertEqual(game_data.x_pos, 2)
+        self.assertEqual(game_data.report_log, '2,1,EAST')
+        self.assertEqual(game_data.report_count, 1)
+
+    def test_3_invalid_options(self):
+        self.authenticate('admin', 'admin')
+        for url in ['/aruna_game_test/simulate?board_id=abc',
+                    '/aruna_game_test/simulate?board_id=-1',
+                    '/aruna_game_test/simulate?persist=maybe']:
+            response = self.url_open(
+                url, data=b'"PLACE 0,0,NORTH"',
+                headers={'Content-Type': 'application/x-ndjson'})
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('error', response.json())
+
+    def test_4_form_body_refused(self):
+        # Form body could come from another site, there is no CSRF token
+        self.authenticate('admin', 'admin')
+        game_count = self.env['aruna_game_test.aruna_game_test'].search_count([])
+        response = self.url_open('/aruna_game_test/simulate',
+                                 data={'script': 'PLACE 0,0,NORTH'})
+        self.assertEqual(response.status_code, 415)
+        self.assertEqual(
+            self.env['aruna_game_test.aruna_game_test'].search_count([]),
+            game_count)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+from unittest.mock import patch
+from odoo.tests.common import TransactionCase, tagged
+from ..utils.simulation import simulate_script
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_job', '-at_install', 'post_install')
+class TestJob(TransactionCase):
+    def setUp(self):
+        super(TestJob, self).setUp()
+        self.env['ir.config_parameter'].sudo().set_param(
+            'aruna_game_test.job_chunk_size', 3)
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+        self.job_model = self.env['aruna_game_test.job']
+        self.command_list = ['PLACE 0,0,NORTH', 'MOVE', 'RIGHT', 'MOVE',
+                             'MOVE', 'LEFT', 'MOVE', 'REPORT', 'RIGHT', 'MOVE']
+
+    def _queue(self, command_list):
+        action = self.wizard_model.create({
+            'input_cmd': '\n'.join(command_list),
+            'is_background': True
+        }).execute_input()
+        return self.job_model.browse(action['res_id'])
+
+    def test_1_process_job(self):
+        job_data = self._queue(self.command_list)
+        self.assertEqual(job_data.state, 'queued')
+        # Lines are counted by the cron, not when the job is queued
+        self.assertEqual(job_data.line_count, 0)
+
+        self.job_model._cron_process_jobs()
+        self.assertEqual(job_data.state, 'done')
+        self.assertEqual(job_data.line_count, 10)
+        self.assertEqual(job_data.line_done, 10)
+        self.assertEqual(job_data.progress, 100.0)
+        expected_vals = simulate_script('\n'.join(self.command_list)).to_vals()
+        game_data = job_data.game_id
+        self.assertEqual(
+            (game_data.x_pos, game_data.y_pos, game_data.facing),
+            (expected_vals['x_pos'], expected_vals['y_pos'],
+             expected_vals['facing']))
+        self.assertEqual(game_data.report, '3,2,EAST')
+
+    def test_2_resume_job(self):
+        # A single chunk is executed, as if the worker was killed after the
+        # first commit, the next run continue from the stored state
+        job_data = self._queue(self.command_list)
+        job_data._run_chunk(job_data._iter_lines(), 3)
+        self.assertEqual(job_data.state, 'running')
+        self.assertEqual(job_data.line_done, 3)
+        self.assertEqual((job_data.x_pos, job_data.y_pos, job_data.facing),
+                         (0, 1, 'east'))
+
+        self.job_model._cron_process_jobs()
+        self.assertEqual(job_data.state, 'done')
+        expected_vals = simulate_script('\n'.join(self.command_list)).to_vals()
+        self.assertEqual(job_data.game_id.report, '{},{},{}'.format(
+            expected_vals['x_pos'], expected_vals['y_pos'],
+            expected_vals['facing'].upper()))
+
+    def test_3_failed_job(self):
+        job_data = self._queue(self.command_list + ['MOVE'] * 5)
+        self.job_model._cron_process_jobs()
+        self.assertEqual(job_data.state, 'failed')
+        self.assertFalse(job_data.game_id)
+        self.assertIn('Line 12', job_data.error_message)
+
+    def test_4_broken_job_does_not_block_queue(self):
+        # Unexpected error is rolled back and retried, then the job is failed
+        # and the next job is processed in the same run
+        broken_job = self._queue(self.command_list)
+        next_job = self._queue(self.command_list)
+        job_class = type(self.job_model)
+        run_chunk = job_class._run_chunk
+
+        def _run_chunk(job, lines, chunk_size):
+            if job == broken_job:
+                raise ValueError('Broken input file')
+            return run_chunk(job, lines, chunk_size)
+
+        with patch.object(job_class, '_run_chunk', _run_chunk):
+            self.job_model._cron_process_jobs()
+        self.assertEqual(broken_job.state, 'failed')
+        self.assertEqual(broken_job.attempt_count, 3)
+        self.assertIn('Broken input file', broken_job.error_message)
+        self.assertEqual(next_job.state, 'done')
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import io
+from odoo.tests.common import TransactionCase, tagged
+from ..utils.constants import OP_PLACE, OP_MOVE, OP_RIGHT
+from ..utils.trajectory import record_steps
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_journal', '-at_install', 'post_install')
+class TestJournal(TransactionCase):
+    def setUp(self):
+        super(TestJournal, self).setUp()
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+        self.journal_model = self.env['aruna_game_test.journal']
+
+    def test_1_record_steps(self):
+        # Command before PLACE produce no step, recording stop at the error
+        steps = list(record_steps(
+            ['MOVE', 'PLACE 0,0,NORTH', 'MOVE', 'RIGHT', 'MOVE', 'MOVE',
+             'MOVE', 'MOVE', 'MOVE']))
+        self.assertEqual(steps[:3], [
+            (2, OP_PLACE, 0, 0, 0),
+            (3, OP_MOVE, 0, 1, 0),
+            (4, OP_RIGHT, 0, 1, 1)
+        ])
+        self.assertEqual(steps[-1], (8, OP_MOVE, 4, 1, 1))
+
+    def test_2_journal_in_chunks(self):
+        self.env['ir.config_parameter'].sudo().set_param(
+            'aruna_game_test.journal_chunk_size', 2)
+        input_cmd = 'PLACE 0,0,NORTH\nMOVE\nMOVE\nRIGHT\nMOVE\nREPORT'
+        wizard = self.wizard_model.create({
+            'input_cmd': input_cmd,
+            'is_journal_enabled': True
+        })
+        game_data = self.env['aruna_game_test.aruna_game_test'].browse(
+            wizard.execute_input()['res_id'])
+
+        self.assertEqual(game_data.journal_count, 6)
+        journal_data = self.journal_model.search([('game_id', '=', game_data.id)])
+        self.assertEqual(journal_data.mapped('step'), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(journal_data.mapped('opcode'), [
+            'place', 'move', 'move', 'right', 'move', 'report'])
+        last_step = journal_data[-1]
+        self.assertEqual(
+            (last_step.x_pos, last_step.y_pos, last_step.facing),
+            (game_data.x_pos, game_data.y_pos, game_data.facing))
+
+    def test_3_journal_disabled(self):
+        wizard = self.wizard_model.create({
+            'input_cmd': 'PLACE 0,0,NORTH\nMOVE'
+        })
+        game_data = self.env['aruna_game_test.aruna_game_test'].browse(
+            wizard.execute_input()['res_id'])
+        self.assertEqual(game_data.journal_count, 0)
+
+    def test_4_journal_from_stream(self):
+        # Steps are recorded while the uploaded file is simulated
+        wizard = self.wizard_model.create({'is_journal_enabled': True})
+        game_data = self.env['aruna_game_test.aruna_game_test'].browse(
+            wizard.execute_stream(io.BytesIO(b'PLACE 0,0,NORTH\nMOVE\nLEFT\n'))
+            ['res_id'])
+        self.assertEqual(game_data.journal_count, 3)
@@ -92,3 +92,33 @@ class TestCommandLineInput(TransactionCase):
             # falling due to moving forward
             self.assertEqual([5, 0, eObjectFacing.east.name.upper()],
                              err.error_data.get('position_at_error'))
+
+    def test_4_collect_every_syntax_error(self):
+        # Every invalid line is found before the simulation, even after a
+        # line that would make the robot fall
+        input_cmd = """
+        PLACE 0,0,SOUTH
+        MOVE
+        JUMP
+        PLACE 1,X,NORTH
+        PLACE 1,1,UP
+        LEFT
+        """
+        try:
+            execute_wizard_cli(self, self.wizard_model, input_cmd)
+        except TestingException as err:
+            error_data = err.error_data
+            errors = err.error_data.get('errors')
+            self.assertEqual([error['line'] for error in errors], [3, 4, 5])
+            self.assertEqual(errors[1]['reason'],
+                             'Y_POS should be a integer number')
+            self.assertEqual(errors[2]['reason'],
+                             'Invalid Facing Direction "up"')
+            # First error is kept as the main error
+            self.assertEqual(3, err.error_data.get('line'))
+            self.assertEqual('JUMP', err.error_data.get('command'))
+        else:
+            self.fail('Invalid commands should raise an error.')
+
+        message = self.wizard_model._format_command_error(error_data)
+        self.assertIn('Found 3 invalid command(s)', message)
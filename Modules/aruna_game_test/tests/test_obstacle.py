@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import base64
+from odoo.exceptions import ValidationError
+from odoo.tests.common import TransactionCase, tagged
+from ..models.models import aruna_game_test
+from ..utils.constants import eObjectFacing
+from ..utils.exceptions import TestingException
+from ..utils.obstacle import ObstacleIndex
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_obstacle', '-at_install', 'post_install')
+class TestObstacle(TransactionCase):
+    def setUp(self):
+        super(TestObstacle, self).setUp()
+        self.game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+        self.board_data = self.env['aruna_game_test.board'].create({
+            'name': '10x10 Table',
+            'width': 10,
+            'height': 10
+        })
+        # Wall on x = 5 from y = 0 to y = 3, and a single cell at 2,6
+        self.board_data.add_obstacle_ranges([(5, 0, 5, 3), (2, 6, 2, 6)])
+
+    def test_1_obstacle_index(self):
+        index = ObstacleIndex([(5, 0, 5, 3), (2, 6, 2, 6)])
+        self.assertEqual(len(index), 5)
+        # From 0,1 moving east, 4 moves are available before the wall
+        self.assertEqual(index.free_steps(0, 1, 1, 0, 10), 4)
+        # Wall is further than the run
+        self.assertIsNone(index.free_steps(0, 1, 1, 0, 4))
+        self.assertIsNone(index.free_steps(0, 5, 1, 0, 10))
+        # Overlapping area is merged, cells are not expanded
+        index = ObstacleIndex([(0, 0, 999, 999), (500, 500, 1999, 999)])
+        self.assertEqual(len(index), 1500000)
+        self.assertTrue(index.is_blocked(1999, 999))
+        self.assertFalse(index.is_blocked(1999, 1000))
+        self.assertEqual(index.free_steps(2500, 700, -1, 0, 1000), 500)
+
+    def test_2_load_from_file(self):
+        file_data = base64.b64encode(b'x,y\n7,7\n8,8,9,9\n')
+        self.board_data.write({'obstacle_file': file_data})
+        self.board_data.action_load_obstacle_file()
+        board = self.board_data._get_board(self.board_data.id)
+        self.assertTrue(board.is_blocked(7, 7))
+        self.assertTrue(board.is_blocked(9, 8))
+        self.assertFalse(board.is_blocked(7, 8))
+
+        with self.assertRaises(ValidationError):
+            self.board_data.add_obstacle_ranges([(9, 9, 10, 10)])
+
+    def test_3_form_move_into_obstacle(self):
+        game_data = self.game_model.create({
+            'x_pos': 4,
+            'y_pos': 2,
+            'facing': eObjectFacing.east.name,
+            'board_id': self.board_data.id
+        })
+        game_data.place_robot()
+        with self.assertRaises(ValidationError):
+            game_data.move_robot()
+
+        # Robot placed on an obstacle is handled like outside the table
+        game_data.write({'x_pos': 5, 'y_pos': 0})
+        game_data.place_robot()
+        self.assertFalse(game_data.is_properly_placed)
+
+    def test_4_wizard_move_into_obstacle(self):
+        with self.assertRaises(TestingException) as error:
+            self.wizard_model.with_context(is_testing=True).create({
+                'board_id': self.board_data.id,
+                'input_cmd': 'PLACE 0,3,EAST\nMOVE\nMOVE\nMOVE\nMOVE\nMOVE\nMOVE'
+            }).execute_input()
+        error_data = error.exception.error_data
+        self.assertEqual(error_data['line'], 6)
+        self.assertEqual(error_data['position_before_error'], [4, 3, 'EAST'])
+        self.assertEqual(error_data['position_at_error'], [5, 3, 'EAST'])
+
+        # Moving around the wall is allowed
+        action = self.wizard_model.create({
+            'board_id': self.board_data.id,
+            'input_cmd': 'PLACE 0,4,EAST\nMOVE\nMOVE\nMOVE\nMOVE\nMOVE\nMOVE'
+        }).execute_input()
+        self.assertEqual(self.game_model.browse(action['res_id']).x_pos, 6)
+
+    def test_5_obstacle_index_limit(self):
+        board_data = self.env['aruna_game_test.board'].create({
+            'name': 'Large Table',
+            'width': 1000000,
+            'height': 1000000
+        })
+        board_data.add_obstacle_ranges([(0, 0, 9999, 9999)])
+        board = board_data._get_board(board_data.id)
+        self.assertTrue(board.is_blocked(9999, 0))
+        self.assertFalse(board.is_blocked(10000, 0))
+        # Index size is checked when the obstacle is saved
+        with self.assertRaises(ValidationError):
+            board_data.add_obstacle_ranges([(0, 0, 999999, 999999)])
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase, tagged
+from ..models.models import aruna_game_test
+from ..utils.constants import eObjectFacing, eObjectTurnDirection
+
+
+@tagged('aruna', 'test_recordset_command', '-at_install', 'post_install')
+class TestRecordsetCommand(TransactionCase):
+    def setUp(self):
+        super(TestRecordsetCommand, self).setUp()
+        self.game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+
+    def _create_robots(self, positions: list, board_data=None):
+        return self.game_model.create([{
+            'x_pos': x_pos,
+            'y_pos': y_pos,
+            'facing': facing,
+            'is_placed': True,
+            'is_properly_placed': True,
+            'board_id': board_data.id if board_data else False
+        } for x_pos, y_pos, facing in positions])
+
+    def test_1_move_many_robots(self):
+        game_data = self._create_robots([
+            (0, 0, eObjectFacing.north.name),
+            (2, 2, eObjectFacing.east.name),
+            (4, 4, eObjectFacing.north.name),
+            (0, 3, eObjectFacing.west.name),
+        ])
+        fallen_data = game_data.move_robot()
+
+        # Robot on the edge are not moved, they are reported back
+        self.assertEqual(fallen_data, game_data[2:])
+        self.assertEqual(
+            [(game.x_pos, game.y_pos) for game in game_data],
+            [(0, 1), (3, 2), (4, 4), (0, 3)])
+        game_data.report_location()
+        self.assertEqual(game_data.mapped('report'),
+                         ['0,1,NORTH', '3,2,EAST', '4,4,NORTH', '0,3,WEST'])
+
+    def test_2_move_with_board_and_obstacle(self):
+        board_data = self.env['aruna_game_test.board'].create({
+            'name': '10x3 Table',
+            'width': 10,
+            'height': 3
+        })
+        board_data.add_obstacle_ranges([(6, 0, 6, 0)])
+        game_data = self._create_robots([
+            (4, 0, eObjectFacing.east.name),
+            (5, 0, eObjectFacing.east.name),
+            (5, 2, eObjectFacing.north.name),
+        ], board_data)
+        fallen_data = game_data.move_robot()
+
+        self.assertEqual(fallen_data, game_data[1:])
+        self.assertEqual(
+            [(game.x_pos, game.y_pos) for game in game_data],
+            [(5, 0), (5, 0), (5, 2)])
+
+    def test_3_turn_and_ignore_not_placed(self):
+        game_data = self._create_robots([
+            (1, 1, eObjectFacing.north.name),
+            (1, 1, eObjectFacing.west.name),
+        ])
+        not_placed_data = self.game_model.create({
+            'x_pos': 1,
+            'y_pos': 1,
+            'facing': eObjectFacing.north.name
+        })
+        game_data |= not_placed_data
+
+        game_data.with_context(
+            turn_direction=eObjectTurnDirection.right.name).turn_robot()
+        self.assertEqual(game_data.mapped('facing'), [
+            eObjectFacing.east.name, eObjectFacing.north.name,
+            eObjectFacing.north.name])
+        game_data.with_context(
+            turn_direction=eObjectTurnDirection.left.name).turn_robot()
+        self.assertEqual(game_data.mapped('facing'), [
+            eObjectFacing.north.name, eObjectFacing.west.name,
+            eObjectFacing.north.name])
+
+        self.assertFalse(game_data.move_robot())
+        self.assertEqual(not_placed_data.y_pos, 1)
+        game_data.report_location()
+        self.assertFalse(not_placed_data.is_reported)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase, tagged
+from ..models.models import aruna_game_test
+from ..utils.simulation import DEFAULT_REPORT_PAGE_SIZE
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_report_log', '-at_install', 'post_install')
+class TestReportLog(TransactionCase):
+    def setUp(self):
+        super(TestReportLog, self).setUp()
+        self.game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+
+    def _execute(self, input_cmd: str):
+        action = self.wizard_model.create({
+            'input_cmd': input_cmd
+        }).execute_input()
+        return self.game_model.browse(action['res_id'])
+
+    def test_1_report_log_from_input(self):
+        input_cmd = 'REPORT\nPLACE 0,0,NORTH\nREPORT\nMOVE\nRIGHT\nREPORT\n' \
+            'PLACE 7,7,NORTH\nREPORT\nPLACE 2,2,WEST\nREPORT'
+        game_data = self._execute(input_cmd)
+        # REPORT before PLACE and outside the table is not logged
+        self.assertEqual(game_data.report_log,
+                         '0,0,NORTH\n0,1,EAST\n2,2,WEST')
+        self.assertEqual(game_data.report_count, 3)
+
+        # Cached result hold the REPORT output as well
+        game_data = self._execute(input_cmd)
+        self.assertEqual(game_data.report_log,
+                         '0,0,NORTH\n0,1,EAST\n2,2,WEST')
+        self.assertEqual(game_data.report_count, 3)
+
+        game_data = self._execute('PLACE 0,0,NORTH\nMOVE')
+        self.assertFalse(game_data.report_log)
+        self.assertEqual(game_data.report_count, 0)
+
+    def test_2_report_log_page(self):
+        report_count = DEFAULT_REPORT_PAGE_SIZE * 2 + 40
+        game_data = self._execute(
+            'PLACE 1,2,EAST\n' + '\n'.join(['REPORT'] * report_count))
+        self.assertEqual(game_data.report_count, report_count)
+        self.assertEqual(len(game_data.report_log_page.splitlines()),
+                         DEFAULT_REPORT_PAGE_SIZE)
+        self.assertTrue(game_data.report_log_has_next)
+        self.assertFalse(game_data.report_log_has_previous)
+
+        action = game_data.action_next_report_page()
+        self.assertEqual(action['context']['report_log_page'], 2)
+        last_page_data = game_data.with_context(report_log_page=3)
+        page_lines = last_page_data.report_log_page.splitlines()
+        self.assertEqual(len(page_lines), 40)
+        self.assertEqual(page_lines[0],
+                         '{}. 1,2,EAST'.format(DEFAULT_REPORT_PAGE_SIZE * 2 + 1))
+        self.assertEqual(last_page_data.report_log_page_info, 'Report {} - {} of {}'
+                         .format(DEFAULT_REPORT_PAGE_SIZE * 2 + 1, report_count,
+                                 report_count))
+        self.assertFalse(last_page_data.report_log_has_next)
+        # Page after the last one is not opened
+        action = last_page_data.action_next_report_page()
+        self.assertEqual(action['context']['report_log_page'], 3)
+
+    def test_3_report_log_from_form_command(self):
+        game_data = self.game_model.create({
+            'x_pos': 1,
+            'y_pos': 1,
+            'facing': 'north',
+            'is_placed': True,
+            'is_properly_placed': True
+        })
+        game_data.report_location()
+        game_data.move_robot()
+        game_data.report_location()
+        self.assertEqual(game_data.report_log, '1,1,NORTH\n1,2,NORTH')
+
+        other_data = game_data.copy({'report_log': False, 'report_count': 0})
+        (game_data | other_data).report_location()
+        self.assertEqual(game_data.report_count, 3)
+        self.assertEqual(other_data.report_log, '1,2,NORTH')
+
+    def test_4_report_log_from_job(self):
+        self.env['ir.config_parameter'].sudo().set_param(
+            'aruna_game_test.job_chunk_size', 3)
+        action = self.wizard_model.create({
+            'input_cmd': 'PLACE 0,0,NORTH\nREPORT\nMOVE\nREPORT\nRIGHT\nMOVE\nREPORT',
+            'is_background': True
+        }).execute_input()
+        job_data = self.env['aruna_game_test.job'].browse(action['res_id'])
+        self.env['aruna_game_test.job']._cron_process_jobs()
+        self.assertEqual(job_data.state, 'done')
+        self.assertEqual(job_data.report_count, 3)
+        self.assertEqual(job_data.game_id.report_log,
+                         '0,0,NORTH\n0,1,NORTH\n1,1,EAST')
+        self.assertEqual(job_data.game_id.report_count, 3)
+
+    def test_5_report_log_from_batch(self):
+        input_cmd = 'PLACE 0,0,NORTH\nREPORT\nMOVE\nREPORT\n---\n' \
+            'PLACE 1,1,EAST\nMOVE\n---\nPLACE 2,2,WEST\nREPORT\nMOVE\nMOVE\nMOVE'
+        for use_process_pool in [False, True]:
+            wizard = self.wizard_model.create({
+                'input_cmd': input_cmd,
+                'is_batch': True,
+                'use_process_pool': use_process_pool,
+                'pool_size': 2
+            })
+            wizard.execute_batch_input()
+            game_data = wizard.batch_game_ids.sorted('id')
+            self.assertEqual(game_data.mapped('report_count'), [2, 0])
+            self.assertEqual(game_data[0].report_log, '0,0,NORTH\n0,1,NORTH')
+            self.assertFalse(game_data[1].report_log)
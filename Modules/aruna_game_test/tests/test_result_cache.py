@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase, tagged
+from ..utils.result_cache import RESULT_CACHE, ResultCache, normalize_script
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_result_cache', '-at_install', 'post_install')
+class TestResultCache(TransactionCase):
+    def setUp(self):
+        super(TestResultCache, self).setUp()
+        RESULT_CACHE.clear()
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+        self.cache_model = self.env['aruna_game_test.result_cache']
+
+    def test_1_lru_cache(self):
+        # Least recently used result is dropped first
+        cache = ResultCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(len(cache), 2)
+
+    def test_2_normalized_script_hit(self):
+        # Script is cached after the first run, the same script with different
+        # case and whitespace hit the cache.
+        self.wizard_model.create({
+            'input_cmd': 'PLACE 0,0,NORTH\nMOVE\nREPORT'
+        }).execute_input()
+        self.assertEqual(normalize_script('\n place 0,0,north \n move\nReport\n'),
+                         'PLACE 0,0,NORTH\nMOVE\nREPORT')
+
+        cached_vals = self.cache_model.lookup(['\n place 0,0,north \n move\nReport\n'])[0]
+        self.assertEqual(cached_vals['y_pos'], 1)
+        self.assertTrue(cached_vals['is_reported'])
+
+    def test_3_persistent_cache(self):
+        # With persistent cache enabled, result is read back from the table
+        # when the memory cache is empty.
+        self.env['ir.config_parameter'].sudo().set_param(
+            'aruna_game_test.persistent_result_cache', 'True')
+        self.wizard_model.create({
+            'input_cmd': 'PLACE 1,2,EAST\nMOVE'
+        }).execute_input()
+        self.assertEqual(self.cache_model.sudo().search_count([]), 1)
+
+        RESULT_CACHE.clear()
+        cached_vals = self.cache_model.lookup(['PLACE 1,2,EAST\nMOVE'])[0]
+        self.assertEqual(cached_vals['x_pos'], 2)
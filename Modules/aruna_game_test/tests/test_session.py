@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase, tagged
+from ..utils.board import Board
+from ..utils.constants import eObjectFacing
+from ..utils.exceptions import TestingException, CommandLineError
+from ..utils.session import SessionSimulator, simulate_session
+
+
+@tagged('aruna', 'test_session', '-at_install', 'post_install')
+class TestSession(TransactionCase):
+    def setUp(self):
+        super(TestSession, self).setUp()
+        self.session_data = self.env['aruna_game_test.session'].create({
+            'name': 'Test Session'
+        })
+
+    def test_1_occupancy(self):
+        # Robot 2 could not move into the cell of robot 1
+        simulator = SessionSimulator(Board())
+        simulator.run([
+            'ROBOT 1 PLACE 0,1,NORTH',
+            'ROBOT 2 PLACE 0,0,NORTH',
+        ])
+        self.assertEqual(simulator.occupancy, {(0, 1): 1, (0, 0): 2})
+        with self.assertRaises(CommandLineError) as error:
+            simulator.run(['ROBOT 2 MOVE'], 3)
+        self.assertEqual(error.exception.error_data['line'], 3)
+        self.assertEqual(error.exception.error_data['robot'], 2)
+
+        # Once robot 1 moved away, the cell is free again
+        simulator.run(['ROBOT 1 MOVE', 'ROBOT 2 MOVE'], 4)
+        self.assertEqual(simulator.occupancy, {(0, 2): 1, (0, 1): 2})
+
+    def test_2_place_on_other_robot(self):
+        # Robot placed on another robot is handled like outside the table
+        states = simulate_session("""
+        ROBOT 1 PLACE 2,2,EAST
+        ROBOT 2 PLACE 2,2,WEST
+        ROBOT 2 MOVE
+        """)
+        self.assertTrue(states[1].is_properly_placed)
+        self.assertFalse(states[2].is_properly_placed)
+        self.assertEqual(states[2].x_pos, 2)
+
+    def test_3_execute_session(self):
+        self.session_data.execute_commands("""
+        ROBOT 1 PLACE 0,0,EAST
+        ROBOT 2 PLACE 4,0,WEST
+        ROBOT 1 MOVE
+        ROBOT 2 MOVE
+        ROBOT 1 REPORT
+        """)
+        robots = self.session_data.robot_ids.sorted('robot_number')
+        self.assertEqual(robots.mapped('robot_number'), [1, 2])
+        self.assertEqual(robots.mapped('x_pos'), [1, 3])
+        self.assertEqual(robots[0].report, '1,0,EAST')
+
+        # Robots keep their state in the next execution
+        self.session_data.execute_commands('ROBOT 2 MOVE\nROBOT 2 LEFT')
+        self.assertEqual(robots[1].x_pos, 2)
+        self.assertEqual(robots[1].facing, eObjectFacing.south.name)
+
+        with self.assertRaises(TestingException) as error:
+            self.session_data.with_context(is_testing=True).execute_commands(
+                'ROBOT 1 MOVE')
+        self.assertEqual(error.exception.error_data['line'], 1)
+        self.assertEqual(error.exception.error_data['position_at_error'],
+                         [2, 0, 'EAST'])
+
+    def test_4_invalid_session_command(self):
+        with self.assertRaises(TestingException) as error:
+            self.session_data.with_context(is_testing=True).execute_commands(
+                'ROBOT 1 PLACE 0,0,NORTH\nMOVE')
+        self.assertEqual(error.exception.error_data['line'], 2)
+
+        # Superscript digit (str.isdigit but not int()) and negative number are
+        # not robot numbers
+        for robot_number in ['\u00b2', '-1']:
+            with self.assertRaises(TestingException) as error:
+                self.session_data.with_context(is_testing=True)\
+                    .execute_commands('ROBOT {} MOVE'.format(robot_number))
+            self.assertEqual(error.exception.error_data['line'], 1)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+import io
+from odoo.tests.common import TransactionCase, tagged
+from ..utils.constants import eObjectFacing, OP_PLACE, OP_MOVE, OP_LEFT,\
+    OP_REPORT, OP_ERROR, OP_MOVE_RUN, OP_TURN
+from ..utils.compiler import compile_commands, compile_script
+from ..utils.exceptions import CommandLineError, TestingException
+from ..utils.simulation import CommandSimulator, GameState, simulate_script
+from ..utils.transition_table import StateSpace, build_script_segment
+
+
+@tagged('aruna', 'test_simulation_engine', '-at_install', 'post_install')
+class TestSimulationEngine(TransactionCase):
+
+    def test_1_simulate_in_memory(self):
+        # Commands before PLACE are discarded, the rest is executed on the
+        # in memory state.
+        input_cmd = """
+        MOVE
+        PLACE 1,2,EAST
+        MOVE
+        MOVE
+        LEFT
+        MOVE
+        REPORT
+        """
+        state = simulate_script(input_cmd)
+
+        self.assertEqual(state.x_pos, 3)
+        self.assertEqual(state.y_pos, 3)
+        self.assertEqual(state.facing, eObjectFacing.north.name)
+        self.assertTrue(state.is_properly_placed)
+        self.assertTrue(state.is_reported)
+
+    def test_2_placing_out_of_bound_area(self):
+        # Placing outside the table is allowed, every movement is ignored.
+        state = simulate_script("""
+        PLACE -5,-5,NORTH
+        MOVE
+        RIGHT
+        REPORT
+        """)
+
+        self.assertEqual(state.to_vals(), GameState(
+            -5, -5, eObjectFacing.north.name, True, False, False).to_vals())
+
+    def test_3_error_data(self):
+        # The 5th MOVE makes the robot fall off the table at line 6.
+        input_cmd = """
+        PLACE 0,0,EAST
+        MOVE
+        MOVE
+        MOVE
+        MOVE
+        MOVE
+        LEFT
+        """
+        simulator = CommandSimulator()
+        with self.assertRaises(CommandLineError) as err:
+            simulator.run(input_cmd.strip().splitlines())
+
+        error_data = err.exception.error_data
+        self.assertEqual(6, error_data.get('line'))
+        self.assertEqual([4, 0, eObjectFacing.east.name.upper()],
+                         error_data.get('position_before_error'))
+        self.assertEqual([5, 0, eObjectFacing.east.name.upper()],
+                         error_data.get('position_at_error'))
+
+    def test_4_single_game_record(self):
+        # Wizard should only create a single game record with the final state.
+        game_model = self.env['aruna_game_test.aruna_game_test']
+        game_count = game_model.search_count([])
+        wizard = self.env['input.command.wizard'].create({
+            'input_cmd': 'PLACE 0,0,NORTH\nMOVE\nREPORT'
+        })
+        result = wizard.execute_input()
+
+        self.assertEqual(game_model.search_count([]), game_count + 1)
+        game_record = game_model.browse(result.get('res_id'))
+        self.assertEqual(game_record.report, '0,1,NORTH')
+
+    def test_5_compile_script(self):
+        # Commands before PLACE are dropped, and the opcode keep the source
+        # line number. Compiling stop at the first invalid command.
+        compiled = compile_commands("""
+        MOVE
+        PLACE 1,2,EAST
+        move
+        LEFT
+        REPORT
+        GHJ
+        MOVE
+        """.strip().splitlines())
+
+        self.assertEqual(list(compiled.opcodes), [
+            OP_PLACE, OP_MOVE, OP_LEFT, OP_REPORT, OP_ERROR])
+        self.assertEqual(list(compiled.line_numbers), [2, 3, 4, 5, 6])
+        self.assertEqual(compiled.operands, [(1, 2, 1), 'Invalid command "GHJ"'])
+        self.assertEqual(compiled.command_at(1), 'move')
+        self.assertEqual(compiled.command_at(2), 'LEFT')
+
+    def test_6_fold_runs(self):
+        # MOVE and LEFT/RIGHT runs are folded, the error should still name the
+        # exact line of the move which make the robot fall.
+        input_cmd = """
+        PLACE 0,0,NORTH
+        RIGHT
+        LEFT
+        RIGHT
+        MOVE
+        MOVE
+        MOVE
+        move
+        MOVE
+        REPORT
+        """
+        compiled = compile_script(input_cmd)
+        self.assertEqual(list(compiled.opcodes), [
+            OP_PLACE, OP_TURN, OP_MOVE_RUN, OP_REPORT])
+        self.assertEqual(list(compiled.line_numbers), [1, 2, 5, 10])
+
+        simulator = CommandSimulator()
+        with self.assertRaises(CommandLineError) as err:
+            simulator.execute(compiled)
+
+        error_data = err.exception.error_data
+        self.assertEqual(9, error_data.get('line'))
+        self.assertEqual('MOVE', error_data.get('command'))
+        self.assertEqual([4, 0, eObjectFacing.east.name.upper()],
+                         error_data.get('position_before_error'))
+        self.assertEqual([5, 0, eObjectFacing.east.name.upper()],
+                         error_data.get('position_at_error'))
+
+    def test_7_transition_table(self):
+        # Final state of a script for any start position is a single lookup on
+        # the composed transition table, whatever the chunk size is.
+        compiled = compile_script("""
+        MOVE
+        RIGHT
+        MOVE
+        REPORT
+        """)
+        space = StateSpace()
+        segment = build_script_segment(compiled, space, chunk_size=1)
+        self.assertEqual(segment.table,
+                         build_script_segment(compiled, space).table)
+
+        start_state = GameState(1, 1, eObjectFacing.north.name, True, True)
+        final_state = segment.final_state(start_state)
+        self.assertEqual(final_state.position(), [2, 2, 'EAST'])
+        self.assertTrue(final_state.is_reported)
+
+        # Robot would fall from the top row, not placed robot ignore the script
+        self.assertIsNone(segment.final_state(
+            GameState(1, 4, eObjectFacing.north.name, True, True)))
+        self.assertFalse(segment.final_state(GameState()).is_placed)
+
+    def test_8_execute_stream(self):
+        # Script read line by line from a file object, errors keep the line
+        # number of the whole file.
+        wizard = self.env['input.command.wizard'].with_context(
+            is_testing=True).create({})
+        file_data = b'\n\nPLACE 1,2,EAST\r\nMOVE\r\nMOVE\r\nLEFT\r\nMOVE\r\nREPORT\r\n\r\n'
+        result = wizard.execute_stream(io.BytesIO(file_data))
+        game_record = self.env['aruna_game_test.aruna_game_test'].browse(
+            result.get('res_id'))
+        self.assertEqual(game_record.report, '3,3,NORTH')
+
+        with self.assertRaises(TestingException) as err:
+            wizard.execute_stream(io.BytesIO(b'PLACE 0,0,NORTH\nMOVE\n\nMOVE'))
+        self.assertEqual(3, err.exception.error_data.get('line'))
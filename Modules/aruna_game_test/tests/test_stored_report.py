@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase, tagged
+from ..models.models import aruna_game_test
+from ..utils.constants import eObjectFacing
+
+
+@tagged('aruna', 'test_stored_report', '-at_install', 'post_install')
+class TestStoredReport(TransactionCase):
+    def setUp(self):
+        super(TestStoredReport, self).setUp()
+        self.game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+
+    def test_1_report_dependencies(self):
+        # Report is recomputed when the placed or report flag change, not only
+        # the position.
+        game_data = self.game_model.create({
+            'x_pos': 4,
+            'y_pos': 4,
+            'facing': eObjectFacing.east.name
+        })
+        self.assertFalse(game_data.report)
+        game_data.place_robot()
+        game_data.report_location()
+        self.assertEqual(game_data.report, '4,4,EAST')
+
+        game_data.write({'x_pos': 9})
+        game_data.place_robot()
+        self.assertEqual(
+            game_data.report,
+            '(Robot Position is Outside the Table, Report Ignored)')
+
+    def test_2_search_and_group_report(self):
+        self.game_model.create([{
+            'x_pos': 4,
+            'y_pos': 4,
+            'facing': eObjectFacing.east.name,
+            'is_placed': True,
+            'is_properly_placed': True,
+            'is_reported': True
+        } for dummy in range(3)])
+        self.assertEqual(
+            self.game_model.search_count([('report', '=', '4,4,EAST')]), 3)
+
+        groups = self.game_model.read_group(
+            [('report', '=', '4,4,EAST')], ['report'], ['report'])
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0]['report_count'], 3)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests.common import TransactionCase, tagged
+from ..utils.simulation import simulate_script
+from ..utils.trajectory import Trajectory, record_steps
+from ..wizard.input_command_wizard_model import InputCommandWizard
+
+
+@tagged('aruna', 'test_trajectory', '-at_install', 'post_install')
+class TestTrajectory(TransactionCase):
+    def setUp(self):
+        super(TestTrajectory, self).setUp()
+        self.wizard_model: InputCommandWizard = self.env['input.command.wizard']
+
+    def test_1_pack_and_decode(self):
+        command_list = ['REPORT', 'PLACE 0,0,NORTH'] + \
+            ['MOVE', 'RIGHT', 'MOVE', 'LEFT'] * 3 + ['PLACE 4,4,SOUTH', 'MOVE']
+        steps = record_steps(command_list)
+        # Small keyframe interval, so the decoding start from a keyframe
+        trajectory = Trajectory.from_bytes(
+            Trajectory.from_steps(steps, interval=4).to_bytes())
+
+        self.assertEqual(len(trajectory), 15)
+        self.assertEqual(trajectory.first_line, 2)
+        self.assertEqual(trajectory.state_at(1), None)
+        self.assertEqual(trajectory.state_at(2), (2, 0, 0, 'north'))
+        self.assertEqual(trajectory.state_at(14), (14, 3, 3, 'north'))
+        self.assertEqual(list(trajectory.iter_states(15, 20)), [
+            (15, 4, 4, 'south'),
+            (16, 4, 3, 'south')
+        ])
+
+    def test_2_store_from_wizard(self):
+        input_cmd = 'PLACE 0,0,NORTH\nMOVE\nMOVE\nRIGHT\nMOVE\nREPORT'
+        wizard = self.wizard_model.create({
+            'input_cmd': input_cmd,
+            'is_trajectory_enabled': True
+        })
+        game_data = self.env['aruna_game_test.aruna_game_test'].browse(
+            wizard.execute_input()['res_id'])
+
+        self.assertTrue(game_data.trajectory_data)
+        states = list(game_data.iter_trajectory_states(2, 4))
+        self.assertEqual(
+            [(state['line'], state['x_pos'], state['y_pos'], state['facing'])
+             for state in states],
+            [(2, 0, 1, 'north'), (3, 0, 2, 'north'), (4, 0, 2, 'east')])
+
+    def test_3_state_at_line_from_trajectory(self):
+        # REPORT outside the table does not set is_reported
+        command_list = ['MOVE', 'PLACE 7,7,NORTH', 'REPORT', 'MOVE',
+                        'PLACE 1,1,EAST', 'MOVE', 'REPORT', 'LEFT', 'MOVE']
+        wizard = self.wizard_model.create({
+            'input_cmd': '\n'.join(command_list),
+            'is_trajectory_enabled': True
+        })
+        game_data = self.env['aruna_game_test.aruna_game_test'].browse(
+            wizard.execute_input()['res_id'])
+        self.assertEqual(game_data._get_trajectory().report_line, 7)
+        for line in range(len(command_list) + 2):
+            expected_vals = simulate_script(
+                '\n'.join(command_list[:line])).to_vals()
+            result = game_data.get_state_at_line(line)
+            self.assertEqual(result['state'], expected_vals)
+            self.assertFalse(result['error'])
@@ -1,4 +1,17 @@
 from . import constants
+from . import obstacle
+from . import board
 from . import test_utils
 from . import exceptions
 from . import common_utils
+from . import compiler
+from . import simulation
+from . import transition_table
+from . import batch_simulator
+from . import script_source
+from . import parallel
+from . import result_cache
+from . import checkpoint
+from . import session
+from . import board_view
+from . import trajectory
@@ -0,0 +1,260 @@
+import logging
+from odoo.exceptions import UserError
+from .constants import OBJECT_TURNING_POS, OP_PLACE, OP_MOVE, OP_LEFT,\
+    OP_RIGHT, OP_REPORT, OP_ERROR, OP_MOVE_RUN, OP_TURN
+from .board import Board, DEFAULT_BOARD
+from .compiler import CompiledScript
+from .simulation import GameState, FACING_COUNT, FACING_X_MODIFIER,\
+    FACING_Y_MODIFIER, X_OUT_OF_BOUND_REASON, Y_OUT_OF_BOUND_REASON,\
+    OBSTACLE_REASON
+
+_logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+    _logger.debug('numpy is not installed, batch simulator is not available.')
+
+# Opcode used to pad script shorter than the longest one
+OP_NOOP = -1
+
+
+class BatchResult:
+    """ Final state of every robot of a batch, stored as numpy arrays.
+    error_line is 0 when the robot script run without error, otherwise the
+    position arrays keep the position at error.
+    """
+
+    def __init__(self, x_pos, y_pos, facing, is_placed, is_properly_placed,
+                 is_reported, error_line, error_reasons) -> None:
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.facing = facing
+        self.is_placed = is_placed
+        self.is_properly_placed = is_properly_placed
+        self.is_reported = is_reported
+        self.error_line = error_line
+        # Error reason keyed by robot index
+        self.error_reasons = error_reasons
+
+    def __len__(self) -> int:
+        return len(self.x_pos)
+
+    def state(self, index: int) -> GameState:
+        return GameState(
+            int(self.x_pos[index]), int(self.y_pos[index]),
+            OBJECT_TURNING_POS[self.facing[index]],
+            bool(self.is_placed[index]), bool(self.is_properly_placed[index]),
+            bool(self.is_reported[index]))
+
+    def results(self) -> list:
+        """ Per robot result, final state values and error data."""
+        results = []
+        for index in range(len(self)):
+            error_line = int(self.error_line[index])
+            results.append({
+                'state': self.state(index).to_vals(),
+                'error_line': error_line or False,
+                'error_reason': self.error_reasons.get(index, False)
+            })
+        return results
+
+
+def _get_free_steps(obstacles, x_pos, y_pos, x_modifier, y_modifier,
+                    move_count) -> int:
+    """ Free move before an obstacle, -1 when there is none on the way."""
+    free_steps = obstacles.free_steps(x_pos, y_pos, x_modifier, y_modifier,
+                                      move_count)
+    return -1 if free_steps is None else free_steps
+
+
+def _check_numpy():
+    if np is None:
+        raise UserError('Batch simulation requires the numpy python library.')
+
+
+def _build_program(compiled_list: list):
+    """Pad every compiled script into matrices of (step, script).
+
+    Returns:
+        tuple: opcode, operand and line number matrices, PLACE operand arrays
+        and ERROR reason list. Operand of PLACE and ERROR is the index of their
+        side table, operand of MOVE_RUN is the move count and operand of TURN
+        is the net turn.
+    """
+    step_count = max([len(compiled) for compiled in compiled_list] or [0])
+    shape = (step_count, len(compiled_list))
+    opcodes = np.full(shape, OP_NOOP, dtype=np.int8)
+    operands = np.zeros(shape, dtype=np.int64)
+    line_numbers = np.zeros(shape, dtype=np.int64)
+    place_operands = []
+    error_reasons = []
+
+    for script_index, compiled in enumerate(compiled_list):
+        for step, (opcode, operand, line) in enumerate(compiled.iter_ops()):
+            if opcode == OP_PLACE:
+                place_operands.append(operand)
+                operand = len(place_operands) - 1
+            elif opcode == OP_ERROR:
+                error_reasons.append(operand)
+                operand = len(error_reasons) - 1
+            elif opcode == OP_TURN:
+                operand = operand[0]
+            opcodes[step, script_index] = opcode
+            operands[step, script_index] = operand or 0
+            line_numbers[step, script_index] = line
+
+    place_operands = np.array(place_operands or [(0, 0, 0)],
+                              dtype=np.int64).reshape(-1, 3)
+    return opcodes, operands, line_numbers, place_operands, error_reasons
+
+
+def simulate_batch(compiled_list: list, states: list = None,
+                   script_index: list = None, board: Board = None) -> BatchResult:
+    """Simulate many robots at once, each command step is applied to every robot
+    with numpy array operations, and bounds are checked with masks.
+
+    Args:
+        compiled_list (list): CompiledScript list.
+        states (list, optional): start GameState of every robot. Defaults to one
+        not placed robot per script.
+        script_index (list, optional): index in compiled_list of the script run
+        by each robot, so many robots could run the same script. Defaults to
+        robot i running script i, robots running the same CompiledScript
+        object share the same program column.
+        board (Board, optional): table configuration. Defaults to the 5x5 table.
+    """
+    _check_numpy()
+    board = board or DEFAULT_BOARD
+    max_x, max_y = board.max_x, board.max_y
+    obstacles = board.obstacles
+    if isinstance(compiled_list, CompiledScript):
+        compiled_list = [compiled_list]
+    if states is None:
+        robot_count = len(script_index) if script_index is not None \
+            else len(compiled_list)
+        states = [GameState() for dummy in range(robot_count)]
+    if script_index is None:
+        if len(compiled_list) == 1:
+            script_index = [0] * len(states)
+        else:
+            unique_index = dict()
+            script_index = [
+                unique_index.setdefault(id(compiled), len(unique_index))
+                for compiled in compiled_list]
+            compiled_list = list({
+                id(compiled): compiled for compiled in compiled_list}.values())
+    script_index = np.asarray(script_index, dtype=np.int64)
+
+    opcodes, operands, line_numbers, place_operands, error_reasons = \
+        _build_program(compiled_list)
+
+    x_pos = np.array([state.x_pos for state in states], dtype=np.int64)
+    y_pos = np.array([state.y_pos for state in states], dtype=np.int64)
+    facing = np.array([OBJECT_TURNING_POS.index(state.facing)
+                       for state in states], dtype=np.int64)
+    is_placed = np.array([state.is_placed for state in states], dtype=bool)
+    is_properly_placed = np.array(
+        [state.is_properly_placed for state in states], dtype=bool)
+    is_reported = np.array([state.is_reported for state in states], dtype=bool)
+    error_line = np.zeros(len(states), dtype=np.int64)
+    error_reason_index = np.full(len(states), -1, dtype=np.int64)
+    x_modifier_map = np.array(FACING_X_MODIFIER, dtype=np.int64)
+    y_modifier_map = np.array(FACING_Y_MODIFIER, dtype=np.int64)
+
+    for step in range(opcodes.shape[0]):
+        opcode = opcodes[step][script_index]
+        operand = operands[step][script_index]
+        active = error_line == 0
+
+        # PLACE
+        mask = active & (opcode == OP_PLACE)
+        if mask.any():
+            place_data = place_operands[operand[mask]]
+            x_pos[mask] = place_data[:, 0]
+            y_pos[mask] = place_data[:, 1]
+            facing[mask] = place_data[:, 2]
+            is_placed[mask] = True
+            is_properly_placed[mask] = (
+                (place_data[:, 0] >= 0) & (place_data[:, 0] <= max_x) &
+                (place_data[:, 1] >= 0) & (place_data[:, 1] <= max_y))
+            if obstacles is not None:
+                is_properly_placed[mask] &= np.array([
+                    not obstacles.is_blocked(x_place, y_place)
+                    for x_place, y_place in place_data[:, :2].tolist()],
+                    dtype=bool)
+
+        # Invalid command
+        mask = active & (opcode == OP_ERROR)
+        if mask.any():
+            error_line[mask] = line_numbers[step][script_index][mask]
+            error_reason_index[mask] = operand[mask]
+
+        # Every other command is ignored when not properly placed
+        movable = active & is_properly_placed
+
+        # MOVE and MOVE_RUN
+        mask = movable & ((opcode == OP_MOVE) | (opcode == OP_MOVE_RUN))
+        if mask.any():
+            move_count = np.where(opcode == OP_MOVE_RUN, operand, 1)[mask]
+            x_modifier = x_modifier_map[facing[mask]]
+            y_modifier = y_modifier_map[facing[mask]]
+            current_x_pos = x_pos[mask]
+            current_y_pos = y_pos[mask]
+
+            # Number of move available before the robot fall
+            move_limit = np.select(
+                [x_modifier > 0, x_modifier < 0, y_modifier > 0],
+                [max_x - current_x_pos, current_x_pos, max_y - current_y_pos],
+                current_y_pos)
+            # Use negative index for out of bound reason, -2 for X and -3 for Y
+            limit_reason = np.where(x_modifier != 0, -2, -3)
+            if obstacles is not None:
+                # Obstacle lookup is not vectorized, only robots moving on a
+                # table with obstacles pay for it
+                free_steps = np.array([
+                    _get_free_steps(obstacles, *move_data) for move_data in zip(
+                        current_x_pos.tolist(), current_y_pos.tolist(),
+                        x_modifier.tolist(), y_modifier.tolist(),
+                        move_count.tolist())], dtype=np.int64)
+                blocked = (free_steps >= 0) & (free_steps < move_limit)
+                move_limit = np.where(blocked, free_steps, move_limit)
+                # -4 for obstacle
+                limit_reason = np.where(blocked, -4, limit_reason)
+            falling = move_count > move_limit
+            stop_count = np.where(falling, move_limit + 1, move_count)
+            x_pos[mask] = current_x_pos + x_modifier * stop_count
+            y_pos[mask] = current_y_pos + y_modifier * stop_count
+
+            fall_index = np.flatnonzero(mask)[falling]
+            error_line[fall_index] = \
+                line_numbers[step][script_index][fall_index] + \
+                move_limit[falling]
+            error_reason_index[fall_index] = limit_reason[falling]
+
+        # LEFT, RIGHT and TURN
+        mask = movable & (opcode == OP_LEFT)
+        facing[mask] = (facing[mask] - 1) % FACING_COUNT
+        mask = movable & (opcode == OP_RIGHT)
+        facing[mask] = (facing[mask] + 1) % FACING_COUNT
+        mask = movable & (opcode == OP_TURN)
+        facing[mask] = (facing[mask] + operand[mask]) % FACING_COUNT
+
+        # REPORT
+        is_reported |= movable & (opcode == OP_REPORT)
+
+    reasons = dict()
+    for robot_index in np.flatnonzero(error_line):
+        reason_index = int(error_reason_index[robot_index])
+        if reason_index == -2:
+            reasons[int(robot_index)] = X_OUT_OF_BOUND_REASON
+        elif reason_index == -3:
+            reasons[int(robot_index)] = Y_OUT_OF_BOUND_REASON
+        elif reason_index == -4:
+            reasons[int(robot_index)] = OBSTACLE_REASON
+        else:
+            reasons[int(robot_index)] = error_reasons[reason_index]
+
+    return BatchResult(x_pos, y_pos, facing, is_placed, is_properly_placed,
+                       is_reported, error_line, reasons)
@@ -0,0 +1,46 @@
+from .constants import DEFAULT_BOARD_SIZE
+from .obstacle import ObstacleIndex
+
+
+class Board:
+    """ In memory table configuration, loaded once per board record and shared
+    by every command of the simulation. Coordinate start from 0 on the most
+    South West cell, so the limits are width - 1 and height - 1.
+    """
+    __slots__ = ('width', 'height', 'max_x', 'max_y', 'obstacles')
+
+    def __init__(self, width: int = DEFAULT_BOARD_SIZE,
+                 height: int = DEFAULT_BOARD_SIZE,
+                 obstacles: ObstacleIndex = None) -> None:
+        self.width = width
+        self.height = height
+        self.max_x = width - 1
+        self.max_y = height - 1
+        # None when the table has no obstacle, so the check is skipped
+        self.obstacles = obstacles or None
+
+    def __getstate__(self):
+        return (self.width, self.height, self.obstacles)
+
+    def __setstate__(self, data):
+        self.__init__(*data)
+
+    def contains(self, x_pos: int, y_pos: int) -> bool:
+        """ Check if the given coordinate is within the table boundary."""
+        return 0 <= x_pos <= self.max_x and 0 <= y_pos <= self.max_y
+
+    def is_blocked(self, x_pos: int, y_pos: int) -> bool:
+        """ Check if the given cell is blocked by an obstacle."""
+        return self.obstacles is not None and \
+            self.obstacles.is_blocked(x_pos, y_pos)
+
+    @property
+    def key(self) -> str:
+        """ Key of the board configuration, result is only valid on the same board."""
+        if self.obstacles is None:
+            return '{}x{}'.format(self.width, self.height)
+        return '{}x{}#{}'.format(self.width, self.height, self.obstacles.digest)
+
+
+# The original 5x5 table
+DEFAULT_BOARD = Board()
@@ -0,0 +1,119 @@
+from .board import Board
+from .constants import DIRECTION_ARROW
+from .result_cache import ResultCache
+from .simulation import GameState
+
+# Number of cell per side rendered around the robot
+DEFAULT_VIEWPORT_SIZE = 25
+# Largest viewport allowed when zooming out
+MAX_VIEWPORT_SIZE = 100
+# Number of rendered viewport kept in memory
+DEFAULT_HTML_CACHE_SIZE = 512
+
+
+def get_viewport(board: Board, x_pos: int, y_pos: int,
+                 size: int = DEFAULT_VIEWPORT_SIZE, pan_x: int = 0,
+                 pan_y: int = 0) -> tuple:
+    """Window of at most size x size cells containing the given cell.
+    Windows are aligned on a size x size grid, so the window only change when
+    the robot leave it and the client keep its rendered cells in between.
+
+    Args:
+        size (int, optional): number of cell per side (zoom), limited to
+        MAX_VIEWPORT_SIZE.
+        pan_x (int, optional): number of cell the window is moved on the x axis.
+        pan_y (int, optional): number of cell the window is moved on the y axis.
+
+    Returns:
+        tuple: (x_from, y_from, x_to, y_to), limits are included.
+    """
+    size = min(max(size, 1), MAX_VIEWPORT_SIZE)
+    width = min(size, board.width)
+    height = min(size, board.height)
+    x_pos = min(max(x_pos, 0), board.max_x)
+    y_pos = min(max(y_pos, 0), board.max_y)
+    x_from = min(max((x_pos // width) * width + pan_x, 0), board.width - width)
+    y_from = min(max((y_pos // height) * height + pan_y, 0),
+                 board.height - height)
+    return x_from, y_from, x_from + width - 1, y_from + height - 1
+
+
+def build_board_payload(board: Board, state: GameState,
+                        size: int = DEFAULT_VIEWPORT_SIZE) -> dict:
+    """Compact board data for the client side board widget. Only the viewport
+    around the robot is sent, so the size does not depend on the table size.
+
+    Args:
+        board (Board): table configuration.
+        state (GameState): robot state.
+        size (int, optional): viewport size. Defaults to DEFAULT_VIEWPORT_SIZE.
+    """
+    is_on_table = state.is_placed and state.is_properly_placed
+    center = (state.x_pos, state.y_pos) if is_on_table else (0, 0)
+    viewport = get_viewport(board, center[0], center[1], size)
+
+    obstacles = []
+    if board.obstacles is not None:
+        obstacles = board.obstacles.cells_in(*viewport)
+    payload = {
+        # Grid is only rebuilt by the client when the layout change
+        'layout_key': '{}@{},{},{},{}'.format(board.key, *viewport),
+        'width': board.width,
+        'height': board.height,
+        'viewport': list(viewport),
+        'obstacles': [list(cell) for cell in obstacles],
+        'robot': None,
+    }
+    if is_on_table:
+        payload['robot'] = {
+            'x': state.x_pos,
+            'y': state.y_pos,
+            'facing': state.facing
+        }
+    return payload
+
+
+def render_board_html(board: Board, x_pos: int, y_pos: int, facing: str,
+                      viewport: tuple) -> str:
+    """Build HTML table of the viewport, the robot arrow is drawn on the given
+    cell when it is inside the viewport.
+    """
+    x_from, y_from, x_to, y_to = viewport
+    arrow_data = DIRECTION_ARROW.get(facing, '')
+    rows = []
+    # Loop y axis, North on top
+    for y_loop in range(y_to, y_from - 1, -1):
+        cells = []
+        for x_loop in range(x_from, x_to + 1):
+            additional_style = ''
+            if y_loop == 0 and x_loop == 0:
+                additional_style = 'background-color:#F5F5DC;'
+            if board.is_blocked(x_loop, y_loop):
+                additional_style = 'background-color:#808080;'
+            cells.append(
+                '<td class="text-center" style="height: 5vh; width: 5vh; {}">'
+                '{}</td>'.format(
+                    additional_style,
+                    arrow_data if x_loop == x_pos and y_loop == y_pos else ''))
+        rows.append('<tr>{}</tr>'.format(''.join(cells)))
+    return '<div style="max-width: 100%; overflow: auto;">' \
+        '<table class="table table-bordered"><tbody>{}</tbody></table>' \
+        '</div>'.format(''.join(rows))
+
+
+# Rendered viewport keyed by (board key, viewport, x, y, facing), shared by
+# every worker thread of the process
+HTML_CACHE = ResultCache(DEFAULT_HTML_CACHE_SIZE)
+
+
+def get_board_html(board: Board, x_pos: int, y_pos: int, facing: str,
+                   size: int = DEFAULT_VIEWPORT_SIZE, pan_x: int = 0,
+                   pan_y: int = 0) -> str:
+    """ Cached render_board_html of the viewport around the given cell."""
+    viewport = get_viewport(board, x_pos, y_pos, size, pan_x, pan_y)
+    key = (board.key, viewport, x_pos, y_pos, facing)
+    html_data = HTML_CACHE.get(key)
+    if html_data is None:
+        html_data = render_board_html(board, x_pos, y_pos, facing, viewport)
+        HTML_CACHE.set(key, html_data)
+    return html_data
@@ -0,0 +1,96 @@
+import hashlib
+from .board import Board
+from .simulation import GameState, CommandSimulator
+
+# Default number of line between two checkpoints
+DEFAULT_CHECKPOINT_INTERVAL = 1000
+
+
+class Checkpoint:
+    """ Simulation state after executing the first `line` lines of a script.
+    prefix_hash identify those lines, so the checkpoint could be reused by any
+    script starting with the same lines. reports hold the REPORT output of the
+    lines after the previous checkpoint, as (line number, report).
+    """
+    __slots__ = ('line', 'prefix_hash', 'state', 'state_before_error',
+                 'reports')
+
+    def __init__(self, line: int, prefix_hash: str, state: GameState,
+                 state_before_error: GameState, reports: list = None) -> None:
+        self.line = line
+        self.prefix_hash = prefix_hash
+        self.state = state
+        self.state_before_error = state_before_error
+        self.reports = reports or []
+
+
+def iter_prefix_hashes(command_list, interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+                       seed: str = ''):
+    """Hash every prefix of interval lines. Lines are trimmed and upper cased,
+    like the result cache, since executed commands are case insensitive.
+
+    Args:
+        command_list (iterable): command text, one command per item.
+        interval (int, optional): number of line between two hashes.
+        seed (str, optional): text hashed before the first line, example module
+        version and board key, so checkpoint is only reused on the same setup.
+
+    Yields:
+        tuple: (number of lines hashed, prefix hash)
+    """
+    hasher = hashlib.sha256(seed.encode('utf-8'))
+    for line, cmd in enumerate(command_list, 1):
+        hasher.update(cmd.strip().upper().encode('utf-8'))
+        hasher.update(b'\n')
+        if line % interval == 0:
+            yield line, hasher.hexdigest()
+
+
+def simulate_with_checkpoints(command_list: list, prefix_hashes: dict,
+                              interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+                              resume_checkpoint: Checkpoint = None,
+                              board: Board = None,
+                              reports: list = None, on_step=None) -> tuple:
+    """Execute script interval lines at a time, keeping a checkpoint after each
+    chunk. Execution start after resume_checkpoint when given, REPORT output of
+    the skipped lines is not added to reports.
+
+    Args:
+        command_list (list): command text, one command per item.
+        prefix_hashes (dict): prefix hash keyed by number of lines, see
+        iter_prefix_hashes.
+        interval (int, optional): number of line between two checkpoints.
+        resume_checkpoint (Checkpoint, optional): checkpoint of the same script
+        prefix to resume from.
+        board (Board, optional): table configuration. Defaults to the 5x5 table.
+        reports (list, optional): REPORT output of the executed lines is
+        appended to it.
+        on_step (callable, optional): called after every executed command.
+
+    Raises:
+        CommandLineError: when any command failed.
+
+    Returns:
+        tuple: (final GameState, list of new Checkpoint)
+    """
+    start_line = 0
+    if reports is None:
+        # Checkpoint always keep its REPORT output, for the script resuming it
+        reports = []
+    simulator = CommandSimulator(board=board, reports=reports, on_step=on_step)
+    if resume_checkpoint:
+        start_line = resume_checkpoint.line
+        simulator = CommandSimulator(resume_checkpoint.state.copy(),
+                                     resume_checkpoint.state_before_error.copy(),
+                                     board, reports, on_step)
+
+    checkpoints = []
+    for chunk_start in range(start_line, len(command_list), interval):
+        chunk_end = chunk_start + interval
+        report_start = len(reports)
+        simulator.run(command_list[chunk_start:chunk_end], chunk_start + 1)
+        if chunk_end in prefix_hashes:
+            checkpoints.append(Checkpoint(
+                chunk_end, prefix_hashes[chunk_end], simulator.state.copy(),
+                simulator.state_before_error.copy(), reports[report_start:]))
+    return simulator.state, checkpoints
@@ -1,9 +1,19 @@
+import re
+from odoo.exceptions import ValidationError
+from .constants import OBJECT_TURNING_POS
+
+
 def check_table_pos(func):
     """Decorator to check whether command should be ignored or not.
-    Command will only executed if the robot is properly placed in the table
+    Command will only executed if the robot is properly placed in the table.
+    Command on many records is not checked here, it is done by the command
+    itself.
     """
 
     def inner(self):
+        if len(self) != 1:
+            # Recordset level command check every record in a single query
+            return func(self)
         if not self.is_properly_placed:
             return None
         else:
@@ -13,3 +23,62 @@ def check_table_pos(func):
             return self._check_out_of_bound()
 
     return inner
+
+
+# Integer operand of the place command, same syntax as accepted by int()
+INTEGER_PATTERN = re.compile(r'\s*[+-]?\d+(?:_\d+)*\s*')
+
+
+def parse_place_command(place_command: str) -> tuple:
+    """Decode place command to get position and facing data, without raising.
+
+    Args:
+        place_command (str): place command text input
+
+    Returns:
+        tuple: (position and facing data, None) when the command is valid,
+        otherwise (None, error reason).
+    """
+    # Remove all whitespace
+    place_command = place_command.replace(" ", "")
+    place_command = place_command.replace("PLACE", "")
+
+    # Split command
+    place_cmd_list = place_command.strip().split(',')
+
+    # Check command list
+    if len(place_cmd_list) != 3:
+        return None, 'Valid Place Command is "PLACE POS_X,POS_Y,FACING"'
+
+    # Validate Position and Facing Data
+    # Validate position
+    if not INTEGER_PATTERN.fullmatch(place_cmd_list[0]):
+        return None, 'X_POS should be a integer number'
+    if not INTEGER_PATTERN.fullmatch(place_cmd_list[1]):
+        return None, 'Y_POS should be a integer number'
+
+    # Validate facing data
+    facing = place_cmd_list[2].lower()
+    if facing not in OBJECT_TURNING_POS:
+        return None, 'Invalid Facing Direction "{}"'.format(facing)
+
+    return {
+        'x_pos': int(place_cmd_list[0]),
+        'y_pos': int(place_cmd_list[1]),
+        'facing': facing
+    }, None
+
+
+def decode_place_command(place_command: str) -> dict:
+    """Decode place command to get position and facing data.
+
+    Args:
+        place_command (str): place command text input
+
+    Raises:
+        ValidationError: when the position or facing data is not valid.
+    """
+    place_data, reason = parse_place_command(place_command)
+    if reason:
+        raise ValidationError(reason)
+    return place_data
@@ -0,0 +1,244 @@
+from array import array
+from functools import lru_cache
+from .constants import OP_PLACE, OP_MOVE, OP_LEFT, OP_RIGHT, OP_ERROR,\
+    OP_MOVE_RUN, OP_TURN, COMMAND_OPCODE, OBJECT_TURNING_POS
+from .common_utils import parse_place_command
+
+# Canonical command text for each opcode, used to rebuild error message
+OPCODE_COMMAND = {opcode: command for command, opcode in COMMAND_OPCODE.items()}
+# Opcode which consume an item of the operands side table
+OPERAND_OPCODES = (OP_PLACE, OP_ERROR, OP_MOVE_RUN, OP_TURN)
+
+
+class CompiledScript:
+    """ Compact representation of a command script.
+
+    opcodes: one opcode per executed command (see OP_* in constants).
+    operands: side table consumed in order by PLACE (x_pos, y_pos, facing index),
+    ERROR (reason), MOVE_RUN (number of move) and TURN (net turn, net turn
+    before the last turn) opcodes.
+    line_numbers: source line number of each opcode, for error purpose. Folded
+    opcode keep the line number of the first command of the run, since every
+    command after PLACE produce an opcode the run is always on consecutive lines.
+    command_text: original text of commands which is not written in the
+    canonical form (example "move" instead of "MOVE"), keyed by line number.
+    """
+    __slots__ = ('opcodes', 'operands', 'line_numbers', 'command_text')
+
+    def __init__(self) -> None:
+        self.opcodes = array('b')
+        self.operands = []
+        self.line_numbers = array('L')
+        self.command_text = dict()
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def iter_ops(self):
+        """ Yield (opcode, operand, line number) of every opcode."""
+        operands = self.operands
+        operand_index = 0
+        for opcode, line in zip(self.opcodes, self.line_numbers):
+            operand = None
+            if opcode in OPERAND_OPCODES:
+                operand = operands[operand_index]
+                operand_index += 1
+            yield opcode, operand, line
+
+    def command_at(self, index: int, offset: int = 0) -> str:
+        """Get command text of the opcode at the given index.
+
+        Args:
+            index (int): opcode index.
+            offset (int, optional): command position inside a folded run. Defaults to 0.
+        """
+        opcode = self.opcodes[index]
+        command = self.command_text.get(self.line_numbers[index] + offset)
+        if command is None:
+            if opcode == OP_MOVE_RUN:
+                opcode = OP_MOVE
+            command = OPCODE_COMMAND.get(opcode, '')
+        return command
+
+
+def _build_invalid_command_reason(cmd: str, is_place_found: bool) -> str:
+    msg_1 = 'Invalid command "{}"'.format(cmd)
+    if is_place_found:
+        return msg_1
+
+    msg_2 = ''
+    # In case the error is place command
+    if 'place' in cmd.lower():
+        msg_1 += '\n'
+        msg_2 = 'Place command should be "PLACE X_POS,Y_POS,FACING", ' \
+            'separate "PLACE" and position data with space.'
+    return msg_1 + msg_2
+
+
+def iter_script_ops(command_list, start_line: int = 1,
+                    is_place_found: bool = False):
+    """Tokenize command lines into opcode.
+    All valid command before the first PLACE command is discarded, and since
+    the execution stop at the first failed command, tokenizing stop right after
+    the first ERROR opcode.
+
+    Args:
+        command_list (iterable): command text, one command per item.
+        start_line (int, optional): line number of the first command. Defaults to 1.
+        is_place_found (bool, optional): mark if PLACE command is already
+        executed before the first command. Defaults to False.
+
+    Yields:
+        tuple: (opcode, operand, line number, trimmed command text)
+    """
+    for line, cmd in enumerate(command_list, start_line):
+        # Trim command for whitespace
+        cmd = cmd.strip()
+        upper_cmd = cmd.upper()
+        # Check if current command is the place command
+        if 'PLACE ' in upper_cmd:
+            place_data, reason = parse_place_command(upper_cmd)
+            if reason:
+                yield OP_ERROR, reason, line, cmd
+                return
+            is_place_found = True
+            yield OP_PLACE, (
+                place_data['x_pos'], place_data['y_pos'],
+                OBJECT_TURNING_POS.index(place_data['facing'])), line, cmd
+            continue
+
+        opcode = COMMAND_OPCODE.get(upper_cmd)
+        if opcode is None:
+            yield OP_ERROR, _build_invalid_command_reason(
+                cmd, is_place_found), line, cmd
+            return
+        # Only execute if place command is found
+        if is_place_found:
+            yield opcode, None, line, cmd
+
+
+def validate_commands(command_list, start_line: int = 1) -> list:
+    """Check the syntax of every command line in a single pass, with the same
+    rules as the compiler, but without stopping at the first invalid line.
+    Movement is not simulated, so a robot falling off the table is not found.
+
+    Args:
+        command_list (iterable): command text, one command per item.
+        start_line (int, optional): line number of the first command. Defaults to 1.
+
+    Returns:
+        list: error data (line, command and reason) of every invalid line.
+    """
+    errors = []
+    is_place_found = False
+    for line, cmd in enumerate(command_list, start_line):
+        cmd = cmd.strip()
+        upper_cmd = cmd.upper()
+        if 'PLACE ' in upper_cmd:
+            place_data, reason = parse_place_command(upper_cmd)
+            if reason:
+                errors.append({'line': line, 'command': cmd, 'reason': reason})
+            else:
+                is_place_found = True
+        elif upper_cmd not in COMMAND_OPCODE:
+            errors.append({
+                'line': line,
+                'command': cmd,
+                'reason': _build_invalid_command_reason(cmd, is_place_found)
+            })
+    return errors
+
+
+def compile_commands(command_list, start_line: int = 1,
+                     is_place_found: bool = False) -> CompiledScript:
+    """ Compile command lines into CompiledScript, see iter_script_ops."""
+    compiled = CompiledScript()
+    opcodes = compiled.opcodes
+    operands = compiled.operands
+    line_numbers = compiled.line_numbers
+    command_text = compiled.command_text
+
+    for opcode, operand, line, cmd in iter_script_ops(
+            command_list, start_line, is_place_found):
+        if operand is not None:
+            operands.append(operand)
+        if opcode == OP_PLACE or opcode == OP_ERROR or \
+                cmd != OPCODE_COMMAND[opcode]:
+            command_text[line] = cmd
+        opcodes.append(opcode)
+        line_numbers.append(line)
+    return compiled
+
+
+def fold_runs(compiled: CompiledScript) -> CompiledScript:
+    """Optimiser pass, collapse consecutive MOVE and LEFT/RIGHT commands.
+    A run of k MOVE become a single MOVE_RUN opcode, the simulator then check
+    in closed form at which move the robot would fall. A run of LEFT/RIGHT
+    become a single TURN opcode holding the net turn (mod 4), so executing a
+    script cost O(number of runs) instead of O(number of lines).
+    """
+    folded = CompiledScript()
+    folded.command_text = compiled.command_text
+    opcodes = compiled.opcodes
+    operands = compiled.operands
+    line_numbers = compiled.line_numbers
+    turn_count = len(OBJECT_TURNING_POS)
+
+    index = 0
+    operand_index = 0
+    opcode_count = len(opcodes)
+    while index < opcode_count:
+        opcode = opcodes[index]
+        line = line_numbers[index]
+        run_end = index + 1
+
+        if opcode == OP_MOVE:
+            while run_end < opcode_count and opcodes[run_end] == OP_MOVE:
+                run_end += 1
+            if run_end - index > 1:
+                folded.opcodes.append(OP_MOVE_RUN)
+                folded.operands.append(run_end - index)
+                folded.line_numbers.append(line)
+                index = run_end
+                continue
+
+        elif opcode == OP_LEFT or opcode == OP_RIGHT:
+            while run_end < opcode_count and \
+                    opcodes[run_end] in (OP_LEFT, OP_RIGHT):
+                run_end += 1
+            if run_end - index > 1:
+                # Right turn is +1 and left turn is -1 on OBJECT_TURNING_POS
+                net_turn = 0
+                for turn_opcode in opcodes[index:run_end]:
+                    net_turn += 1 if turn_opcode == OP_RIGHT else -1
+                last_turn = 1 if opcodes[run_end - 1] == OP_RIGHT else -1
+                folded.opcodes.append(OP_TURN)
+                folded.operands.append((
+                    net_turn % turn_count, (net_turn - last_turn) % turn_count))
+                folded.line_numbers.append(line)
+                index = run_end
+                continue
+
+        elif opcode == OP_PLACE or opcode == OP_ERROR:
+            folded.operands.append(operands[operand_index])
+            operand_index += 1
+
+        folded.opcodes.append(opcode)
+        folded.line_numbers.append(line)
+        index += 1
+    return folded
+
+
+@lru_cache(maxsize=128)
+def compile_script(input_cmd: str,
+                   is_place_found: bool = False) -> CompiledScript:
+    """Trim input, split it per line, compile it and fold the runs.
+    The result is cached, so it should be treated as read only.
+
+    Args:
+        input_cmd (str): command script text.
+        is_place_found (bool, optional): mark if the robot is already placed,
+        so command before the first PLACE is not discarded. Defaults to False.
+    """
+    return fold_runs(compile_commands(
+        input_cmd.strip().splitlines(), is_place_found=is_place_found))
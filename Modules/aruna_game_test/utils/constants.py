@@ -32,6 +32,10 @@ class eMoveModifier:
         self.y_pos = y_pos
 
 
+# Default table size, the board is 5x5 and coordinate start from 0
+DEFAULT_BOARD_SIZE = 5
+
+
 # Move modifier value, origin coordinate / (0,0) coordinate is on most
 # South West position
 MOVE_MODIFIER = {
@@ -66,6 +70,25 @@ COMMAND_MAP = {
 }
 
 
+# Opcode for compiled command script, see utils/compiler.py
+OP_PLACE = 0
+OP_MOVE = 1
+OP_LEFT = 2
+OP_RIGHT = 3
+OP_REPORT = 4
+OP_ERROR = 5
+# Folded opcode, produced by the optimiser pass
+OP_MOVE_RUN = 6
+OP_TURN = 7
+
+COMMAND_OPCODE = {
+    'LEFT': OP_LEFT,
+    'RIGHT': OP_RIGHT,
+    'MOVE': OP_MOVE,
+    'REPORT': OP_REPORT
+}
+
+
 # Arrow symbol mapping, used to render html data to visualize object
 # position in the table.
 DIRECTION_ARROW = {
@@ -16,3 +16,14 @@ class TestingException(Exception):
 
     def __init__(self, error_data):
         self.error_data = error_data
+
+
+class CommandLineError(Exception):
+    """
+    Exception raised by the simulation engine when a command line fails. Carry the
+    line number, command and position data so the caller could build the error message.
+    """
+
+    def __init__(self, error_data):
+        super().__init__(error_data)
+        self.error_data = error_data
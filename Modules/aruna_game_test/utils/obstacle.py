@@ -0,0 +1,175 @@
+import csv
+import hashlib
+import io
+from bisect import bisect_left, bisect_right
+from odoo.exceptions import ValidationError
+
+# Maximum number of row and column intervals kept in memory for a single table
+MAX_OBSTACLE_INTERVALS = 1000000
+
+
+class ObstacleIndex:
+    """ Blocked cells of a table, built once per board and shared by every
+    command of the simulation. Blocked area is kept as intervals, so the memory
+    does not depend on the blocked area.
+    - rows / columns: sorted disjoint intervals per row and column, as a list
+      of start and a list of end, so a single cell or the first obstacle of a
+      run of moves is found with a binary search
+    """
+    __slots__ = ('ranges', 'rows', 'columns', 'cell_count', 'digest')
+
+    def __init__(self, ranges) -> None:
+        """
+        Args:
+            ranges (iterable): (x_from, y_from, x_to, y_to) of blocked area,
+            limits are included.
+        """
+        self.ranges = sorted(set(tuple(cell_range) for cell_range in ranges))
+        rows = dict()
+        columns = dict()
+        for x_from, y_from, x_to, y_to in self.ranges:
+            for y_pos in range(y_from, y_to + 1):
+                rows.setdefault(y_pos, []).append((x_from, x_to))
+            for x_pos in range(x_from, x_to + 1):
+                columns.setdefault(x_pos, []).append((y_from, y_to))
+        self.rows = {y_pos: merge_intervals(intervals)
+                     for y_pos, intervals in rows.items()}
+        self.columns = {x_pos: merge_intervals(intervals)
+                        for x_pos, intervals in columns.items()}
+        self.cell_count = sum(
+            end - start + 1 for starts, ends in self.rows.values()
+            for start, end in zip(starts, ends))
+        self.digest = hashlib.sha256(
+            repr(self.ranges).encode('utf-8')).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        return self.cell_count
+
+    def __getstate__(self):
+        return self.ranges
+
+    def __setstate__(self, ranges):
+        self.__init__(ranges)
+
+    def is_blocked(self, x_pos: int, y_pos: int) -> bool:
+        """ Check if the given cell is blocked."""
+        intervals = self.rows.get(y_pos)
+        if intervals is None:
+            return False
+        starts, ends = intervals
+        index = bisect_right(starts, x_pos) - 1
+        return index >= 0 and ends[index] >= x_pos
+
+    def free_steps(self, x_pos: int, y_pos: int, x_modifier: int,
+                   y_modifier: int, move_count: int):
+        """Number of move available before hitting an obstacle.
+
+        Returns:
+            int: number of free move, or None when there is no obstacle within
+            move_count moves.
+        """
+        if x_modifier:
+            intervals, current = self.rows.get(y_pos), x_pos
+            step = x_modifier
+        else:
+            intervals, current = self.columns.get(x_pos), y_pos
+            step = y_modifier
+        if intervals is None:
+            return None
+        starts, ends = intervals
+        if step > 0:
+            # First interval ending after the current cell
+            index = bisect_right(ends, current)
+            if index < len(starts):
+                blocked = max(starts[index], current + 1)
+                if blocked - current <= move_count:
+                    return blocked - current - 1
+        else:
+            # Last interval starting before the current cell
+            index = bisect_left(starts, current) - 1
+            if index >= 0:
+                blocked = min(ends[index], current - 1)
+                if current - blocked <= move_count:
+                    return current - blocked - 1
+        return None
+
+    def cells_in(self, x_from: int, y_from: int, x_to: int, y_to: int) -> list:
+        """ Blocked cells inside the given area, limits are included."""
+        cells = []
+        for y_pos in range(y_from, y_to + 1):
+            intervals = self.rows.get(y_pos)
+            if intervals is None:
+                continue
+            starts, ends = intervals
+            for index in range(bisect_left(ends, x_from), len(starts)):
+                if starts[index] > x_to:
+                    break
+                cells.extend(
+                    (x_pos, y_pos) for x_pos in range(
+                        max(starts[index], x_from), min(ends[index], x_to) + 1))
+        return cells
+
+
+def merge_intervals(intervals: list) -> tuple:
+    """Merge overlapping and adjacent intervals, limits are included.
+
+    Returns:
+        tuple: (sorted start list, sorted end list) of disjoint intervals
+    """
+    starts = []
+    ends = []
+    for start, end in sorted(intervals):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+            continue
+        starts.append(start)
+        ends.append(end)
+    return starts, ends
+
+
+def count_index_intervals(ranges) -> int:
+    """ Upper bound of the number of row and column intervals of the index."""
+    return sum((x_to - x_from + 1) + (y_to - y_from + 1)
+               for x_from, y_from, x_to, y_to in ranges)
+
+
+def parse_obstacle_ranges(file_data: bytes) -> list:
+    """Read blocked area from a CSV file, one area per row:
+    "x,y" for a single cell, or "x_from,y_from,x_to,y_to" for a rectangle.
+    A header row is skipped.
+
+    Returns:
+        list: (x_from, y_from, x_to, y_to)
+    """
+    try:
+        text = file_data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise ValidationError('Obstacle file should be UTF-8 text.')
+
+    ranges = []
+    for row_number, row in enumerate(csv.reader(io.StringIO(text)), 1):
+        values = [value.strip() for value in row if value.strip()]
+        if not values:
+            continue
+        try:
+            values = [int(value) for value in values]
+        except ValueError:
+            if row_number == 1:
+                continue
+            raise ValidationError(
+                'Obstacle row {} should only contain integer number.'.format(
+                    row_number))
+        if len(values) == 2:
+            values = values * 2
+        if len(values) != 4:
+            raise ValidationError(
+                'Obstacle row {} should be "X,Y" or "X_FROM,Y_FROM,X_TO,Y_TO".'
+                .format(row_number))
+        ranges.append(normalize_range(*values))
+    return ranges
+
+
+def normalize_range(x_from: int, y_from: int, x_to: int, y_to: int) -> tuple:
+    """ Order range limits, so x_from <= x_to and y_from <= y_to."""
+    return (min(x_from, x_to), min(y_from, y_to),
+            max(x_from, x_to), max(y_from, y_to))
@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from .board import Board, DEFAULT_BOARD
+from .compiler import compile_script
+from .exceptions import CommandLineError
+from .simulation import CommandSimulator, REPORT_FIELDS, build_report_vals
+from .result_cache import RESULT_CACHE, script_hash
+
+# Default number of script sent to a worker process at once
+DEFAULT_POOL_CHUNK_SIZE = 16
+
+
+def simulate_script_result(input_cmd: str, board: Board = None) -> tuple:
+    """Simulate a script and return plain data, so it could be sent back from a
+    worker process.
+
+    Returns:
+        tuple: (final state values or None, error data or None, REPORT output
+        as (line number, report) list)
+    """
+    reports = []
+    simulator = CommandSimulator(board=board, reports=reports)
+    try:
+        simulator.execute(compile_script(input_cmd))
+    except CommandLineError as err:
+        return None, err.error_data, reports
+    return simulator.state.to_vals(), None, reports
+
+
+def can_fork() -> bool:
+    """Forking a process with live threads could deadlock the child on a lock
+    held by another thread (logging, import, ...). A prefork Odoo worker runs
+    the request in its workthread while the main thread only waits for it, so
+    these two threads are ignored. The threaded server also has HTTP and cron
+    threads, it is not forked.
+    """
+    known_threads = (threading.current_thread(), threading.main_thread())
+    return all(thread in known_threads for thread in threading.enumerate())
+
+
+def simulate_scripts(scripts: list, pool_size: int = 1,
+                     chunk_size: int = DEFAULT_POOL_CHUNK_SIZE,
+                     board: Board = None) -> list:
+    """Simulate many scripts, on a process pool when pool_size is not 1.
+    Worker processes only run the simulation engine, there is no ORM access.
+    Results keep the order of the given scripts, so the output is the same as
+    running them one by one. The pool is only used when the process could be
+    forked safely (see can_fork), otherwise scripts are simulated in process.
+
+    Args:
+        scripts (list): script text.
+        pool_size (int, optional): number of worker process, 0 to use every
+        CPU. Defaults to 1 (no pool).
+        chunk_size (int, optional): number of script sent to a worker at once.
+        Defaults to DEFAULT_POOL_CHUNK_SIZE.
+        board (Board, optional): table configuration. Defaults to the 5x5 table.
+
+    Returns:
+        list: (final state values or None, error data or None, REPORT output)
+        of each script.
+    """
+    pool_size = pool_size or os.cpu_count() or 1
+    pool_size = min(pool_size, len(scripts))
+    if pool_size <= 1 or not can_fork():
+        return [simulate_script_result(script, board) for script in scripts]
+
+    # Fork so the children already have the module loaded, they don't need
+    # the Odoo addons path to import it again.
+    with ProcessPoolExecutor(
+            max_workers=pool_size,
+            mp_context=multiprocessing.get_context('fork')) as executor:
+        return list(executor.map(simulate_script_result, scripts,
+                                 repeat(board), chunksize=max(chunk_size, 1)))
+
+
+def iter_simulation_results(scripts, board: Board = None,
+                            module_version: str = ''):
+    """Simulate scripts one by one, each result is yielded as soon as it is
+    computed. Result is shared with the in memory result cache, there is no
+    database access so it could be consumed after the request cursor is closed.
+    Cached result hold the final state and the report log values, like the
+    result cache model.
+
+    Args:
+        scripts (iterable): script text.
+        board (Board, optional): table configuration. Defaults to the 5x5 table.
+        module_version (str, optional): module version of the cache key.
+
+    Yields:
+        tuple: (final state values or None, error data or None, report log
+        values or None), see build_report_vals.
+    """
+    board_key = (board or DEFAULT_BOARD).key
+    for script in scripts:
+        key = (script_hash(script), module_version, board_key)
+        result_vals = RESULT_CACHE.get(key)
+        if result_vals is not None:
+            state_vals = dict(result_vals)
+            yield state_vals, None, {field_name: state_vals.pop(field_name)
+                                     for field_name in REPORT_FIELDS}
+            continue
+        state_vals, error_data, reports = simulate_script_result(script, board)
+        if state_vals is None:
+            yield None, error_data, None
+            continue
+        report_vals = build_report_vals(reports)
+        RESULT_CACHE.set(key, dict(state_vals, **report_vals))
+        yield state_vals, None, report_vals
@@ -0,0 +1,55 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Default number of simulation result kept in memory
+DEFAULT_RESULT_CACHE_SIZE = 1024
+
+
+def normalize_script(input_cmd: str) -> str:
+    """ Apply the same trim and upper case rule as the command execution."""
+    return '\n'.join(line.strip().upper()
+                     for line in (input_cmd or '').strip().splitlines())
+
+
+def script_hash(input_cmd: str) -> str:
+    """ Hash of the normalized script."""
+    return hashlib.sha256(
+        normalize_script(input_cmd).encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """ Thread safe LRU cache of simulation result (final state values).
+    Key should contain the script hash, the module version and the board key,
+    so result of older version or other board is never used.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_RESULT_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Cache shared by every worker thread of the process
+RESULT_CACHE = ResultCache()
@@ -0,0 +1,184 @@
+import csv
+import io
+import json
+import zipfile
+from itertools import islice
+from odoo.exceptions import ValidationError
+
+# Default line used to separate scripts in a single text input
+DEFAULT_SCRIPT_DELIMITER = '---'
+# Column name of the script in a batch CSV file
+CSV_SCRIPT_COLUMN = 'script'
+# Default number of line compiled and executed at once when streaming
+DEFAULT_STREAM_CHUNK_SIZE = 1000
+
+
+def split_scripts(input_cmd: str,
+                  delimiter: str = DEFAULT_SCRIPT_DELIMITER) -> list:
+    """Split text input into scripts, a line containing only the delimiter
+    separate two scripts. Empty scripts are skipped.
+
+    Returns:
+        list: (script name, script text)
+    """
+    scripts = []
+    current_lines = []
+    for line in (input_cmd or '').splitlines() + [delimiter]:
+        if line.strip() != delimiter:
+            current_lines.append(line)
+            continue
+        script = '\n'.join(current_lines).strip()
+        if script:
+            scripts.append(('Script {}'.format(len(scripts) + 1), script))
+        current_lines = []
+    return scripts
+
+
+def read_batch_file(file_data: bytes, filename: str = '') -> list:
+    """Read scripts from uploaded file.
+    ZIP file: every file inside the archive is a script.
+    CSV file: every row is a script, taken from the "script" column or the
+    first column when there is no such header.
+
+    Returns:
+        list: (script name, script text)
+    """
+    if zipfile.is_zipfile(io.BytesIO(file_data)):
+        return _read_zip_file(file_data)
+    if not filename or filename.lower().endswith('.csv'):
+        return _read_csv_file(file_data)
+    raise ValidationError('Batch file should be a ZIP or a CSV file.')
+
+
+def _decode_file_data(file_data: bytes, name: str) -> str:
+    try:
+        return file_data.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise ValidationError('File "{}" should be UTF-8 text.'.format(name))
+
+
+def _read_zip_file(file_data: bytes) -> list:
+    scripts = []
+    with zipfile.ZipFile(io.BytesIO(file_data)) as archive:
+        for info in sorted(archive.infolist(), key=lambda info: info.filename):
+            if info.is_dir():
+                continue
+            script = _decode_file_data(
+                archive.read(info), info.filename).strip()
+            if script:
+                scripts.append((info.filename, script))
+    return scripts
+
+
+def _read_csv_file(file_data: bytes) -> list:
+    rows = list(csv.reader(io.StringIO(_decode_file_data(file_data, 'CSV'))))
+    if not rows:
+        return []
+
+    # Use the script column if there is a header, otherwise the first column
+    header = [column.strip().lower() for column in rows[0]]
+    column_index = 0
+    first_row = 0
+    if CSV_SCRIPT_COLUMN in header:
+        column_index = header.index(CSV_SCRIPT_COLUMN)
+        first_row = 1
+
+    scripts = []
+    for row_number, row in enumerate(rows[first_row:], first_row + 1):
+        if len(row) <= column_index or not row[column_index].strip():
+            continue
+        scripts.append(('Row {}'.format(row_number),
+                        row[column_index].strip()))
+    return scripts
+
+
+def iter_script_lines(file_obj, encoding: str = 'utf-8-sig'):
+    """Read script line by line from a file-like object.
+    Follow the same rule as trimming the whole input then splitting it per line:
+    leading and trailing blank lines are skipped. Only the number of pending
+    blank lines is kept, so memory usage does not depend on the file size.
+
+    Args:
+        file_obj (file-like): binary or text file object.
+        encoding (str, optional): encoding of binary file. Defaults to 'utf-8-sig'.
+
+    Yields:
+        str: script line, without line break.
+    """
+    text_file = file_obj
+    if not isinstance(file_obj, io.TextIOBase):
+        text_file = io.TextIOWrapper(file_obj, encoding=encoding)
+
+    is_started = False
+    pending_blank_line = 0
+    try:
+        for line in text_file:
+            line = line.rstrip('\r\n')
+            if not line.strip():
+                # Blank line is only yielded when followed by a command line
+                if is_started:
+                    pending_blank_line += 1
+                continue
+            for dummy in range(pending_blank_line):
+                yield ''
+            pending_blank_line = 0
+            is_started = True
+            yield line
+    finally:
+        # The wrapper close the binary file when it is deleted, keep the file
+        # open so the caller could read it again
+        if text_file is not file_obj:
+            text_file.detach()
+
+
+def iter_line_chunks(lines, chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE):
+    """Group lines into list of chunk_size lines.
+
+    Yields:
+        tuple: (line number of the first line, list of lines)
+    """
+    lines = iter(lines)
+    start_line = 1
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield start_line, chunk
+        start_line += len(chunk)
+
+
+def read_json_scripts(body: bytes, is_ndjson: bool = False) -> tuple:
+    """Read scripts from a JSON or NDJSON request body.
+    JSON body could be a script text, a list of scripts, or an object with a
+    "scripts" list and options. NDJSON body has a script per line. A script is
+    either a text or an object with "script" and optional "name".
+
+    Raises:
+        ValueError: when the body is not valid.
+
+    Returns:
+        tuple: (list of (script name, script text), options dict)
+    """
+    text = body.decode('utf-8-sig') if isinstance(body, bytes) else body
+    options = dict()
+    if is_ndjson:
+        items = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        items = json.loads(text)
+        if isinstance(items, dict):
+            options = {key: value for key, value in items.items()
+                       if key not in ('scripts', 'script', 'name')}
+            items = items['scripts'] if 'scripts' in items else [items]
+        elif not isinstance(items, list):
+            items = [items]
+
+    scripts = []
+    for index, item in enumerate(items, 1):
+        name = 'Script {}'.format(index)
+        if isinstance(item, dict):
+            name = str(item.get('name') or name)
+            item = item.get('script')
+        if not isinstance(item, str):
+            raise ValueError('Script {} should be a text.'.format(index))
+        scripts.append((name, item))
+    return scripts, options
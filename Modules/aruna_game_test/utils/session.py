@@ -0,0 +1,145 @@
+from .board import Board, DEFAULT_BOARD
+from .common_utils import INTEGER_PATTERN
+from .compiler import compile_script
+from .constants import OBJECT_TURNING_POS, OP_MOVE
+from .exceptions import CommandLineError
+from .simulation import GameState, CommandSimulator, FACING_X_MODIFIER,\
+    FACING_Y_MODIFIER
+
+# Prefix of a session command, example "ROBOT 3 MOVE"
+ROBOT_COMMAND_PREFIX = 'ROBOT'
+
+
+def occupied_reason(robot_number: int) -> str:
+    return 'Cell is occupied by robot {}, object would collide.'.format(
+        robot_number)
+
+
+def parse_robot_command(cmd: str) -> tuple:
+    """Split session command into robot number and robot command.
+
+    Returns:
+        tuple: (robot number, command text), or (None, None) when the command
+        is not addressed to a robot.
+    """
+    data = cmd.strip().split(None, 2)
+    if len(data) != 3 or data[0].upper() != ROBOT_COMMAND_PREFIX or \
+            not INTEGER_PATTERN.fullmatch(data[1]) or int(data[1]) < 0:
+        return None, None
+    return int(data[1]), data[2]
+
+
+class SessionSimulator:
+    """ Execute commands addressed to many robots sharing the same table.
+    Every robot follow the single robot rules (see CommandSimulator), and a
+    robot could not move into a cell occupied by another robot.
+
+    Occupancy is a hash of cell to robot number, only robots properly placed
+    on the table are kept, so every command is checked and updated in O(1).
+    """
+
+    def __init__(self, board: Board = None, states: dict = None) -> None:
+        """
+        Args:
+            board (Board, optional): table configuration. Defaults to the 5x5 table.
+            states (dict, optional): start GameState keyed by robot number.
+        """
+        self.board = board or DEFAULT_BOARD
+        self.simulators = dict()
+        self.occupancy = dict()
+        for robot_number, state in (states or dict()).items():
+            self._get_simulator(robot_number, state)
+            if state.is_properly_placed:
+                self.occupancy[(state.x_pos, state.y_pos)] = robot_number
+
+    @property
+    def states(self) -> dict:
+        """ Current GameState keyed by robot number."""
+        return {robot_number: simulator.state
+                for robot_number, simulator in self.simulators.items()}
+
+    def _get_simulator(self, robot_number: int,
+                       state: GameState = None) -> CommandSimulator:
+        simulator = self.simulators.get(robot_number)
+        if simulator is None:
+            simulator = CommandSimulator(state, board=self.board)
+            self.simulators[robot_number] = simulator
+        return simulator
+
+    def run(self, command_list, start_line: int = 1) -> dict:
+        """Execute every session command in the list.
+
+        Args:
+            command_list (iterable): "ROBOT N COMMAND" text, one per item.
+            start_line (int, optional): line number of the first command.
+
+        Raises:
+            CommandLineError: when any command failed, error data also contain
+            the robot number.
+
+        Returns:
+            dict: GameState keyed by robot number.
+        """
+        for line, cmd in enumerate(command_list, start_line):
+            self.execute_line(line, cmd)
+        return self.states
+
+    def execute_line(self, line: int, cmd: str):
+        robot_number, robot_cmd = parse_robot_command(cmd)
+        if robot_number is None:
+            raise CommandLineError({
+                'line': line,
+                'command': cmd.strip(),
+                'reason': 'Invalid command "{}"\nSession command should be '
+                          '"ROBOT N COMMAND".'.format(cmd.strip()),
+                'robot': False,
+                'position_before_error': GameState().position(),
+                'position_at_error': GameState().position()
+            })
+
+        simulator = self._get_simulator(robot_number)
+        state = simulator.state
+        was_on_table = state.is_properly_placed
+        cell = (state.x_pos, state.y_pos)
+        compiled = compile_script(robot_cmd, state.is_placed)
+
+        if was_on_table and len(compiled) and compiled.opcodes[0] == OP_MOVE:
+            # Check the target cell before moving, a single command per line
+            facing = OBJECT_TURNING_POS.index(state.facing)
+            target = (state.x_pos + FACING_X_MODIFIER[facing],
+                      state.y_pos + FACING_Y_MODIFIER[facing])
+            other_robot = self.occupancy.get(target)
+            if other_robot is not None:
+                at_error = state.copy()
+                at_error.x_pos, at_error.y_pos = target
+                raise CommandLineError({
+                    'line': line,
+                    'command': cmd.strip(),
+                    'reason': occupied_reason(other_robot),
+                    'robot': robot_number,
+                    'position_before_error': state.position(),
+                    'position_at_error': at_error.position()
+                })
+
+        try:
+            simulator.execute(compiled)
+        except CommandLineError as err:
+            err.error_data.update(
+                line=line, command=cmd.strip(), robot=robot_number)
+            raise
+
+        # Update occupancy of the robot
+        if was_on_table and self.occupancy.get(cell) == robot_number:
+            del self.occupancy[cell]
+        if state.is_properly_placed:
+            new_cell = (state.x_pos, state.y_pos)
+            if self.occupancy.setdefault(new_cell, robot_number) != robot_number:
+                # Placed on another robot, handled like outside the table
+                state.is_properly_placed = False
+
+
+def simulate_session(input_cmd: str, board: Board = None,
+                     states: dict = None) -> dict:
+    """ Execute session text input in memory, see SessionSimulator."""
+    simulator = SessionSimulator(board, states)
+    return simulator.run((input_cmd or '').strip().splitlines())
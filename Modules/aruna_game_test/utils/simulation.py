@@ -0,0 +1,310 @@
+from .constants import eObjectFacing, OBJECT_TURNING_POS, MOVE_MODIFIER,\
+    OP_PLACE, OP_MOVE, OP_LEFT, OP_RIGHT,\
+    OP_REPORT, OP_ERROR, OP_MOVE_RUN, OP_TURN
+from .compiler import CompiledScript, compile_commands, compile_script,\
+    fold_runs
+from .exceptions import CommandLineError
+from .board import Board, DEFAULT_BOARD
+
+FACING_COUNT = len(OBJECT_TURNING_POS)
+# Move modifier indexed by facing index of OBJECT_TURNING_POS
+FACING_X_MODIFIER = tuple(MOVE_MODIFIER[facing].x_pos
+                          for facing in OBJECT_TURNING_POS)
+FACING_Y_MODIFIER = tuple(MOVE_MODIFIER[facing].y_pos
+                          for facing in OBJECT_TURNING_POS)
+
+X_OUT_OF_BOUND_REASON = 'X Coordinate is out of bound, object would fall.'
+Y_OUT_OF_BOUND_REASON = 'Y Coordinate is out of bound, object would fall.'
+OBSTACLE_REASON = 'Cell is blocked by an obstacle, object would collide.'
+# Number of REPORT output shown per page of the report log
+DEFAULT_REPORT_PAGE_SIZE = 80
+# Game fields holding the REPORT output, cached with the final state
+REPORT_FIELDS = ('report_log', 'report_count')
+
+
+class GameState:
+    """ In memory robot state, mirror the game model fields.
+    Used by the simulation engine so the whole command script could be executed
+    without touching the ORM, the result is written to the game record at once.
+    """
+    __slots__ = ('x_pos', 'y_pos', 'facing', 'is_placed',
+                 'is_properly_placed', 'is_reported')
+
+    def __init__(self, x_pos: int = 0, y_pos: int = 0,
+                 facing: str = eObjectFacing.north.name,
+                 is_placed: bool = False, is_properly_placed: bool = False,
+                 is_reported: bool = False) -> None:
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.facing = facing
+        self.is_placed = is_placed
+        self.is_properly_placed = is_properly_placed
+        self.is_reported = is_reported
+
+    def copy(self):
+        return GameState(self.x_pos, self.y_pos, self.facing, self.is_placed,
+                         self.is_properly_placed, self.is_reported)
+
+    def position(self) -> list:
+        """ Position data used in error message, example [0, 1, 'NORTH']."""
+        return [self.x_pos, self.y_pos, self.facing.upper()]
+
+    def report(self) -> str:
+        """ Position report, same as the report field of the game model."""
+        if self.is_placed and not self.is_properly_placed:
+            return '(Robot Position is Outside the Table, Report Ignored)'
+        if self.is_placed and self.is_reported:
+            return '{},{},{}'.format(self.x_pos, self.y_pos, self.facing.upper())
+        return ''
+
+    def to_vals(self) -> dict:
+        """ Convert state to game model values."""
+        return {
+            'x_pos': self.x_pos,
+            'y_pos': self.y_pos,
+            'facing': self.facing,
+            'is_placed': self.is_placed,
+            'is_properly_placed': self.is_properly_placed,
+            'is_reported': self.is_reported
+        }
+
+
+########################################################################
+# Simulation Engine
+########################################################################
+
+class CommandSimulator:
+    """ Execute command script against an in memory GameState.
+    Follow the same rules as the game model:
+    - all command before the first valid PLACE command is discarded
+    - robot placed outside the table ignore every movement command
+    - failed command raise CommandLineError with line number and position data
+
+    The simulator could be run several times, example for chunk of a script,
+    the state is continued from the previous run.
+    Table limits come from the given Board, loaded once before the simulation.
+    When a reports list is given, the output of every REPORT command is
+    appended to it as (line number, "x,y,FACING").
+    When on_step is given, it is called after every executed command with
+    (line number, opcode, x_pos, y_pos, facing index), see StepRecorder.
+    """
+
+    def __init__(self, state: GameState = None,
+                 state_before_error: GameState = None,
+                 board: Board = None, reports: list = None,
+                 on_step=None) -> None:
+        self.board = board or DEFAULT_BOARD
+        self.state = state or GameState()
+        # Position before the last executed command, for error purpose
+        self.state_before_error = state_before_error or self.state.copy()
+        self.reports = reports
+        self.on_step = on_step
+
+    def run(self, command_list, start_line: int = 1) -> GameState:
+        """Compile and execute every command in the list.
+
+        Args:
+            command_list (iterable): command text, one command per item.
+            start_line (int, optional): line number of the first command. Defaults to 1.
+
+        Raises:
+            CommandLineError: when any command failed.
+        """
+        compiled = compile_commands(
+            command_list, start_line, self.state.is_placed)
+        # Every command is a step, runs are only folded without step callback
+        if self.on_step is None:
+            compiled = fold_runs(compiled)
+        return self.execute(compiled)
+
+    def execute(self, compiled: CompiledScript) -> GameState:
+        """Execute compiled command script. With on_step, the script should
+        not be folded (see run), so every command produce its own step.
+
+        Raises:
+            CommandLineError: when any command failed.
+        """
+        state = self.state
+        before = self.state_before_error
+        x_pos, y_pos = state.x_pos, state.y_pos
+        facing = OBJECT_TURNING_POS.index(state.facing)
+        is_placed = state.is_placed
+        is_properly_placed = state.is_properly_placed
+        is_reported = state.is_reported
+        before_x_pos, before_y_pos = before.x_pos, before.y_pos
+        before_facing = OBJECT_TURNING_POS.index(before.facing)
+        max_x, max_y = self.board.max_x, self.board.max_y
+        obstacles = self.board.obstacles
+        is_blocked = obstacles.is_blocked if obstacles is not None else None
+        reports = self.reports
+        on_step = self.on_step
+        line_numbers = compiled.line_numbers
+
+        operands = compiled.operands
+        operand_index = 0
+        error_index = None
+        error_offset = 0
+        error_reason = None
+
+        for index, opcode in enumerate(compiled.opcodes):
+            if opcode == OP_PLACE:
+                x_pos, y_pos, facing = operands[operand_index]
+                operand_index += 1
+                is_placed = True
+                is_properly_placed = 0 <= x_pos <= max_x and 0 <= y_pos <= max_y
+                if is_properly_placed and is_blocked is not None:
+                    is_properly_placed = not is_blocked(x_pos, y_pos)
+                if on_step is not None:
+                    on_step(line_numbers[index], opcode, x_pos, y_pos, facing)
+                continue
+            if opcode == OP_ERROR:
+                error_index = index
+                error_reason = operands[operand_index]
+                break
+
+            # Save initial position data for error purpose
+            before_x_pos, before_y_pos, before_facing = x_pos, y_pos, facing
+            if not is_properly_placed:
+                if opcode == OP_MOVE_RUN or opcode == OP_TURN:
+                    operand_index += 1
+                if on_step is not None:
+                    on_step(line_numbers[index], opcode, x_pos, y_pos, facing)
+                continue
+
+            if opcode == OP_MOVE:
+                x_pos += FACING_X_MODIFIER[facing]
+                y_pos += FACING_Y_MODIFIER[facing]
+                if x_pos > max_x or x_pos < 0:
+                    error_index = index
+                    error_reason = X_OUT_OF_BOUND_REASON
+                    break
+                if y_pos > max_y or y_pos < 0:
+                    error_index = index
+                    error_reason = Y_OUT_OF_BOUND_REASON
+                    break
+                if is_blocked is not None and is_blocked(x_pos, y_pos):
+                    error_index = index
+                    error_reason = OBSTACLE_REASON
+                    break
+            elif opcode == OP_MOVE_RUN:
+                move_count = operands[operand_index]
+                operand_index += 1
+                x_modifier = FACING_X_MODIFIER[facing]
+                y_modifier = FACING_Y_MODIFIER[facing]
+                # Number of move available before the robot fall
+                if x_modifier > 0:
+                    move_limit = max_x - x_pos
+                elif x_modifier < 0:
+                    move_limit = x_pos
+                elif y_modifier > 0:
+                    move_limit = max_y - y_pos
+                else:
+                    move_limit = y_pos
+                limit_reason = X_OUT_OF_BOUND_REASON if x_modifier \
+                    else Y_OUT_OF_BOUND_REASON
+                if obstacles is not None:
+                    # Obstacle on the way stop the robot before the table edge
+                    free_steps = obstacles.free_steps(
+                        x_pos, y_pos, x_modifier, y_modifier, move_count)
+                    if free_steps is not None and free_steps < move_limit:
+                        move_limit = free_steps
+                        limit_reason = OBSTACLE_REASON
+
+                if move_count > move_limit:
+                    # The move at move_limit offset of the run would fall
+                    before_x_pos = x_pos + x_modifier * move_limit
+                    before_y_pos = y_pos + y_modifier * move_limit
+                    x_pos = before_x_pos + x_modifier
+                    y_pos = before_y_pos + y_modifier
+                    error_index = index
+                    error_offset = move_limit
+                    error_reason = limit_reason
+                    break
+                before_x_pos = x_pos + x_modifier * (move_count - 1)
+                before_y_pos = y_pos + y_modifier * (move_count - 1)
+                x_pos = x_pos + x_modifier * move_count
+                y_pos = y_pos + y_modifier * move_count
+            elif opcode == OP_TURN:
+                net_turn, net_turn_before_last = operands[operand_index]
+                operand_index += 1
+                before_facing = (facing + net_turn_before_last) % FACING_COUNT
+                facing = (facing + net_turn) % FACING_COUNT
+            elif opcode == OP_LEFT:
+                facing = (facing - 1) % FACING_COUNT
+            elif opcode == OP_RIGHT:
+                facing = (facing + 1) % FACING_COUNT
+            elif opcode == OP_REPORT:
+                is_reported = True
+                if reports is not None:
+                    reports.append((line_numbers[index], '{},{},{}'.format(
+                        x_pos, y_pos, OBJECT_TURNING_POS[facing].upper())))
+            if on_step is not None:
+                on_step(line_numbers[index], opcode, x_pos, y_pos, facing)
+
+        # Write back local data to the state
+        state.x_pos, state.y_pos = x_pos, y_pos
+        state.facing = OBJECT_TURNING_POS[facing]
+        state.is_placed = is_placed
+        state.is_properly_placed = is_properly_placed
+        state.is_reported = is_reported
+        before.x_pos, before.y_pos = before_x_pos, before_y_pos
+        before.facing = OBJECT_TURNING_POS[before_facing]
+
+        if error_index is not None:
+            raise CommandLineError(self.build_error_data(
+                line_numbers[error_index] + error_offset,
+                compiled.command_at(error_index, error_offset), error_reason))
+        return state
+
+    def build_error_data(self, line: int, cmd: str, reason: str) -> dict:
+        return {
+            'line': line,
+            'command': cmd,
+            'reason': reason,
+            'position_before_error': self.state_before_error.position(),
+            'position_at_error': self.state.position()
+        }
+
+
+def format_report_log(reports) -> str:
+    """ Join REPORT outputs, one per line, as stored in the report log."""
+    return '\n'.join(report for line, report in reports)
+
+
+def build_report_vals(reports: list) -> dict:
+    """ Report log values of the game, every REPORT output is stored at once."""
+    return {
+        'report_log': format_report_log(reports) or False,
+        'report_count': len(reports)
+    }
+
+
+def simulate_script(input_cmd: str, state: GameState = None,
+                    board: Board = None) -> GameState:
+    """ Compile (cached) and execute the given text input in memory."""
+    simulator = CommandSimulator(state, board=board)
+    return simulator.execute(
+        compile_script(input_cmd, simulator.state.is_placed))
+
+
+def simulate_stream(chunks, state: GameState = None, board: Board = None,
+                    reports: list = None, on_step=None) -> GameState:
+    """Execute script chunk by chunk, each chunk is compiled then executed
+    before reading the next one, so only the current chunk is kept in memory.
+
+    Args:
+        chunks (iterable): (line number of the first line, list of lines), see
+        script_source.iter_line_chunks.
+        state (GameState, optional): start state. Defaults to not placed robot.
+        board (Board, optional): table configuration. Defaults to the 5x5 table.
+        reports (list, optional): REPORT output is appended to it.
+        on_step (callable, optional): called after every executed command.
+
+    Raises:
+        CommandLineError: when any command failed.
+    """
+    simulator = CommandSimulator(state, board=board, reports=reports,
+                                 on_step=on_step)
+    for start_line, command_list in chunks:
+        simulator.run(command_list, start_line)
+    return simulator.state
@@ -0,0 +1,269 @@
+import struct
+import zlib
+from array import array
+from bisect import bisect_left
+from .constants import OBJECT_TURNING_POS, OP_PLACE, OP_REPORT
+from .exceptions import CommandLineError
+from .simulation import GameState, CommandSimulator
+from .board import Board, DEFAULT_BOARD
+
+# Default number of journal step inserted by a single query
+DEFAULT_JOURNAL_CHUNK_SIZE = 5000
+# Default number of step between two absolute positions of a trajectory
+DEFAULT_KEYFRAME_INTERVAL = 1024
+
+# Packed trajectory header per format version: magic, format version, line of
+# the first step, number of step, keyframe interval, number of PLACE step and
+# since version 2 the line of the first REPORT executed on the table
+TRAJECTORY_HEADERS = {
+    1: struct.Struct('<4sBIIII'),
+    2: struct.Struct('<4sBIIIII')
+}
+TRAJECTORY_MAGIC = b'ARTJ'
+TRAJECTORY_VERSION = 2
+# Step code bits: facing index (2 bits), x delta + 1 (2 bits), y delta + 1
+# (2 bits) and PLACE flag, position of PLACE step is kept in a side table
+CODE_FACING_MASK = 0x03
+CODE_PLACE_FLAG = 0x40
+
+
+class StepRecorder:
+    """ Compact record of the executed commands, filled while the script is
+    simulated (given as CommandSimulator on_step), so the journal and the
+    trajectory come from the real simulation. A step takes 14 bytes.
+    Command before the first PLACE produce no step, and recording stop at the
+    failed command.
+    """
+    __slots__ = ('lines', 'opcodes', 'x_positions', 'y_positions', 'facings')
+
+    def __init__(self) -> None:
+        self.lines = array('I')
+        self.opcodes = array('b')
+        self.x_positions = array('i')
+        self.y_positions = array('i')
+        self.facings = array('b')
+
+    def __call__(self, line: int, opcode: int, x_pos: int, y_pos: int,
+                 facing: int) -> None:
+        self.lines.append(line)
+        self.opcodes.append(opcode)
+        self.x_positions.append(x_pos)
+        self.y_positions.append(y_pos)
+        self.facings.append(facing)
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def __iter__(self):
+        """ Yield (line number, opcode, x_pos, y_pos, facing index)."""
+        return zip(self.lines, self.opcodes, self.x_positions,
+                   self.y_positions, self.facings)
+
+
+def record_steps(command_list, state: GameState = None,
+                 board: Board = None) -> StepRecorder:
+    """Simulate command lines and record every executed command, steps before
+    a failed command are kept.
+
+    Args:
+        command_list (iterable): command text, one command per item.
+        state (GameState, optional): start state. Defaults to not placed robot.
+        board (Board, optional): table configuration. Defaults to the 5x5 table.
+    """
+    steps = StepRecorder()
+    try:
+        CommandSimulator(state, board=board, on_step=steps).run(command_list)
+    except CommandLineError:
+        pass
+    return steps
+
+
+########################################################################
+# Packed Trajectory
+########################################################################
+
+class Trajectory:
+    """ Compact trajectory of a script, one byte per step.
+    Steps are on consecutive lines (every line after the first PLACE produce a
+    step), so the step of a line is found by its offset from first_line.
+    Each step code hold the facing and the move delta, PLACE step position is
+    kept in a side table, and the absolute position is kept every interval
+    steps so a state is decoded from the nearest keyframe only.
+
+    codes: step codes, see CODE_* constants.
+    keyframes: x, y pairs, position before the step at each interval.
+    place_steps: step index of each PLACE, with its x, y in place_positions.
+    report_line: line of the first REPORT executed on the table, 0 when there
+    is none, None when unknown (trajectory packed by format version 1).
+    """
+    __slots__ = ('first_line', 'interval', 'report_line', 'codes', 'keyframes',
+                 'place_steps', 'place_positions')
+
+    def __init__(self, first_line: int = 0,
+                 interval: int = DEFAULT_KEYFRAME_INTERVAL,
+                 report_line: int = 0) -> None:
+        self.first_line = first_line
+        self.interval = interval
+        self.report_line = report_line
+        self.codes = bytearray()
+        self.keyframes = array('i')
+        self.place_steps = array('I')
+        self.place_positions = array('i')
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def last_line(self) -> int:
+        return self.first_line + len(self.codes) - 1
+
+    @classmethod
+    def from_steps(cls, steps, interval: int = DEFAULT_KEYFRAME_INTERVAL,
+                   board: Board = None):
+        """Pack recorded steps, see StepRecorder.
+
+        Args:
+            steps (iterable): (line number, opcode, x_pos, y_pos, facing index)
+            interval (int, optional): number of step between two keyframes.
+            board (Board, optional): table of the simulation, REPORT is only
+            executed on the table. Defaults to the 5x5 table.
+
+        Raises:
+            ValueError: when steps are not on consecutive lines.
+        """
+        board = board or DEFAULT_BOARD
+        trajectory = cls(interval=interval)
+        codes = trajectory.codes
+        keyframes = trajectory.keyframes
+        x_pos = y_pos = 0
+        for line, opcode, new_x_pos, new_y_pos, facing in steps:
+            step = len(codes)
+            if not step:
+                trajectory.first_line = line
+            elif line != trajectory.first_line + step:
+                raise ValueError('Trajectory step should be on consecutive lines.')
+            if step % interval == 0:
+                keyframes.extend((x_pos, y_pos))
+            if opcode == OP_REPORT and not trajectory.report_line and \
+                    board.contains(new_x_pos, new_y_pos) and \
+                    not board.is_blocked(new_x_pos, new_y_pos):
+                trajectory.report_line = line
+
+            dx, dy = new_x_pos - x_pos, new_y_pos - y_pos
+            if opcode == OP_PLACE or dx not in (-1, 0, 1) or dy not in (-1, 0, 1):
+                trajectory.place_steps.append(step)
+                trajectory.place_positions.extend((new_x_pos, new_y_pos))
+                codes.append(CODE_PLACE_FLAG | facing)
+            else:
+                codes.append(facing | (dx + 1) << 2 | (dy + 1) << 4)
+            x_pos, y_pos = new_x_pos, new_y_pos
+        return trajectory
+
+    def to_bytes(self) -> bytes:
+        """ Serialize and compress the trajectory."""
+        header = TRAJECTORY_HEADERS[TRAJECTORY_VERSION].pack(
+            TRAJECTORY_MAGIC, TRAJECTORY_VERSION, self.first_line,
+            len(self.codes), self.interval, len(self.place_steps),
+            self.report_line)
+        return zlib.compress(
+            header + self.keyframes.tobytes() + self.place_steps.tobytes() +
+            self.place_positions.tobytes() + bytes(self.codes))
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """Decompress a trajectory serialized by to_bytes.
+
+        Raises:
+            ValueError: when the data is not a trajectory.
+        """
+        buffer = memoryview(zlib.decompress(data))
+        header = TRAJECTORY_HEADERS.get(buffer[4] if len(buffer) > 4 else None)
+        if bytes(buffer[:4]) != TRAJECTORY_MAGIC or header is None:
+            raise ValueError('Unknown trajectory format.')
+        header_values = header.unpack_from(buffer)
+        magic, version, first_line, step_count, interval, place_count = \
+            header_values[:6]
+        report_line = header_values[6] if version >= 2 else None
+
+        trajectory = cls(first_line, interval, report_line)
+        offset = header.size
+        for table, item_count in (
+                (trajectory.keyframes, -(-step_count // interval) * 2),
+                (trajectory.place_steps, place_count),
+                (trajectory.place_positions, place_count * 2)):
+            end = offset + item_count * table.itemsize
+            table.frombytes(buffer[offset:end])
+            offset = end
+        # Step codes are only read, keep a view on the decompressed data
+        trajectory.codes = buffer[offset:offset + step_count]
+        return trajectory
+
+    def _position_before(self, step: int) -> tuple:
+        """ Position before the given step, from the nearest keyframe."""
+        keyframe = step // self.interval
+        x_pos, y_pos = self.keyframes[keyframe * 2:keyframe * 2 + 2]
+        start = keyframe * self.interval
+        place_index = bisect_left(self.place_steps, start)
+        for code in memoryview(self.codes)[start:step]:
+            if code & CODE_PLACE_FLAG:
+                x_pos = self.place_positions[place_index * 2]
+                y_pos = self.place_positions[place_index * 2 + 1]
+                place_index += 1
+            else:
+                x_pos += (code >> 2 & 0x03) - 1
+                y_pos += (code >> 4 & 0x03) - 1
+        return x_pos, y_pos
+
+    def iter_states(self, line_from: int = None, line_to: int = None):
+        """Decode states of the lines between line_from and line_to (included)
+        lazily, lines without step are skipped.
+
+        Yields:
+            tuple: (line number, x_pos, y_pos, facing)
+        """
+        start = max((line_from or self.first_line) - self.first_line, 0)
+        end = len(self.codes)
+        if line_to is not None:
+            end = min(line_to - self.first_line + 1, end)
+        if start >= end:
+            return
+
+        x_pos, y_pos = self._position_before(start)
+        place_index = bisect_left(self.place_steps, start)
+        line = self.first_line + start
+        for code in memoryview(self.codes)[start:end]:
+            if code & CODE_PLACE_FLAG:
+                x_pos = self.place_positions[place_index * 2]
+                y_pos = self.place_positions[place_index * 2 + 1]
+                place_index += 1
+            else:
+                x_pos += (code >> 2 & 0x03) - 1
+                y_pos += (code >> 4 & 0x03) - 1
+            yield line, x_pos, y_pos, OBJECT_TURNING_POS[code & CODE_FACING_MASK]
+            line += 1
+
+    def state_at(self, line: int):
+        """ State after the given line, None when the line has no step."""
+        for state in self.iter_states(line, line):
+            return state
+        return None
+
+    def game_state_at(self, line: int, board: Board = None) -> GameState:
+        """Game state after the given line of a script without error, every
+        line after the first PLACE has a step. report_line should be known.
+
+        Args:
+            line (int): number of executed line.
+            board (Board, optional): table of the simulation. Defaults to the
+            5x5 table.
+        """
+        board = board or DEFAULT_BOARD
+        step_state = self.state_at(min(line, self.last_line))
+        if step_state is None:
+            # No PLACE executed yet
+            return GameState()
+        dummy, x_pos, y_pos, facing = step_state
+        return GameState(
+            x_pos, y_pos, facing, True,
+            board.contains(x_pos, y_pos) and not board.is_blocked(x_pos, y_pos),
+            0 < self.report_line <= line)
@@ -0,0 +1,287 @@
+from array import array
+from functools import reduce
+from .constants import OBJECT_TURNING_POS, OP_PLACE, OP_MOVE, OP_LEFT, OP_RIGHT, OP_REPORT, OP_ERROR, OP_MOVE_RUN,\
+    OP_TURN
+from .board import Board, DEFAULT_BOARD
+from .compiler import CompiledScript
+from .simulation import GameState, FACING_COUNT, FACING_X_MODIFIER,\
+    FACING_Y_MODIFIER
+
+# State space up to this size use bytes table, so composition run in C with
+# bytes.translate
+BYTES_TABLE_SIZE = 256
+
+
+class StateSpace:
+    """ Enumerate every reachable robot state of a table.
+
+    State id layout, with N = table width * table height * 4 facing:
+    - 0 .. N - 1: robot on the table, ((y * width) + x) * 4 + facing index
+    - N .. 2N - 1: same as above, with report flag set
+    - UNPLACED, OFF_TABLE and OFF_TABLE_REPORTED: robot not placed yet, or
+      placed outside the table. Every movement command is ignored on these
+      states, so the position is kept by the segment (see TransitionSegment)
+    - FAILED: a command failed, the robot would fall or the command is invalid
+    """
+
+    def __init__(self, board: Board = None) -> None:
+        self.board = board or DEFAULT_BOARD
+        self.width = self.board.width
+        self.cell_state_count = self.board.width * self.board.height * \
+            FACING_COUNT
+        self.unplaced = 2 * self.cell_state_count
+        self.off_table = self.unplaced + 1
+        self.off_table_reported = self.unplaced + 2
+        self.failed = self.unplaced + 3
+        self.state_count = self.unplaced + 4
+        self.use_bytes = self.state_count <= BYTES_TABLE_SIZE
+        self._op_table_cache = dict()
+        self.identity = self.new_table(range(self.state_count))
+
+    ########################################################################
+    # State encoding
+    ########################################################################
+
+    def is_on_table(self, x_pos: int, y_pos: int) -> bool:
+        """ Robot could stand on the cell, inside the table and not blocked."""
+        return self.board.contains(x_pos, y_pos) and \
+            not self.board.is_blocked(x_pos, y_pos)
+
+    def cell_state(self, x_pos: int, y_pos: int, facing: int,
+                   is_reported: bool) -> int:
+        state_id = (y_pos * self.width + x_pos) * FACING_COUNT + facing
+        if is_reported:
+            state_id += self.cell_state_count
+        return state_id
+
+    def is_reported(self, state_id: int) -> bool:
+        if state_id < self.unplaced:
+            return state_id >= self.cell_state_count
+        return state_id == self.off_table_reported
+
+    def encode(self, state: GameState) -> int:
+        """ Get state id of the given GameState."""
+        if not state.is_placed:
+            return self.unplaced
+        if not state.is_properly_placed:
+            return self.off_table_reported if state.is_reported \
+                else self.off_table
+        return self.cell_state(state.x_pos, state.y_pos,
+                               OBJECT_TURNING_POS.index(state.facing),
+                               state.is_reported)
+
+    def decode(self, state_id: int, start_state: GameState = None,
+               last_place: tuple = None) -> GameState:
+        """Get GameState from a state id.
+
+        Args:
+            state_id (int): state id, should not be FAILED.
+            start_state (GameState, optional): state before the segment, used
+            for UNPLACED and OFF_TABLE state which keep the position.
+            last_place (tuple, optional): last PLACE operand of the segment.
+        """
+        if state_id < self.unplaced:
+            is_reported = state_id >= self.cell_state_count
+            cell, facing = divmod(state_id % self.cell_state_count,
+                                  FACING_COUNT)
+            y_pos, x_pos = divmod(cell, self.width)
+            return GameState(x_pos, y_pos, OBJECT_TURNING_POS[facing], True,
+                             True, is_reported)
+
+        state = start_state.copy() if start_state else GameState()
+        if state_id == self.unplaced:
+            return state
+        # Robot is placed outside the table, position come from the last
+        # PLACE of the segment, or from the start state if there is none.
+        if last_place is not None:
+            state.x_pos, state.y_pos = last_place[0], last_place[1]
+            state.facing = OBJECT_TURNING_POS[last_place[2]]
+        state.is_placed = True
+        state.is_properly_placed = False
+        state.is_reported = state_id == self.off_table_reported
+        return state
+
+    ########################################################################
+    # Transition table
+    ########################################################################
+
+    def new_table(self, state_ids):
+        """ Build table from a list of next state id, indexed by state id."""
+        if self.use_bytes:
+            table = bytearray(BYTES_TABLE_SIZE)
+            table[:self.state_count] = bytes(state_ids)
+            return bytes(table)
+        return array('I', state_ids)
+
+    def compose(self, first_table, second_table):
+        """ Table of running first_table then second_table."""
+        if self.use_bytes:
+            return first_table.translate(second_table)
+        return array('I', [second_table[state_id] for state_id in first_table])
+
+    def _apply(self, opcode: int, operand, state_id: int) -> int:
+        """ Next state id of a single opcode."""
+        if state_id == self.failed or opcode == OP_ERROR:
+            return self.failed
+        is_reported = self.is_reported(state_id)
+
+        if opcode == OP_PLACE:
+            x_pos, y_pos, facing = operand
+            if self.is_on_table(x_pos, y_pos):
+                return self.cell_state(x_pos, y_pos, facing, is_reported)
+            return self.off_table_reported if is_reported else self.off_table
+
+        # Every other command is ignored when the robot is not on the table
+        if state_id >= self.unplaced:
+            return state_id
+        cell, facing = divmod(state_id % self.cell_state_count, FACING_COUNT)
+        y_pos, x_pos = divmod(cell, self.width)
+
+        if opcode == OP_MOVE or opcode == OP_MOVE_RUN:
+            move_count = operand if opcode == OP_MOVE_RUN else 1
+            x_modifier = FACING_X_MODIFIER[facing]
+            y_modifier = FACING_Y_MODIFIER[facing]
+            obstacles = self.board.obstacles
+            if obstacles is not None and obstacles.free_steps(
+                    x_pos, y_pos, x_modifier, y_modifier, move_count) is not None:
+                return self.failed
+            x_pos += x_modifier * move_count
+            y_pos += y_modifier * move_count
+            if not self.board.contains(x_pos, y_pos):
+                return self.failed
+        elif opcode == OP_LEFT:
+            facing = (facing - 1) % FACING_COUNT
+        elif opcode == OP_RIGHT:
+            facing = (facing + 1) % FACING_COUNT
+        elif opcode == OP_TURN:
+            facing = (facing + operand[0]) % FACING_COUNT
+        elif opcode == OP_REPORT:
+            is_reported = True
+        return self.cell_state(x_pos, y_pos, facing, is_reported)
+
+    def op_table(self, opcode: int, operand=None):
+        """ Transition table of a single opcode, cached per opcode and operand."""
+        # Normalize operand which give the same table, so the cache stay small
+        key_operand = operand
+        if opcode == OP_ERROR:
+            key_operand = None
+        elif opcode == OP_PLACE and not self.is_on_table(operand[0], operand[1]):
+            key_operand = False
+        elif opcode == OP_MOVE_RUN:
+            # Moving the table width or height or more always fall
+            key_operand = min(operand, max(self.board.width, self.board.height))
+        key = (opcode, key_operand)
+        table = self._op_table_cache.get(key)
+        if table is None:
+            table = self.new_table([
+                self._apply(opcode, operand, state_id)
+                for state_id in range(self.state_count)])
+            self._op_table_cache[key] = table
+        return table
+
+    def build_segment(self, ops) -> 'TransitionSegment':
+        """Build transition segment of a list of opcode.
+
+        Args:
+            ops (iterable): (opcode, operand, line number), see CompiledScript.iter_ops
+        """
+        table = self.identity
+        last_place = None
+        for opcode, operand, line in ops:
+            if opcode == OP_PLACE:
+                last_place = operand
+            table = self.compose(table, self.op_table(opcode, operand))
+        return TransitionSegment(self, table, last_place)
+
+
+class TransitionSegment:
+    """ Transition table of a script segment, map every start state id to the
+    final state id. Segments are combined by table composition, which is
+    associative, so a script could be reduced chunk by chunk in any grouping.
+    """
+    __slots__ = ('space', 'table', 'last_place')
+
+    def __init__(self, space: StateSpace, table, last_place: tuple = None) -> None:
+        self.space = space
+        self.table = table
+        self.last_place = last_place
+
+    def __add__(self, other: 'TransitionSegment') -> 'TransitionSegment':
+        """ Segment of running this segment then the other one."""
+        last_place = other.last_place
+        if last_place is None:
+            last_place = self.last_place
+        return TransitionSegment(
+            self.space, self.space.compose(self.table, other.table),
+            last_place)
+
+    def final_state(self, start_state: GameState = None) -> GameState:
+        """Final state of the segment for the given start state.
+
+        Returns:
+            GameState: final state, or None if a command would fail.
+        """
+        start_state = start_state or GameState()
+        space = self.space
+        final_state_id = self.table[space.encode(start_state)]
+        if final_state_id == space.failed:
+            return None
+        return space.decode(final_state_id, start_state, self.last_place)
+
+
+def reduce_segments(segments: list) -> TransitionSegment:
+    """ Combine segments in a balanced tree, pairs on each level are
+    independent so each level could be composed in parallel."""
+    segments = list(segments)
+    while len(segments) > 1:
+        paired = [segments[index] + segments[index + 1]
+                  for index in range(0, len(segments) - 1, 2)]
+        if len(segments) % 2:
+            paired.append(segments[-1])
+        segments = paired
+    return reduce(TransitionSegment.__add__, segments)
+
+
+def build_script_segment(compiled: CompiledScript, space: StateSpace = None,
+                         chunk_size: int = 1024,
+                         map_func=map) -> TransitionSegment:
+    """Build transition segment of a whole compiled script.
+
+    Args:
+        compiled (CompiledScript): compiled script.
+        space (StateSpace, optional): state space of the table. Defaults to the 5x5 table.
+        chunk_size (int, optional): number of opcode per chunk. Defaults to 1024.
+        map_func (callable, optional): map used to build chunk segments, example
+        the map of a concurrent.futures executor. Defaults to map.
+    """
+    space = space or StateSpace()
+    ops = list(compiled.iter_ops())
+    chunks = [ops[index:index + chunk_size]
+              for index in range(0, len(ops), chunk_size)] or [[]]
+    return reduce_segments(map_func(space.build_segment, chunks))
+
+
+def fits_transition_table(board: Board = None) -> bool:
+    """ Check if the state space of the table is small enough for bytes
+    tables, so building and composing tables is cheap."""
+    board = board or DEFAULT_BOARD
+    return 2 * board.width * board.height * FACING_COUNT + 4 <= BYTES_TABLE_SIZE
+
+
+def simulate_from_table(compiled: CompiledScript, states: list,
+                        board: Board = None) -> list:
+    """Final state of a single script for many start states. The transition
+    segment of the script is built once, then the final state of each robot
+    is a single lookup.
+
+    Args:
+        compiled (CompiledScript): script compiled with is_place_found, command
+        before the first PLACE is ignored by not placed robot anyway.
+        states (list): start GameState of every robot.
+        board (Board, optional): table configuration. Defaults to the 5x5 table.
+
+    Returns:
+        list: final GameState of every robot, None when a command would fail.
+    """
+    segment = build_script_segment(compiled, StateSpace(board))
+    return [segment.final_state(state) for state in states]
@@ -1 +1,2 @@
 from . import input_command_wizard_model
+from . import line_state_wizard_model
@@ -1,15 +1,86 @@
-from odoo import models, fields
+import base64
+import io
+from odoo import models, fields, api
 from odoo.exceptions import ValidationError
-from ..utils.constants import COMMAND_MAP, OBJECT_TURNING_POS
-from ..utils.exceptions import TestingException
+from ..utils.common_utils import decode_place_command
+from ..utils.exceptions import TestingException, CommandLineError
+from ..utils.compiler import compile_script, validate_commands
+from ..utils.simulation import GameState, CommandSimulator, simulate_stream,\
+    build_report_vals
+from ..utils.script_source import DEFAULT_SCRIPT_DELIMITER,\
+    DEFAULT_STREAM_CHUNK_SIZE, split_scripts, read_batch_file,\
+    iter_script_lines, iter_line_chunks
+from ..utils.parallel import DEFAULT_POOL_CHUNK_SIZE, simulate_scripts
+from ..utils.checkpoint import iter_prefix_hashes, simulate_with_checkpoints
+from ..utils.board import Board
+from ..utils.trajectory import Trajectory, StepRecorder
 from ..models.models import aruna_game_test
 
+# Number of invalid line shown in the error message
+MAX_DISPLAYED_ERRORS = 100
+
 
 class InputCommandWizard(models.TransientModel):
     _name = 'input.command.wizard'
     _description = 'Input Command Wizard'
 
     input_cmd = fields.Text(string="Input Command")
+    board_id = fields.Many2one(
+        'aruna_game_test.board', string='Table',
+        default=lambda self: self.env['aruna_game_test.aruna_game_test']
+        ._default_board())
+    input_file = fields.Binary(
+        string='Input File', attachment=True,
+        help='Command file, executed line by line without loading the whole file.')
+    input_filename = fields.Char(string='Input Filename')
+    is_journal_enabled = fields.Boolean(
+        string='Keep Move Journal', default=False,
+        help='Store the state after every executed command of the script.')
+    is_trajectory_enabled = fields.Boolean(
+        string='Keep Compact Trajectory', default=False,
+        help='Store the position after every line as a compressed binary.')
+    is_background = fields.Boolean(
+        string='Run in Background', default=False,
+        help='Queue the script, it is executed chunk by chunk by a scheduled action.')
+    dry_run_result = fields.Text(string='Dry Run Result', readonly=True)
+    is_batch = fields.Boolean(string='Batch Mode', default=False)
+    script_delimiter = fields.Char(
+        string='Script Delimiter', default=DEFAULT_SCRIPT_DELIMITER,
+        help='A line containing only this text separate two scripts.')
+    batch_file = fields.Binary(
+        string='Batch File',
+        help='ZIP file with a script per file, or CSV file with a script per row.')
+    batch_filename = fields.Char(string='Batch Filename')
+    batch_summary = fields.Text(string='Batch Summary', readonly=True)
+    batch_game_ids = fields.Many2many(
+        'aruna_game_test.aruna_game_test', string='Batch Result')
+    use_process_pool = fields.Boolean(
+        string='Use Process Pool', default=False,
+        help='Simulate the batch on several worker processes. Only used by '
+        'prefork workers (--workers), the threaded server simulates the batch '
+        'in its own process.')
+    pool_size = fields.Integer(
+        string='Pool Size', default=lambda self: self._default_pool_size(),
+        help='Number of worker process, 0 to use every CPU.')
+    pool_chunk_size = fields.Integer(
+        string='Pool Chunk Size',
+        default=lambda self: self._default_pool_chunk_size(),
+        help='Number of script sent to a worker process at once.')
+
+    @api.model
+    def _default_pool_size(self) -> int:
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.pool_size', 0))
+
+    @api.model
+    def _default_pool_chunk_size(self) -> int:
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.pool_chunk_size', DEFAULT_POOL_CHUNK_SIZE))
+
+    def _get_board(self) -> Board:
+        """ Get cached table configuration, loaded once for the whole script."""
+        self.ensure_one()
+        return self.env['aruna_game_test.board']._get_board(self.board_id.id)
 
     def _decode_place_command(self, place_command: str) -> dict:
         """Decode place command to get position and facing data.
@@ -17,41 +88,71 @@ class InputCommandWizard(models.TransientModel):
         Args:
             place_command (str): place command text input
         """
-        # Remove all whitespace
-        place_command = place_command.replace(" ", "")
-        place_command = place_command.replace("PLACE", "")
+        return decode_place_command(place_command)
 
-        # Split command
-        place_cmd_list = place_command.strip().split(',')
+    def _format_command_error(self, error_data: dict) -> str:
+        """Build error message for failed command line.
 
-        # Check command list
-        if len(place_cmd_list) != 3:
-            raise ValidationError(
-                'Valid Place Command is "PLACE POS_X,POS_Y,FACING"')
+        Args:
+            error_data (dict): line, command, reason and position data of the error.
+        """
+        if error_data.get('errors'):
+            return self._format_syntax_errors(error_data['errors'])
+        error_msg_1 = 'Error on Command at Line {} ({}) \n'.format(
+            error_data['line'], error_data['command'])
+        if error_data.get('robot'):
+            error_msg_1 = 'Robot {} - {}'.format(error_data['robot'], error_msg_1)
+        error_msg_reason = 'Reason: {}\n'.format(error_data['reason'])
+        error_msg_pos_head_before_error = '\n\nPosition before Error: {},{},{}\n'.format(
+            *error_data['position_before_error'])
+        error_msg_pos_head_at_error = 'Position at Error: {},{},{}'.format(
+            *error_data['position_at_error'])
+        return error_msg_1 + error_msg_reason + \
+            error_msg_pos_head_before_error + error_msg_pos_head_at_error
 
-        # Validate Position and Facing Data
-        # Validate position
-        place_data = dict()
-        try:
-            x_pos = int(place_cmd_list[0])
-            place_data['x_pos'] = x_pos
-        except ValueError:
-            raise ValidationError('X_POS should be a integer number')
+    def _format_syntax_errors(self, errors: list) -> str:
+        """Build error message listing every invalid command line.
 
-        try:
-            y_pos = int(place_cmd_list[1])
-            place_data['y_pos'] = y_pos
-        except ValueError:
-            raise ValidationError('Y_POS should be a integer number')
+        Args:
+            errors (list): line, command and reason of each invalid line.
+        """
+        error_msg = 'Found {} invalid command(s):\n'.format(len(errors))
+        error_msg += '\n'.join(
+            'Line {} ({}): {}'.format(error['line'], error['command'],
+                                      error['reason'])
+            for error in errors[:MAX_DISPLAYED_ERRORS])
+        if len(errors) > MAX_DISPLAYED_ERRORS:
+            error_msg += '\n... and {} more.'.format(
+                len(errors) - MAX_DISPLAYED_ERRORS)
+        return error_msg
 
-        # Validate facing data
-        facing = place_cmd_list[2].lower()
-        if not isinstance(facing, str) or facing not in OBJECT_TURNING_POS:
-            raise ValidationError(
-                'Invalid Facing Direction "{}"'.format(facing))
-        place_data['facing'] = facing
+    def _check_syntax(self, command_list):
+        """Check every command line before the simulation, so every invalid
+        line is reported at once.
 
-        return place_data
+        Raises:
+            TestingException: in case for testing purpose.
+            ValidationError: error message listing every invalid line.
+        """
+        errors = validate_commands(command_list)
+        if errors:
+            # First error keep the usual line, command and reason keys
+            self._raise_command_error(dict(errors[0], errors=errors))
+
+    def _raise_command_error(self, error_data: dict):
+        """Raise error for failed command line.
+
+        Args:
+            error_data (dict): line, command, reason and position data of the error.
+
+        Raises:
+            TestingException: in case for testing purpose.
+            ValidationError: error message for the user.
+        """
+        # In case for testing purpose
+        if self.env.context.get('is_testing'):
+            raise TestingException(error_data)
+        raise ValidationError(self._format_command_error(error_data))
 
     def execute_input(self):
         """Execute command from given text input.
@@ -62,98 +163,260 @@ class InputCommandWizard(models.TransientModel):
         RIGHT
         REPORT
 
+        The script is compiled into opcode first, then simulated in memory, and
+        the final state is written to a new game record at once, with the
+        output of every REPORT command.
+        Long script keep a checkpoint every interval lines, see
+        _execute_with_checkpoints.
+
         Raises:
             ValidationError: _description_
         """
         self.ensure_one()
+        if self.is_background:
+            return self._queue_job()
+        if self.input_file:
+            with self._open_input_file() as file_obj:
+                return self.execute_stream(file_obj)
+
+        board = self._get_board()
+        cache_model = self.env['aruna_game_test.result_cache']
+        command_list = (self.input_cmd or '').strip().splitlines()
+        steps = self._get_step_recorder()
+        # Same script already simulated, skip the simulation. Cached result
+        # hold the final state and the report log, steps need the script to be
+        # simulated.
+        result_vals = None
+        if steps is None:
+            result_vals = cache_model.lookup([self.input_cmd], board)[0]
+        is_cached = result_vals is not None
 
-        # Initialize game model
+        checkpoint_model = self.env['aruna_game_test.checkpoint']
+        interval = checkpoint_model._get_checkpoint_interval()
+        checkpoints = []
+        reports = []
+        if not is_cached:
+            self._check_syntax(command_list)
+        if not is_cached and len(command_list) >= interval:
+            # Long script, resume from the latest checkpoint of the same prefix
+            state_vals, checkpoints = self._execute_with_checkpoints(
+                command_list, interval, board, reports, steps)
+        elif not is_cached:
+            simulator = CommandSimulator(board=board, reports=reports,
+                                         on_step=steps)
+            try:
+                if steps is None:
+                    # Compile input into opcode (cached), then simulate all command
+                    simulator.execute(compile_script(self.input_cmd))
+                else:
+                    simulator.run(command_list)
+            except CommandLineError as err:
+                self._raise_command_error(err.error_data)
+            state_vals = simulator.state.to_vals()
+        if not is_cached:
+            result_vals = dict(state_vals, **self._prepare_report_vals(reports))
+            cache_model.store([(self.input_cmd, result_vals)], board)
+
+        # Write final state to the game model
         game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
-        game_data = game_model.create({})
+        game_data = game_model.create(dict(
+            result_vals, input_cmd=self.input_cmd, board_id=self.board_id.id,
+            **self._prepare_trajectory_vals(steps)))
+        if checkpoints:
+            checkpoint_model.sudo().create([
+                checkpoint_model._prepare_checkpoint_vals(game_data.id, checkpoint)
+                for checkpoint in checkpoints])
+        if self.is_journal_enabled:
+            self.env['aruna_game_test.journal'].sudo()._record_steps(
+                game_data.id, steps)
+        return self._get_game_action(game_data)
 
-        # Trim input, and split per line by line
-        string_command = self.input_cmd.strip()
-        command_list = string_command.splitlines()
+    def action_dry_run(self):
+        """Simulate the text input without writing any game, journal, result
+        cache or checkpoint record. The form button still saves the transient
+        wizard, like every wizard button, then the result is shown on a new
+        wizard filled by the context defaults.
+        """
+        self.ensure_one()
+        result = self.env['aruna_game_test.aruna_game_test'].dry_run(
+            self.input_cmd, self.board_id.id)
+        state = GameState(**result['state'])
+        lines = ['Final Position: {},{},{}'.format(*state.position())]
+        lines += ['Line {}: {}'.format(line, report)
+                  for line, report in result['reports']]
+        if result['error']:
+            lines.append('\n' + self._format_command_error(result['error']))
+        return {
+            'name': ('Dry Run'),
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'view_mode': 'form',
+            'target': 'new',
+            'context': dict(
+                self.env.context,
+                default_input_cmd=self.input_cmd,
+                default_board_id=self.board_id.id,
+                default_dry_run_result='\n'.join(lines))
+        }
 
-        # Counter for first valid place command, all command before
-        # place should be discarded
-        is_place_found = False
+    def _execute_with_checkpoints(self, command_list: list, interval: int,
+                                  board: Board, reports: list = None,
+                                  steps: StepRecorder = None) -> tuple:
+        """Execute script from the latest checkpoint of any earlier script
+        starting with the same lines, so editing the end of a long script only
+        replay the lines after the edit.
+        When reports is given, REPORT output is appended to it, the output of
+        the reused lines is replayed from their checkpoints. The whole script is
+        replayed when steps are recorded.
 
-        # initial position data for error purpose
-        initial_x_pos = game_data.x_pos
-        initial_y_pos = game_data.y_pos
-        initial_facing = game_data.facing
+        Returns:
+            tuple: (final state values, every Checkpoint of the script)
+        """
+        checkpoint_model = self.env['aruna_game_test.checkpoint']
+        prefix_hashes = dict(iter_prefix_hashes(
+            command_list, interval, checkpoint_model._get_prefix_seed(board)))
+        resume_checkpoint = None
+        reused_checkpoints = dict()
+        if steps is None:
+            resume_checkpoint = checkpoint_model._find_resume_checkpoint(
+                prefix_hashes)
+        if resume_checkpoint:
+            # Copy the reused checkpoints, game record keep its own checkpoints
+            reused_records = checkpoint_model.sudo().search([
+                ('prefix_hash', 'in', [
+                    prefix_hash for line, prefix_hash in prefix_hashes.items()
+                    if line <= resume_checkpoint.line])
+            ], order='line')
+            for record in reused_records:
+                if prefix_hashes.get(record.line) == record.prefix_hash:
+                    reused_checkpoints.setdefault(
+                        record.line, record._to_checkpoint())
+            # REPORT output of every skipped line is needed, otherwise replay
+            if len(reused_checkpoints) != resume_checkpoint.line // interval:
+                resume_checkpoint = None
+                reused_checkpoints = dict()
+        if reports is not None:
+            for checkpoint in reused_checkpoints.values():
+                reports.extend(checkpoint.reports)
+        try:
+            state, checkpoints = simulate_with_checkpoints(
+                command_list, prefix_hashes, interval, resume_checkpoint, board,
+                reports, steps)
+        except CommandLineError as err:
+            self._raise_command_error(err.error_data)
+        checkpoints = list(reused_checkpoints.values()) + checkpoints
+        return state.to_vals(), checkpoints
 
-        # Loop through command
-        for index, cmd in enumerate(command_list):
-            try:
-                # Trim command for whitespace
-                cmd = cmd.strip()
-                # Check if current command is the place command
-                if 'PLACE ' in cmd.upper():
-                    place_data = self._decode_place_command(cmd.upper())
-                    game_data.place_robot(
-                        is_from_command_input=True,
-                        command_place_data=place_data)
-                    is_place_found = True
-
-                # Only execute if place command is found
-                elif is_place_found:
-                    # Get command data
-                    command_data = COMMAND_MAP.get(cmd.upper())
-                    if not command_data:
-                        raise ValidationError(
-                            'Invalid command "{}"'.format(cmd))
-
-                    # Get function name and context data
-                    func_name = command_data.get('func')
-                    context_data = command_data.get('context') or dict()
-
-                    # Save initial position data for error purpose
-                    initial_x_pos = game_data.x_pos
-                    initial_y_pos = game_data.y_pos
-                    initial_facing = game_data.facing
-
-                    # Execute command
-                    func = getattr(
-                        game_data.with_context(context_data), func_name)
-                    func()
-                elif not is_place_found and not COMMAND_MAP.get(cmd.upper()):
-                    # Build error message
-                    msg_1 = 'Invalid command "{}"'.format(cmd)
-                    msg_2 = ''
-
-                    # In case the error is place command
-                    if 'place' in cmd.lower():
-                        msg_1 += '\n'
-                        msg_2 = 'Place command should be "PLACE X_POS,Y_POS,FACING", \
-                            separate "PLACE" and position data with space.'
-                    msg = msg_1 + msg_2
-                    raise ValidationError(msg)
-
-            except Exception as e:
-                # Build error message
-                line = index + 1
-                error_msg_1 = 'Error on Command at Line {} ({}) \n'.format(
-                    line, cmd)
-                error_msg_reason = 'Reason: {}\n'.format(e.name)
-                error_msg_pos_head_before_error = '\n\nPosition before Error: {},{},{}\n'.format(
-                    initial_x_pos, initial_y_pos, initial_facing.upper())
-                error_msg_pos_head_at_error = 'Position at Error: {},{},{}'.format(
-                    game_data.x_pos, game_data.y_pos, game_data.facing.upper())
-                error_msg = error_msg_1 + error_msg_reason + \
-                    error_msg_pos_head_before_error + error_msg_pos_head_at_error
-
-                # In case for testing purpose
-                if self.env.context.get('is_testing'):
-                    error_data = {
-                        'line': line, 'command': cmd, 'reason': e.name, 'position_before_error': [
-                            initial_x_pos, initial_y_pos, initial_facing.upper()], 'position_at_error': [
-                            game_data.x_pos, game_data.y_pos, game_data.facing.upper()]}
-                    raise TestingException(error_data)
-
-                raise ValidationError(error_msg)
+    def execute_stream(self, file_obj):
+        """Execute command read from a file-like object.
+        Lines are compiled and executed chunk by chunk while the file is read,
+        so only the robot state and the current chunk are kept in memory, with
+        the compact steps when the journal or the trajectory is requested.
+
+        Args:
+            file_obj (file-like): binary or text file object.
+
+        Raises:
+            ValidationError: when any command failed.
+        """
+        chunk_size = int(self.env['ir.config_parameter'].sudo().get_param(
+            'aruna_game_test.stream_chunk_size', DEFAULT_STREAM_CHUNK_SIZE))
+        board = self._get_board()
+        self._check_syntax(iter_script_lines(file_obj))
+        file_obj.seek(0)
+        reports = []
+        steps = self._get_step_recorder()
+        try:
+            state = simulate_stream(iter_line_chunks(
+                iter_script_lines(file_obj), chunk_size), board=board,
+                reports=reports, on_step=steps)
+        except CommandLineError as err:
+            self._raise_command_error(err.error_data)
+
+        game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+        game_data = game_model.create(
+            dict(state.to_vals(), board_id=self.board_id.id,
+                 **self._prepare_report_vals(reports),
+                 **self._prepare_trajectory_vals(steps)))
+        if self.is_journal_enabled:
+            self.env['aruna_game_test.journal'].sudo()._record_steps(
+                game_data.id, steps)
+        return self._get_game_action(game_data)
+
+    @api.model
+    def _prepare_report_vals(self, reports: list) -> dict:
+        """ Report log of the game, every REPORT output is stored at once."""
+        return build_report_vals(reports)
+
+    def _get_step_recorder(self):
+        """ Step recorder of the simulation, when the journal or the trajectory
+        is requested, otherwise None."""
+        if self.is_journal_enabled or self.is_trajectory_enabled:
+            return StepRecorder()
+        return None
 
+    def _prepare_trajectory_vals(self, steps: StepRecorder) -> dict:
+        """ Pack the script trajectory when it is requested."""
+        if not self.is_trajectory_enabled:
+            return {}
+        trajectory = Trajectory.from_steps(steps, board=self._get_board())
+        return {
+            'trajectory_data': base64.b64encode(trajectory.to_bytes())
+        }
+
+    def action_open_line_state(self):
+        """ Open the wizard showing the robot state at a given line of the
+        script, example to debug a failed run."""
+        self.ensure_one()
+        return self.env['line.state.wizard']._get_wizard_action({
+            'default_input_cmd': self.input_cmd,
+            'default_board_id': self.board_id.id
+        })
+
+    def _queue_job(self):
+        """ Queue the script as a background job, and open the job progress."""
+        self.ensure_one()
+        job_data = self.env['aruna_game_test.job'].create({
+            'name': self.input_filename or 'Script Job',
+            'input_cmd': False if self.input_file else self.input_cmd,
+            'input_file': self.input_file,
+            'input_filename': self.input_filename,
+            'board_id': self.board_id.id
+        })
+        cron = self.env.ref('aruna_game_test.ir_cron_process_jobs',
+                            raise_if_not_found=False)
+        # Run the cron as soon as possible, cron trigger only exist since
+        # Odoo 14, otherwise the job wait for the next cron interval
+        if cron and hasattr(cron, '_trigger'):
+            cron.sudo()._trigger()
+        return {
+            'name': ('Background Job'),
+            'type': 'ir.actions.act_window',
+            'res_model': 'aruna_game_test.job',
+            'view_mode': 'form',
+            'res_id': job_data.id
+        }
+
+    def _open_input_file(self):
+        """ Open the uploaded input file attachment as binary file object."""
+        self.ensure_one()
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'input_file'),
+            ('res_id', '=', self.id)
+        ], limit=1)
+        return self._open_attachment(attachment)
+
+    @api.model
+    def _open_attachment(self, attachment):
+        """Open attachment content as binary file object. Attachment in the file
+        store is read from the disk, not loaded at once.
+        """
+        if attachment.store_fname:
+            return open(attachment._full_path(attachment.store_fname), 'rb')
+        return io.BytesIO(base64.b64decode(attachment.datas or b''))
+
+    def _get_game_action(self, game_data):
         return {
             'name': ('Aruna Odoo Test'),
             'type': 'ir.actions.act_window',
@@ -161,3 +424,119 @@ class InputCommandWizard(models.TransientModel):
             'view_mode': 'form',
             'res_id': game_data.id
         }
+
+    ########################################################################
+    # Batch Execution
+    ########################################################################
+
+    def _get_batch_scripts(self) -> list:
+        """Get every script of the batch, from the uploaded file or from the text
+        input split by the delimiter.
+
+        Returns:
+            list: (script name, script text)
+        """
+        self.ensure_one()
+        if self.batch_file:
+            return read_batch_file(
+                base64.b64decode(self.batch_file), self.batch_filename)
+        return split_scripts(
+            self.input_cmd, self.script_delimiter or DEFAULT_SCRIPT_DELIMITER)
+
+    def _simulate_batch_scripts(self, scripts: list) -> list:
+        """Simulate every script in memory, on a process pool if requested.
+        Script with cached result is not simulated again, the cached result
+        hold the report log as well.
+
+        Args:
+            scripts (list): (script name, script text)
+
+        Returns:
+            list: (script name, script text, final state and report log values
+            or None, error data or None)
+        """
+        board = self._get_board()
+        cache_model = self.env['aruna_game_test.result_cache']
+        cached_results = cache_model.lookup(
+            [script for name, script in scripts], board)
+        missing_scripts = [script for (name, script), result_vals
+                           in zip(scripts, cached_results) if result_vals is None]
+
+        pool_size = 1
+        if self.use_process_pool:
+            pool_size = max(self.pool_size, 0)
+        simulation_results = iter(simulate_scripts(
+            missing_scripts, pool_size,
+            self.pool_chunk_size or DEFAULT_POOL_CHUNK_SIZE, board))
+
+        results = []
+        new_results = []
+        for (name, script), result_vals in zip(scripts, cached_results):
+            error_data = None
+            if result_vals is None:
+                state_vals, error_data, reports = next(simulation_results)
+                if state_vals:
+                    result_vals = dict(
+                        state_vals, **self._prepare_report_vals(reports))
+                    new_results.append((script, result_vals))
+            results.append((name, script, result_vals, error_data))
+        cache_model.store(new_results, board)
+        return results
+
+    def _build_batch_summary(self, results: list) -> str:
+        failed_results = [result for result in results if result[3]]
+        summary = 'Executed {} script(s), {} succeeded, {} failed.'.format(
+            len(results), len(results) - len(failed_results),
+            len(failed_results))
+        for name, script, result_vals, error_data in failed_results:
+            summary += '\n\n{}:\n{}'.format(
+                name, self._format_command_error(error_data))
+        return summary
+
+    def execute_batch_input(self):
+        """Execute many scripts at once.
+        Every script is simulated first, optionally on a process pool, failed
+        script does not stop the batch.
+        Results are written with a single create, then the list of new game
+        records is returned, or the wizard with the error summary when some
+        scripts failed.
+        """
+        self.ensure_one()
+        scripts = self._get_batch_scripts()
+        if not scripts:
+            raise ValidationError('There is no script to execute.')
+
+        results = self._simulate_batch_scripts(scripts)
+
+        # Write every final state at once
+        game_model: aruna_game_test = self.env['aruna_game_test.aruna_game_test']
+        game_data = game_model.create([
+            dict(result_vals, input_cmd=script, board_id=self.board_id.id)
+            for name, script, result_vals, error_data in results
+            if result_vals])
+
+        self.write({
+            'batch_summary': self._build_batch_summary(results),
+            'batch_game_ids': [(6, 0, game_data.ids)]
+        })
+        if len(game_data) < len(results):
+            return {
+                'name': ('Batch Summary'),
+                'type': 'ir.actions.act_window',
+                'res_model': self._name,
+                'view_mode': 'form',
+                'res_id': self.id,
+                'target': 'new'
+            }
+        return self.action_show_batch_result()
+
+    def action_show_batch_result(self):
+        """ Open game records created by the last batch execution."""
+        self.ensure_one()
+        return {
+            'name': ('Batch Result'),
+            'type': 'ir.actions.act_window',
+            'res_model': 'aruna_game_test.aruna_game_test',
+            'view_mode': 'tree,form',
+            'domain': [('id', 'in', self.batch_game_ids.ids)]
+        }
@@ -0,0 +1,60 @@
+from odoo import models, fields, api
+from ..models.checkpoint import FACING_SELECTION
+
+
+class LineStateWizard(models.TransientModel):
+    _name = 'line.state.wizard'
+    _description = 'Robot State at Line Wizard'
+
+    game_id = fields.Many2one(
+        'aruna_game_test.aruna_game_test', string='Game')
+    input_cmd = fields.Text(
+        string="Input Command",
+        help='Script to replay when there is no game, example a failed run.')
+    board_id = fields.Many2one('aruna_game_test.board', string='Table')
+    line = fields.Integer(string='Line', default=1)
+    is_computed = fields.Boolean(string='Is state computed?', readonly=True)
+    x_pos = fields.Integer(string='X Coordinate', readonly=True)
+    y_pos = fields.Integer(string='Y Coordinate', readonly=True)
+    facing = fields.Selection(
+        selection=FACING_SELECTION, string="Object Facing / Direction",
+        readonly=True)
+    is_placed = fields.Boolean(string='Is robot placed?', readonly=True)
+    is_properly_placed = fields.Boolean(
+        string='Is properly placed (On Table)?', readonly=True)
+    is_reported = fields.Boolean(string='Is report requested', readonly=True)
+    error_message = fields.Text(string='Error before Line', readonly=True)
+
+    @api.model
+    def _get_wizard_action(self, context: dict) -> dict:
+        return {
+            'name': ('Position at Line'),
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'view_mode': 'form',
+            'target': 'new',
+            'context': context
+        }
+
+    def action_compute_state(self):
+        """Replay the script up to the line, from the latest checkpoint before
+        it, and show the robot state.
+        """
+        self.ensure_one()
+        if self.game_id:
+            result = self.game_id.get_state_at_line(self.line)
+        else:
+            board = self.env['aruna_game_test.board']._get_board(
+                self.board_id.id)
+            result = self.env['aruna_game_test.checkpoint']._get_state_at_line(
+                (self.input_cmd or '').strip().splitlines(), self.line, board)
+
+        error_message = False
+        if result['error']:
+            error_message = self.env['input.command.wizard']\
+                ._format_command_error(result['error'])
+        self.write(dict(result['state'], is_computed=True,
+                        error_message=error_message))
+        action = self._get_wizard_action(self.env.context)
+        action['res_id'] = self.id
+        return action